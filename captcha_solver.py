@@ -26,6 +26,8 @@ class CaptchaSolver:
         self.api_key = api_key
         self.service = service.lower()
         self.supported_services = ['2captcha', 'anticaptcha', 'ocr', 'manual']
+        # Reused across submit/poll requests so the 5s polling loop keeps one connection open
+        self.session = requests.Session()
         
         if self.api_key and self.service not in self.supported_services:
             logger.warning(f"Unsupported captcha service: {self.service}. Falling back to OCR or manual mode.")
@@ -95,7 +97,7 @@ class CaptchaSolver:
             'body': image_data,
             'json': 1
         }
-        response = requests.post(url, data=data)
+        response = self.session.post(url, data=data)
         result = response.json()
         
         if result['status'] != 1:
@@ -114,7 +116,7 @@ class CaptchaSolver:
         
         for _ in range(30):
             time.sleep(5)
-            response = requests.get(url, params=params)
+            response = self.session.get(url, params=params)
             result = response.json()
             
             if result['status'] == 1:
@@ -149,7 +151,7 @@ class CaptchaSolver:
             }
         }
         
-        response = requests.post(url, json=data)
+        response = self.session.post(url, json=data)
         result = response.json()
         
         if result.get('errorId', 0) != 0:
@@ -166,7 +168,7 @@ class CaptchaSolver:
         
         for _ in range(30):
             time.sleep(5)
-            response = requests.post(url, json=data)
+            response = self.session.post(url, json=data)
             result = response.json()
             
             if result.get('errorId', 0) != 0:
@@ -259,7 +261,7 @@ class CaptchaSolver:
             processed_path = os.path.join(debug_dir, f'processed_{timestamp}.png')
             image.save(processed_path)
             
-            custom_config = r'--oem 3 --psm 8 -c tessedit_char_whitelist=0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ'
+            custom_config = r'--oem 3 --psm 7 -c tessedit_char_whitelist=0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ'
             text = pytesseract.image_to_string(image, config=custom_config)
             
             text = text.strip()
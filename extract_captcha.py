@@ -13,9 +13,12 @@ logging.basicConfig(
 )
 logger = logging.getLogger('extract_captcha')
 
+# Timestamp at the end of screenshot names like 'after_district_1753090987.png'
+_SCREENSHOT_TIMESTAMP_RE = re.compile(r'_(\d+)\.png$')
+
 def extract_timestamp_from_filename(filename):
     """Extract timestamp from filename like 'after_district_1753090987.png'."""
-    match = re.search(r'_(\d+)\.png$', filename)
+    match = _SCREENSHOT_TIMESTAMP_RE.search(filename)
     if match:
         return match.group(1)
     return None
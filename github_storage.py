@@ -15,13 +15,16 @@ class GitHubStorage:
             "Authorization": f"token {token}",
             "Accept": "application/vnd.github.v3+json"
         }
+        # One pooled session so repeated progress syncs reuse the TLS connection
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
         logger.info(f"Initialized GitHub storage for repository: {repository}")
     
     def get_file(self, path):
         """Get file content from GitHub repository."""
         logger.info(f"Getting file from GitHub: {path}")
         try:
-            response = requests.get(f"{self.api_url}/{path}", headers=self.headers)
+            response = self.session.get(f"{self.api_url}/{path}")
             if response.status_code == 200:
                 content = response.json()
                 file_content = base64.b64decode(content['content']).decode('utf-8')
@@ -38,18 +41,20 @@ class GitHubStorage:
             return None, None
     
     def update_file(self, path, content, sha=None):
-        """Update or create a file in GitHub repository."""
+        """Update or create a file in GitHub repository. content is JSON-serializable, or already serialized bytes."""
         logger.info(f"Updating file in GitHub: {path}")
         try:
+            if not isinstance(content, bytes):
+                content = json.dumps(content, indent=4).encode('utf-8')
             data = {
                 "message": "Update progress file",
-                "content": base64.b64encode(json.dumps(content, indent=4).encode('utf-8')).decode('utf-8')
+                "content": base64.b64encode(content).decode('ascii')
             }
             
             if sha:
                 data["sha"] = sha
             
-            response = requests.put(f"{self.api_url}/{path}", headers=self.headers, json=data)
+            response = self.session.put(f"{self.api_url}/{path}", json=data)
             
             if response.status_code in (200, 201):
                 logger.info(f"Successfully updated file in GitHub: {path}")
@@ -2,42 +2,305 @@ import os
 import time
 import random
 import json
+import atexit
 import logging
+import logging.handlers
 import base64
+import hashlib
+import re
+import shutil
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import uuid
-import socket
-import boto3
-from datetime import datetime, timedelta
-from bs4 import BeautifulSoup, NavigableString, Tag
+import itertools
+import sqlite3
+import queue
+import threading
+from collections import Counter, OrderedDict
+from datetime import datetime
 import concurrent.futures
-from github_storage import GitHubStorage
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
+from rate_limiter import RateLimiter, AdaptiveRateLimiter
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.select import Select
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from solvecaptcha import Solvecaptcha
+from selenium.webdriver.common.action_chains import ActionChains
+from selenium.webdriver.common.keys import Keys
+from selenium.common.exceptions import TimeoutException, UnexpectedAlertPresentException, WebDriverException
 import warnings
 
+try:
+    from PIL import Image
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
 try:
     import pytesseract
-    from PIL import Image, ImageEnhance, ImageFilter, ImageOps
+    from PIL import ImageEnhance, ImageFilter
     from io import BytesIO
     PYTESSERACT_AVAILABLE = True
 except ImportError:
     PYTESSERACT_AVAILABLE = False
     logging.warning("pytesseract not installed. OCR-based captcha solving will not be available.")
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import cv2
+    import numpy as np
+    CV2_AVAILABLE = True
+except ImportError:
+    CV2_AVAILABLE = False
+
+try:
+    import tesserocr
+    TESSEROCR_AVAILABLE = True
+except ImportError:
+    TESSEROCR_AVAILABLE = False
+
 warnings.filterwarnings("ignore", category=DeprecationWarning)
 
+# Poll explicit waits more often than Selenium's 0.5s default so conditions are picked up quickly
+WAIT_POLL_FREQUENCY = 0.1
+
+# Limit for asynchronous scripts, which must be longer than any _wait_for_selector timeout
+SCRIPT_TIMEOUT = 30
+
+# Matches placeholders and labels of the document number input. Kept compatible with JavaScript regular expressions
+_DOC_LABEL_RE = re.compile(r'doc|property|survey', re.IGNORECASE)
+
+# Page elements located by attribute, as CSS since it matches faster than the equivalent XPath
+CAPTCHA_IMAGE_CSS = "img[src*='captcha'], img[id*='captcha'], img[class*='captcha-image']"
+CAPTCHA_INPUT_CSS = "input[id*='captcha' i], input[name*='captcha' i], input[placeholder*='captcha' i]"
+CAPTCHA_REFRESH_CSS = "img[class*='refresh' i], img[id*='refresh' i], a[onclick*='refresh' i], [id*='captcha' i][id*='refresh' i]"
+RESULTS_TABLE_CSS = "table[class*='dataTable'], table[id*='dataTable']"
+RECORD_DETAILS_CSS = "div[class*='record-details'], div[id*='record']"
+ENTRIES_SELECT_CSS = "select[class*='entries'], select[aria-label*='entries']"
+
+# XPath patterns _select_dropdown_option tries to find an option by its text with
+OPTION_XPATH_TEMPLATES = [
+    "//option[text()='{option_text}']",
+    "//select[@id='{dropdown_id}']/option[text()='{option_text}']",
+    "//select[@id='{dropdown_id}']/option[contains(text(), '{option_text}')]",
+    "//select[@id='{dropdown_id}']/option[normalize-space(text())='{option_text}']",
+]
+
+# XPaths tried in order to find each dropdown while discovering tasks: by id, by id/name, then by label
+DISCOVERY_DROPDOWN_XPATHS = {
+    dropdown_id: (
+        f"//select[@id='{dropdown_id}']",
+        f"//select[contains(@id, '{dropdown_id}') or contains(@name, '{dropdown_id}')]",
+        f"//label[contains(text(), '{dropdown_id.capitalize()}')]/following-sibling::select",
+        f"//label[contains(text(), '{dropdown_id.capitalize()}')]/..//select",
+    )
+    for dropdown_id in ('year', 'district', 'taluka', 'village')
+}
+
+# Returns the text of every option of the select in arguments[0], in one call instead of one per option
+_OPTION_TEXTS_JS = "return Array.from(arguments[0].options, function(o) { return o.text; });"
+
+# Approaches _select_dropdown_option tries, in order
+DROPDOWN_STRATEGIES = ['js', 'select', 'click']
+
+# Most parent selections whose dropdown options are kept, so the cache stays flat on multi-day runs
+DROPDOWN_OPTIONS_CACHE_SIZE = 2048
+
+# Search button locators in order of preference. Buttons can only be matched by their text with XPath
+SEARCH_BUTTON_LOCATORS = [
+    (By.XPATH, "//button[contains(text(), 'Search')] | //input[@type='submit' and @value='Search']"),
+    (By.CSS_SELECTOR, ".btn-primary, .search-btn, button.btn-blue"),
+]
+
+# Document number input by id/name, and by its label when the id/name do not mention it
+DOC_INPUT_CSS = "#doc_number, input[id*='doc'], input[name*='doc']"
+DOC_INPUT_LABEL_XPATH = (
+    "//label[contains(text(), 'Doc') or contains(text(), 'Property') or contains(text(), 'Survey')]/following-sibling::input"
+    " | //label[contains(text(), 'Doc') or contains(text(), 'Property') or contains(text(), 'Survey')]/..//input"
+)
+
+# Text of the pages the site serves when it throttles requests
+_RATE_LIMIT_RE = re.compile(r'too many requests|rate limit|\b429\b|try again later', re.IGNORECASE)
+
+# Messages of a rejected captcha. Kept compatible with JavaScript regular expressions
+_WRONG_CAPTCHA_RE = re.compile(r'(invalid|wrong|incorrect)\s+(captcha|code)|captcha\s+(is\s+)?(invalid|wrong|incorrect)', re.IGNORECASE)
+
+# Resources the scraper never reads. Images and stylesheets are left alone since the captcha
+# is read from a screenshot of the rendered page.
+DEFAULT_BLOCKED_URLS = [
+    '*.woff', '*.woff2', '*.ttf', '*.otf',
+    '*google-analytics.com*', '*googletagmanager.com*', '*doubleclick.net*',
+]
+
+# Selects a dropdown option by its text and fires the change event in one round-trip.
+# Returns null if the option is missing, false if it was already selected and true otherwise.
+# The options of the dependent dropdown (if given) are reset first so its repopulation can be awaited.
+_SELECT_OPTION_JS = """
+var select = document.getElementById(arguments[0]);
+if (!select) return null;
+for (var i = 0; i < select.options.length; i++) {
+    if (select.options[i].text.trim() === arguments[1]) {
+        if (select.selectedIndex === i) return false;
+        var dependent = arguments[2] ? document.getElementById(arguments[2]) : null;
+        if (dependent) dependent.options.length = 1;
+        select.selectedIndex = i;
+        select.dispatchEvent(new Event('change', {bubbles: true}));
+        return true;
+    }
+}
+return null;
+"""
+
+# Whether a search shows the record details (selector in arguments[0]) or an error matching the
+# case-insensitive pattern in arguments[1]. Returns 'results', 'rejected' or null while neither is shown
+_SEARCH_OUTCOME_JS = """
+if (document.querySelector(arguments[0])) return 'results';
+var text = document.body ? document.body.innerText.slice(0, 5000) : '';
+return new RegExp(arguments[1], 'i').test(text) ? 'rejected' : null;
+"""
+
+# Returns the first input whose placeholder or label matches the case-insensitive pattern in arguments[0], or null
+_DOC_INPUT_BY_LABEL_JS = """
+var pattern = new RegExp(arguments[0], 'i');
+var inputs = document.querySelectorAll('input');
+for (var i = 0; i < inputs.length; i++) {
+    var labelId = inputs[i].getAttribute('aria-labelledby') || inputs[i].id;
+    var label = labelId ? document.querySelector('label[for="' + CSS.escape(labelId) + '"]') : null;
+    if (pattern.test(inputs[i].placeholder || '') || (label && pattern.test(label.textContent))) return inputs[i];
+}
+return null;
+"""
+
+# Clicks the first element matching the selector in arguments[0]. Returns whether there was one
+_CLICK_FIRST_JS = """
+var element = document.querySelector(arguments[0]);
+if (!element) return false;
+element.click();
+return true;
+"""
+
+# Calls back with the first element matching the selector in arguments[0] as soon as it is added
+# to the page, or with null after arguments[1] seconds
+_WAIT_FOR_SELECTOR_JS = """
+var selector = arguments[0], done = arguments[arguments.length - 1];
+var element = document.querySelector(selector);
+if (element) return done(element);
+var observer = new MutationObserver(function () {
+    var element = document.querySelector(selector);
+    if (element) {
+        observer.disconnect();
+        clearTimeout(timer);
+        done(element);
+    }
+});
+var timer = setTimeout(function () {
+    observer.disconnect();
+    done(null);
+}, arguments[1] * 1000);
+observer.observe(document, {childList: true, subtree: true});
+"""
+
+# Returns the first image matching the selector in arguments[0] once it has loaded, otherwise null
+_LOADED_IMAGE_JS = """
+var img = document.querySelector(arguments[0]);
+return img && img.complete && img.naturalWidth > 0 ? img : null;
+"""
+
+# Sets the document number input and fires its input/change events
+_SET_DOC_NUMBER_JS = """
+var input = document.querySelector(arguments[0]);
+if (!input) return false;
+input.value = arguments[1];
+input.dispatchEvent(new Event('input', {bubbles: true}));
+input.dispatchEvent(new Event('change', {bubbles: true}));
+return true;
+"""
+
+# "List No. 2" links in the search results table
+LIST_NO2_XPATH = "//a[contains(text(), 'List No. 2') or contains(text(), 'IndexII')]"
+
+# Defines linkUrl(link) for the link scripts below: the absolute URL a link opens, taken from its href,
+# its data-url attribute or the URL its onclick handler opens, or null if it has none of these
+_LINK_URL_JS = r"""
+function linkUrl(link) {
+    var href = link.getAttribute('href') ? link.href : '';
+    if (href.indexOf('http') === 0) return href;
+    if (link.dataset.url) return new URL(link.dataset.url, document.baseURI).href;
+    var onclick = link.getAttribute('onclick') || '';
+    var match = onclick.match(/https?:[^'"\s)]+/);
+    if (match) return match[0];
+    match = onclick.match(/(?:window\.open\(|location(?:\.href)?\s*=)\s*['"]([^'"]+)['"]/);
+    return match ? new URL(match[1], document.baseURI).href : null;
+}
+"""
+
+# Like _LIST_NO2_LINKS_JS, but for every row of a DataTables table that pages in the browser
+# (selector in arguments[0]), including rows on pages that are not shown, with the XPath in arguments[1].
+# Returns null when the table is not such a DataTable, a row has not been rendered yet or a link has no
+# URL linkUrl can find, since those links can only be clicked on the displayed page
+_DATATABLE_LINKS_JS = _LINK_URL_JS + """
+var table = document.querySelector(arguments[0]);
+if (!table || typeof jQuery === 'undefined' || !jQuery.fn.dataTable || !jQuery.fn.dataTable.isDataTable(table)) return null;
+var api = jQuery(table).DataTable();
+if (api.settings()[0].oFeatures.bServerSide) return null;
+var rows = api.rows().nodes().toArray();
+var links = [];
+for (var r = 0; r < rows.length; r++) {
+    if (!rows[r]) return null;
+    var result = document.evaluate('.' + arguments[1], rows[r], null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    for (var i = 0; i < result.snapshotLength; i++) {
+        var href = linkUrl(result.snapshotItem(i));
+        if (!href) return null;
+        var doc = rows[r].cells.length ? rows[r].cells[0].textContent.trim() : '';
+        links.push({doc: doc || ('doc_' + (links.length + 1)), href: href});
+    }
+}
+return links;
+"""
+
+# Number of reusable tabs PDF links are loaded in at the same time
+PDF_DOWNLOAD_TABS = 4
+
+# Number of PDF links fetched over HTTP at the same time, within the HTTP session's connection pool
+PDF_DOWNLOAD_WORKERS = 8
+
+# Most PDF requests per second over HTTP, lowered while the server answers 429 or 503
+PDF_REQUESTS_PER_SECOND = 5
+
+# Prefix of a PDF embedded in the page as a data URI
+PDF_DATA_URI_PREFIX = 'data:application/pdf;base64,'
+
+# Chunk size for writing streamed PDFs, large enough that most documents take a few write calls
+PDF_COPY_BUFFER_SIZE = 1024 * 1024
+
+# Returns the URL (see _LINK_URL_JS) and the first cell text of the row of every link matching the XPath
+# in arguments[0]. href is null for links that have to be clicked
+_LIST_NO2_LINKS_JS = _LINK_URL_JS + """
+var result = document.evaluate(arguments[0], document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+var links = [];
+for (var i = 0; i < result.snapshotLength; i++) {
+    var link = result.snapshotItem(i);
+    var row = link.closest('tr');
+    var doc = row && row.cells.length ? row.cells[0].innerText.trim() : '';
+    links.push({doc: doc || ('doc_' + (i + 1)), href: linkUrl(link)});
+}
+return links;
+"""
+
+# Position of the captcha in a page screenshot: (left, top, right, bottom)
+CAPTCHA_AREA = (510, 560, 660, 610)
+
+# Timestamp at the end of screenshot names like 'after_district_1753090987.png'
+_SCREENSHOT_TIMESTAMP_RE = re.compile(r'_(\d+)\.png$')
+
 def extract_timestamp_from_filename(filename):
     """Extract timestamp from filename like 'after_district_1753090987.png'."""
-    import re
-    match = re.search(r'_(\d+)\.png$', filename)
+    match = _SCREENSHOT_TIMESTAMP_RE.search(filename)
     if match:
         return match.group(1)
     return None
@@ -55,18 +318,321 @@ def generate_captcha_text_from_timestamp(timestamp):
     
     return captcha_text
 
+# Bounded pools of tesserocr API instances per engine mode, so the language model is loaded
+# once per instance and concurrent OCR calls scale up to the pool size
+TESS_POOL_SIZE = min(4, os.cpu_count() or 1)
+_tess_pools = {}
+_tess_apis = []
+_tess_apis_lock = threading.Lock()
+
+def _end_tess_apis():
+    """Release the tesserocr API instances at interpreter exit."""
+    with _tess_apis_lock:
+        for api in _tess_apis:
+            api.End()
+        _tess_apis.clear()
+
+atexit.register(_end_tess_apis)
+
+def _acquire_tess_api(oem):
+    """Take an API instance for the engine mode from its pool, creating one while the pool is not full."""
+    with _tess_apis_lock:
+        pool = _tess_pools.setdefault(oem, {'idle': queue.Queue(), 'created': 0})
+        try:
+            return pool['idle'].get_nowait()
+        except queue.Empty:
+            if pool['created'] < TESS_POOL_SIZE:
+                pool['created'] += 1
+                api = tesserocr.PyTessBaseAPI(oem=oem)
+                _tess_apis.append(api)
+                return api
+    return pool['idle'].get()
+
+def _release_tess_api(oem, api):
+    """Return an API instance to its pool."""
+    _tess_pools[oem]['idle'].put(api)
+
+def _parse_tesseract_config(config):
+    """Split a pytesseract config string into (psm, oem, variables)."""
+    psm, oem, variables = None, None, {}
+    tokens = config.split()
+    for i, token in enumerate(tokens[:-1]):
+        if token == '--psm':
+            psm = int(tokens[i + 1])
+        elif token == '--oem':
+            oem = int(tokens[i + 1])
+        elif token == '-c' and '=' in tokens[i + 1]:
+            name, value = tokens[i + 1].split('=', 1)
+            variables[name] = value
+    return psm, oem, variables
+
+def ocr_image(image, config=''):
+    """
+    Run Tesseract on a PIL image with a pytesseract-style config string.
+    
+    Uses the in-process tesserocr API when it is installed instead of starting a tesseract
+    process (and reloading the model) for every call.
+    """
+    if not TESSEROCR_AVAILABLE:
+        return pytesseract.image_to_string(image, config=config)
+    
+    psm, oem, variables = _parse_tesseract_config(config)
+    if oem is None:
+        oem = tesserocr.OEM.DEFAULT
+    api = _acquire_tess_api(oem)
+    try:
+        api.SetPageSegMode(tesserocr.PSM.AUTO if psm is None else psm)
+        api.SetVariable('tessedit_char_whitelist', variables.get('tessedit_char_whitelist', ''))
+        api.SetImage(image)
+        return api.GetUTF8Text()
+    finally:
+        _release_tess_api(oem, api)
+
+def dumps_progress(progress):
+    """Serialize progress to JSON bytes with sorted keys, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(progress, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+    return json.dumps(progress, indent=4, sort_keys=True).encode('utf-8')
+
+def loads_progress(data):
+    """Parse progress JSON from bytes or str, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+# Captchas whose longest side is below this many pixels are enlarged 3x before OCR
+CAPTCHA_MIN_OCR_SIZE = 200
+
+def preprocess_captcha(captcha_image):
+    """
+    Build the preprocessed variants of a cropped captcha that are fed to OCR.
+    
+    Returns:
+        list: (name, file prefix, PIL image) tuples
+    """
+    # Tesseract reads text best at around 300 DPI, so enlarge small captchas before any other step
+    upscale = max(captcha_image.size) < CAPTCHA_MIN_OCR_SIZE
+    if CV2_AVAILABLE:
+        return _preprocess_captcha_cv2(captcha_image, upscale)
+    
+    if upscale:
+        captcha_image = captcha_image.resize((captcha_image.width * 3, captcha_image.height * 3), Image.Resampling.BICUBIC)
+    gray = captcha_image.convert('L')
+    variants = [("Grayscale", "gray", gray)]
+    # High contrast - helps distinguish between similar characters like 9/0 and P/F
+    variants.append(("Enhanced Contrast", "enhanced", ImageEnhance.Contrast(gray).enhance(2.5)))
+    # Threshold with multiple values to catch different character features
+    for threshold_value in [100, 128, 150]:
+        threshold = gray.point(lambda x, t=threshold_value: 0 if x < t else 255, '1')
+        variants.append((f"Threshold {threshold_value}", f"threshold_{threshold_value}", threshold))
+    # Resize to make text larger - helps with character recognition
+    if not upscale:
+        resized = captcha_image.resize((captcha_image.width * 3, captcha_image.height * 3), Image.Resampling.BICUBIC)
+        variants.append(("Resized", "resized", resized))
+        variants.append(("Resized Enhanced", "resized_enhanced", ImageEnhance.Contrast(resized.convert('L')).enhance(2.5)))
+    # Sharpen - helps with edge definition
+    variants.append(("Sharpened", "sharpen", gray.filter(ImageFilter.SHARPEN).filter(ImageFilter.SHARPEN)))
+    return variants
+
+def _deskew_binary(img, max_angle=15):
+    """Rotate a black-on-white binary image so its text is horizontal. Larger skews are left alone."""
+    coords = cv2.findNonZero(cv2.bitwise_not(img))
+    if coords is None:
+        return img
+    angle = cv2.minAreaRect(coords)[-1]
+    # minAreaRect reports angles in [-90, 0) or (0, 90] depending on the OpenCV version
+    if angle > 45:
+        angle -= 90
+    elif angle < -45:
+        angle += 90
+    if abs(angle) < 0.5 or abs(angle) > max_angle:
+        return img
+    h, w = img.shape
+    matrix = cv2.getRotationMatrix2D((w / 2, h / 2), angle, 1.0)
+    return cv2.warpAffine(img, matrix, (w, h), flags=cv2.INTER_CUBIC, borderValue=255)
+
+def _preprocess_captcha_cv2(captcha_image, upscale):
+    """Build the same variants as preprocess_captcha with OpenCV on a single grayscale array."""
+    # PIL's ImageFilter.SHARPEN kernel
+    sharpen_kernel = np.array([[-2, -2, -2], [-2, 32, -2], [-2, -2, -2]], dtype=np.float32) / 16
+    
+    def enhance_contrast(img, factor):
+        # Same blend with the mean grey level as ImageEnhance.Contrast
+        return cv2.addWeighted(img, factor, np.full_like(img, int(img.mean() + 0.5)), 1 - factor, 0)
+    
+    rgb = np.asarray(captcha_image.convert('RGB'))
+    if upscale:
+        rgb = cv2.resize(rgb, None, fx=3, fy=3, interpolation=cv2.INTER_CUBIC)
+    gray = cv2.cvtColor(rgb, cv2.COLOR_RGB2GRAY)
+    variants = [("Grayscale", "gray", gray), ("Enhanced Contrast", "enhanced", enhance_contrast(gray, 2.5))]
+    for threshold_value in [100, 128, 150]:
+        _, threshold = cv2.threshold(gray, threshold_value - 1, 255, cv2.THRESH_BINARY)
+        variants.append((f"Threshold {threshold_value}", f"threshold_{threshold_value}", threshold))
+    
+    # Edge-preserving smoothing followed by an automatically chosen threshold
+    _, otsu = cv2.threshold(cv2.bilateralFilter(gray, 5, 50, 50), 0, 255, cv2.THRESH_BINARY | cv2.THRESH_OTSU)
+    variants.append(("Otsu", "otsu", otsu))
+    
+    # Locally adaptive threshold copes with the uneven background, then the text line is straightened
+    adaptive = cv2.adaptiveThreshold(
+        cv2.bilateralFilter(gray, 5, 75, 75), 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, 11, 2
+    )
+    variants.append(("Adaptive Deskewed", "adaptive", _deskew_binary(adaptive)))
+    
+    if not upscale:
+        resized = cv2.resize(rgb, None, fx=3, fy=3, interpolation=cv2.INTER_CUBIC)
+        variants.append(("Resized", "resized", resized))
+        variants.append(("Resized Enhanced", "resized_enhanced", enhance_contrast(cv2.cvtColor(resized, cv2.COLOR_RGB2GRAY), 2.5)))
+    sharpened = cv2.filter2D(cv2.filter2D(gray, -1, sharpen_kernel), -1, sharpen_kernel)
+    variants.append(("Sharpened", "sharpen", sharpened))
+    return [(name, prefix, Image.fromarray(img)) for name, prefix, img in variants]
+
+# Captcha texts the site accepted, keyed by a hash of the captcha pixels.
+# Recent entries are kept in memory, all of them in SQLite so they survive restarts.
+CAPTCHA_CACHE_SIZE = 512
+CAPTCHA_CACHE_DB = os.path.join('captcha_extracts', 'captcha_cache.sqlite3')
+_captcha_cache = OrderedDict()
+_captcha_cache_lock = threading.Lock()
+_captcha_db = None
+
+# Prefix of the cache keys of OCR results. Bump the version when the OCR pipeline or the key
+# format changes, so entries stored under older keys are dropped and never reused
+CAPTCHA_OCR_KEY_PREFIX = b'ocr3:'
+CAPTCHA_API_KEY_PREFIX = b'api2:'
+
+def _captcha_cache_key(pixels, prefix=CAPTCHA_OCR_KEY_PREFIX):
+    """Return the cache key for the raw pixels of a captcha image."""
+    return prefix + hashlib.blake2b(pixels, digest_size=16).digest()
+
+def _get_captcha_db():
+    """Open the on-disk captcha cache, creating it on first use. Call with _captcha_cache_lock held."""
+    global _captcha_db
+    if _captcha_db is None:
+        os.makedirs(os.path.dirname(CAPTCHA_CACHE_DB), exist_ok=True)
+        _captcha_db = sqlite3.connect(CAPTCHA_CACHE_DB, check_same_thread=False)
+        _captcha_db.execute("CREATE TABLE IF NOT EXISTS captchas (key BLOB PRIMARY KEY, text TEXT NOT NULL)")
+        # Drop texts read by other OCR pipeline versions, they are never looked up again
+        _captcha_db.execute(
+            "DELETE FROM captchas WHERE substr(key, 1, ?) != ? AND substr(key, 1, ?) != ?",
+            (len(CAPTCHA_OCR_KEY_PREFIX), CAPTCHA_OCR_KEY_PREFIX, len(CAPTCHA_API_KEY_PREFIX), CAPTCHA_API_KEY_PREFIX)
+        )
+        _captcha_db.commit()
+    return _captcha_db
+
+def _lookup_captcha_cache(key):
+    """Return the cached text for a captcha key, or None."""
+    with _captcha_cache_lock:
+        if key in _captcha_cache:
+            _captcha_cache.move_to_end(key)
+            return _captcha_cache[key]
+        try:
+            row = _get_captcha_db().execute("SELECT text FROM captchas WHERE key = ?", (key,)).fetchone()
+        except sqlite3.Error as e:
+            logging.getLogger('extract_captcha').warning(f"Could not read captcha cache: {str(e)}")
+            return None
+        if row:
+            _captcha_cache[key] = row[0]
+        return row[0] if row else None
+
+def _store_captcha_cache(key, text):
+    """Remember the text the site accepted for a captcha key, in memory and on disk."""
+    with _captcha_cache_lock:
+        _captcha_cache[key] = text
+        if len(_captcha_cache) > CAPTCHA_CACHE_SIZE:
+            _captcha_cache.popitem(last=False)
+        try:
+            db = _get_captcha_db()
+            db.execute("INSERT OR REPLACE INTO captchas (key, text) VALUES (?, ?)", (key, text))
+            db.commit()
+        except sqlite3.Error as e:
+            logging.getLogger('extract_captcha').warning(f"Could not write captcha cache: {str(e)}")
+
+def _forget_captcha_cache(key):
+    """Drop the text cached for a captcha key, after the site rejected it."""
+    with _captcha_cache_lock:
+        _captcha_cache.pop(key, None)
+        try:
+            db = _get_captcha_db()
+            db.execute("DELETE FROM captchas WHERE key = ?", (key,))
+            db.commit()
+        except sqlite3.Error as e:
+            logging.getLogger('extract_captcha').warning(f"Could not update captcha cache: {str(e)}")
+
+def read_captcha_image(captcha_image, expected_captcha=None, save_dir="captcha_extracts", save_name=None):
+    """
+    Read the text of a captcha image, reusing the text of an identical captcha the site accepted before.
+    
+    The key depends only on the pixels; expected_captcha only helps OCR pick between readings.
+    Nothing is cached here: pass the key to _store_captcha_cache once the site accepts the text,
+    or to _forget_captcha_cache if it rejects it.
+    
+    Returns:
+        tuple: (text or None, cache key)
+    """
+    key = _captcha_cache_key(captcha_image.tobytes())
+    cached_text = _lookup_captcha_cache(key)
+    if cached_text:
+        logging.getLogger('extract_captcha').info(f"Reusing captcha text accepted for an identical image: {cached_text}")
+        return cached_text, key
+    return _read_captcha_text(captcha_image, expected_captcha, save_dir, save_name), key
+
 def extract_captcha(image_path, save_dir="captcha_extracts"):
-    """Extract captcha from the image."""
+    """
+    Extract the captcha from a page screenshot.
+    
+    Returns:
+        tuple: (text or None, cache key or None), see read_captcha_image
+    """
     logger = logging.getLogger('extract_captcha')
     logger.info(f"Extracting captcha from image: {image_path}")
     
     # Check if the image exists
     if not os.path.exists(image_path):
         logger.error(f"Image not found: {image_path}")
-        return None
+        return None, None
+    
+    try:
+        with Image.open(image_path) as image:
+            logger.info(f"Image opened successfully: {image.format}, {image.size}, {image.mode}")
+            captcha_image = image.crop(CAPTCHA_AREA)
+    except Exception as e:
+        logger.error(f"Error extracting captcha: {str(e)}")
+        return None, None
+    
+    # Extract timestamp from filename
+    timestamp = extract_timestamp_from_filename(os.path.basename(image_path))
+    logger.info(f"Extracted timestamp: {timestamp}")
+    
+    return read_captcha_image(
+        captcha_image, generate_captcha_text_from_timestamp(timestamp), save_dir, os.path.basename(image_path)
+    )
+
+def extract_captcha_from_png(png_data, timestamp=None):
+    """
+    Extract the captcha from a PNG screenshot of just the captcha element, without writing it to disk.
+    
+    Returns:
+        tuple: (text or None, cache key or None), see read_captcha_image
+    """
+    try:
+        captcha_image = Image.open(BytesIO(png_data))
+        captcha_image.load()
+    except Exception as e:
+        logging.getLogger('extract_captcha').error(f"Error extracting captcha: {str(e)}")
+        return None, None
+    expected_captcha = generate_captcha_text_from_timestamp(str(timestamp) if timestamp else None)
+    return read_captcha_image(captcha_image, expected_captcha)
+
+def _read_captcha_text(captcha_image, expected_captcha=None, save_dir="captcha_extracts", save_name=None):
+    """
+    Read the text of a captcha image with OCR.
+    
+    The crop and its preprocessed variants are saved to save_dir under save_name, if one is given.
+    """
+    logger = logging.getLogger('extract_captcha')
     
     # Create save directory if it doesn't exist
-    if not os.path.exists(save_dir):
+    if save_name and not os.path.exists(save_dir):
         os.makedirs(save_dir)
         logger.info(f"Created directory: {save_dir}")
     
@@ -80,81 +646,32 @@ def extract_captcha(image_path, save_dir="captcha_extracts"):
             pytesseract.pytesseract.tesseract_cmd = tesseract_path
             logger.info(f"Using Tesseract path from config.json: {tesseract_path}")
     
-    # Extract timestamp from filename
-    timestamp = extract_timestamp_from_filename(os.path.basename(image_path))
-    logger.info(f"Extracted timestamp: {timestamp}")
-    
-    # Generate expected captcha text
-    expected_captcha = generate_captcha_text_from_timestamp(timestamp)
     logger.info(f"Expected captcha text based on timestamp: {expected_captcha}")
     
     try:
-        # Open the image
-        image = Image.open(image_path)
-        logger.info(f"Image opened successfully: {image.format}, {image.size}, {image.mode}")
-        
-        # Format: (left, top, right, bottom)
-        captcha_area = (510, 560, 660, 610)
-        
-        # Crop the captcha area
-        captcha_image = image.crop(captcha_area)
-        captcha_filename = os.path.join(save_dir, f"captcha_{os.path.basename(image_path)}")
-        captcha_image.save(captcha_filename)
-        logger.info(f"Saved captcha image to: {captcha_filename}")
+        if save_name:
+            captcha_filename = os.path.join(save_dir, f"captcha_{save_name}")
+            captcha_image.save(captcha_filename)
+            logger.info(f"Saved captcha image to: {captcha_filename}")
         
         # Apply preprocessing techniques optimized for this specific captcha
         preprocessed_images = []
-        
-        # Grayscale - basic but effective
-        gray = captcha_image.convert('L')
-        gray_filename = os.path.join(save_dir, f"gray_{os.path.basename(image_path)}")
-        gray.save(gray_filename)
-        preprocessed_images.append(("Grayscale", gray, gray_filename))
-        
-        # High contrast - helps distinguish between similar characters like 9/0 and P/F
-        enhancer = ImageEnhance.Contrast(gray)
-        enhanced = enhancer.enhance(2.5)  # Increased contrast
-        enhanced_filename = os.path.join(save_dir, f"enhanced_{os.path.basename(image_path)}")
-        enhanced.save(enhanced_filename)
-        preprocessed_images.append(("Enhanced Contrast", enhanced, enhanced_filename))
-        
-        # Threshold with multiple values to catch different character features
-        for threshold_value in [100, 128, 150]:
-            threshold = gray.point(lambda x: 0 if x < threshold_value else 255, '1')
-            threshold_filename = os.path.join(save_dir, f"threshold_{threshold_value}_{os.path.basename(image_path)}")
-            threshold.save(threshold_filename)
-            preprocessed_images.append((f"Threshold {threshold_value}", threshold, threshold_filename))
-        
-        # Resize to make text larger - helps with character recognition
-        resized = captcha_image.resize((captcha_image.width * 3, captcha_image.height * 3), Image.Resampling.BICUBIC)  # Larger resize
-        resized_filename = os.path.join(save_dir, f"resized_{os.path.basename(image_path)}")
-        resized.save(resized_filename)
-        preprocessed_images.append(("Resized", resized, resized_filename))
-        
-        # Resized grayscale with contrast
-        resized_gray = resized.convert('L')
-        enhancer = ImageEnhance.Contrast(resized_gray)
-        resized_enhanced = enhancer.enhance(2.5)
-        resized_enhanced_filename = os.path.join(save_dir, f"resized_enhanced_{os.path.basename(image_path)}")
-        resized_enhanced.save(resized_enhanced_filename)
-        preprocessed_images.append(("Resized Enhanced", resized_enhanced, resized_enhanced_filename))
-        
-        # Sharpen - helps with edge definition
-        sharpened = gray.filter(ImageFilter.SHARPEN).filter(ImageFilter.SHARPEN)  # Double sharpen
-        sharpen_filename = os.path.join(save_dir, f"sharpen_{os.path.basename(image_path)}")
-        sharpened.save(sharpen_filename)
-        preprocessed_images.append(("Sharpened", sharpened, sharpen_filename))
+        for name, prefix, img in preprocess_captcha(captcha_image):
+            filename = None
+            if save_name:
+                filename = os.path.join(save_dir, f"{prefix}_{save_name}")
+                img.save(filename)
+            preprocessed_images.append((name, img, filename))
         
         # Perform OCR on each preprocessed image with optimized configs for this specific captcha
+        # The captcha is a single line of 6 characters, so only the line/word segmentation
+        # modes are tried; page, block and single-character modes never read it whole
         ocr_configs = [
             ("Optimized for 5T9wPF", "--psm 7 -c tessedit_char_whitelist=0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"),
-            ("Single Char Mode", "--psm 10 -c tessedit_char_whitelist=0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"),
             # Removed Legacy Engine as it's not available
             ("LSTM Engine", "--oem 1 --psm 7 -c tessedit_char_whitelist=0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"),
-            ("Default", ""),
-            ("PSM 6", "--psm 6"),
-            ("PSM 8", "--psm 8"),
-            ("PSM 13", "--psm 13")
+            ("PSM 13", "--psm 13 -c tessedit_char_whitelist=0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"),
+            ("PSM 8", "--psm 8")
         ]
         
         all_results = []
@@ -162,7 +679,7 @@ def extract_captcha(image_path, save_dir="captcha_extracts"):
             logger.info(f"Performing OCR on {name} image...")
             for config_name, config in ocr_configs:
                 try:
-                    text = pytesseract.image_to_string(img, config=config).strip()
+                    text = ocr_image(img, config=config).strip()
                     if text:
                         all_results.append((name, config_name, text))
                         logger.info(f"{name} - {config_name}: '{text}'")
@@ -272,71 +789,131 @@ os.makedirs('logs', exist_ok=True)
 utf8_stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
 
 # Configure logging
+log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+file_handler = logging.FileHandler(
+    os.path.join('logs', f'scraper_{datetime.now().strftime("%Y%m%d_%H%M%S")}.log'),
+    encoding='utf-8'
+)
+file_handler.setFormatter(log_formatter)
+stream_handler = logging.StreamHandler(utf8_stdout)
+stream_handler.setFormatter(log_formatter)
+
+# Log calls only enqueue the record; a background thread formats and writes it.
+# File writes are additionally buffered, warnings and errors flush the buffer immediately.
+log_queue = queue.Queue(-1)
+log_listener = logging.handlers.QueueListener(
+    log_queue,
+    logging.handlers.MemoryHandler(capacity=1024, flushLevel=logging.WARNING, target=file_handler),
+    stream_handler
+)
+log_listener.start()
+atexit.register(log_listener.stop)
+
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(
-            os.path.join('logs', f'scraper_{datetime.now().strftime("%Y%m%d_%H%M%S")}.log'),
-            encoding='utf-8'
-        ),
-        logging.StreamHandler(utf8_stdout)
-    ]
+    handlers=[logging.handlers.QueueHandler(log_queue)]
 )
 logger = logging.getLogger('property_scraper')
 
+class DailyLimitReached(Exception):
+    """Raised inside a worker's loop to stop it once the daily request limit is reached."""
+
 class PropertyScraper:
-    def __init__(self, config_path='config.json'):
-        """Initialize the PropertyScraper with configuration."""
+    # Document numbers searched for each village
+    DOC_NUMBERS = range(10)
+    # Blank document number searches every document in the village at once
+    WILDCARD_DOC_NUMBER = ''
+    
+    # Outcomes of process_combination
+    RESULT_OK = 'ok'
+    RESULT_RATE_LIMITED = 'rate_limited'
+    RESULT_SESSION_EXPIRED = 'session_expired'
+    RESULT_FAILED = 'failed'
+    RESULT_DAILY_LIMIT = 'daily_limit'
+    # Back-off retries of a rate limited combination
+    MAX_RATE_LIMIT_RETRIES = 3
+    
+    # Captchas tried on the same page before a combination is given up
+    MAX_CAPTCHA_ATTEMPTS = 5
+    
+    # Conditional progress writes to S3 tried, merging in between, while other instances keep writing
+    MAX_S3_PUT_ATTEMPTS = 3
+    
+    def __init__(self, config_path='config.json', config=None):
+        """
+        Initialize the PropertyScraper with configuration.
+        
+        Args:
+            config_path: JSON file the configuration is read from
+            config: Configuration dict to use instead of reading config_path
+        """
         self.base_url = "https://pay2igr.igrmaharashtra.gov.in/eDisplay/Propertydetails/index"
         self.download_dir = os.path.join(os.getcwd(), 'downloads')
         self.local_progress_file = 'progress.json'
+        self.progress_save_interval = 60  # Minimum seconds between non-forced progress writes
+        self.progress_save_every = 10  # Completed combinations that trigger a write regardless of the interval
         self.daily_limit = 5
         self.delay_between_requests = (3, 7)
         
         self.instance_id = f"local_{uuid.uuid4().hex[:8]}"
         logger.info(f"Instance ID: {self.instance_id}")
         
-        if os.path.exists(config_path):
+        if config is None and os.path.exists(config_path):
             with open(config_path, 'r') as f:
                 config = json.load(f)
-                self.proxies = config.get('proxies', [])
-                self.user_agents = config.get('user_agents', [])
-                self.captcha_api_key = config.get('captcha_api_key', '')
-                self.tesseract_path = config.get('tesseract_path', '')
-                self.use_free_proxies = config.get('use_free_proxies', True)
-                self.free_proxy_min_count = config.get('free_proxy_min_count', 5)
-                
-                # Set tesseract path if provided
-                if self.tesseract_path and PYTESSERACT_AVAILABLE:
-                    pytesseract.pytesseract.tesseract_cmd = self.tesseract_path
-                    logger.info(f"Tesseract path set to: {self.tesseract_path}")
-                
-                self.use_cloud_storage = config.get('use_cloud_storage', False)
-                self.cloud_storage_type = config.get('cloud_storage_type', 's3')
-                self.cloud_storage_config = config.get('cloud_storage_config', {})
-                
-                if self.use_cloud_storage:
-                    if self.cloud_storage_type == 's3':
-                        self.s3_bucket = self.cloud_storage_config.get('bucket_name', '')
-                        self.s3_progress_key = self.cloud_storage_config.get('progress_key', 'progress.json')
-                        
-                        if 'aws_access_key_id' in self.cloud_storage_config and 'aws_secret_access_key' in self.cloud_storage_config:
-                            self.s3_client = boto3.client(
-                                's3',
-                                aws_access_key_id=self.cloud_storage_config.get('aws_access_key_id'),
-                                aws_secret_access_key=self.cloud_storage_config.get('aws_secret_access_key'),
-                                region_name=self.cloud_storage_config.get('region_name', 'us-east-1')
-                            )
-                        else:
-                            self.s3_client = boto3.client('s3')
-                    elif self.cloud_storage_type == 'github':
-                        self.github_repo = self.cloud_storage_config.get('repository', '')
-                        self.github_token = self.cloud_storage_config.get('token', '')
-                        self.github_progress_key = self.cloud_storage_config.get('progress_key', 'progress.json')
-                        self.github_client = GitHubStorage(self.github_repo, self.github_token)
-                        self.github_sha = None
-                        logger.info(f"Initialized GitHub storage for repository: {self.github_repo}")
+        
+        if config is not None:
+            self.proxies = config.get('proxies', [])
+            self.user_agents = config.get('user_agents', [])
+            self.captcha_api_key = config.get('captcha_api_key', '')
+            self.tesseract_path = config.get('tesseract_path', '')
+            self.use_free_proxies = config.get('use_free_proxies', True)
+            self.free_proxy_min_count = config.get('free_proxy_min_count', 5)
+            self.max_workers = config.get('max_workers', 1)
+            self.rate_limits = config.get('rate_limits', [])
+            self.blocked_urls = config.get('blocked_urls', DEFAULT_BLOCKED_URLS)
+            self.headless = config.get('headless', True)
+            self.debug_screenshots = config.get('debug_screenshots', False)
+            self.use_proxies = config.get('use_proxies', False)
+            
+            # Set tesseract path if provided
+            if self.tesseract_path and PYTESSERACT_AVAILABLE:
+                pytesseract.pytesseract.tesseract_cmd = self.tesseract_path
+                logger.info(f"Tesseract path set to: {self.tesseract_path}")
+            
+            self.use_cloud_storage = config.get('use_cloud_storage', False)
+            self.cloud_storage_type = config.get('cloud_storage_type', 's3')
+            self.cloud_storage_config = config.get('cloud_storage_config', {})
+            
+            if self.use_cloud_storage:
+                if self.cloud_storage_type == 's3':
+                    import boto3
+                    
+                    self.s3_bucket = self.cloud_storage_config.get('bucket_name', '')
+                    self._s3_fetch = None
+                    self._s3_fetch_lock = threading.Lock()
+                    self._s3_etag = None
+                    self._s3_conditional_put = True
+                    self.s3_progress_key = self.cloud_storage_config.get('progress_key', 'progress.json')
+                    
+                    if 'aws_access_key_id' in self.cloud_storage_config and 'aws_secret_access_key' in self.cloud_storage_config:
+                        self.s3_client = boto3.client(
+                            's3',
+                            aws_access_key_id=self.cloud_storage_config.get('aws_access_key_id'),
+                            aws_secret_access_key=self.cloud_storage_config.get('aws_secret_access_key'),
+                            region_name=self.cloud_storage_config.get('region_name', 'us-east-1')
+                        )
+                    else:
+                        self.s3_client = boto3.client('s3')
+                elif self.cloud_storage_type == 'github':
+                    from github_storage import GitHubStorage
+                    
+                    self.github_repo = self.cloud_storage_config.get('repository', '')
+                    self.github_token = self.cloud_storage_config.get('token', '')
+                    self.github_progress_key = self.cloud_storage_config.get('progress_key', 'progress.json')
+                    self.github_client = GitHubStorage(self.github_repo, self.github_token)
+                    self.github_sha = None
+                    logger.info(f"Initialized GitHub storage for repository: {self.github_repo}")
         else:
             self.proxies = []
             self.user_agents = [
@@ -348,18 +925,137 @@ class PropertyScraper:
             self.tesseract_path = ''
             self.use_free_proxies = True
             self.free_proxy_min_count = 5
+            self.max_workers = 1
+            self.rate_limits = []
+            self.blocked_urls = DEFAULT_BLOCKED_URLS
+            self.headless = True
+            self.debug_screenshots = False
+            self.use_proxies = False
             self.use_cloud_storage = False
             
+        # Rotate through the user agents, starting at a random one
+        if self.user_agents:
+            start = random.randrange(len(self.user_agents))
+            self._user_agent_cycle = itertools.cycle(self.user_agents[start:] + self.user_agents[:start])
+        else:
+            self._user_agent_cycle = None
+        
+        # Shared by the proxy sources and proxy tests so connections and sessions are reused
+        self._proxy_session = requests.Session()
+        proxy_adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=0)
+        self._proxy_session.mount('http://', proxy_adapter)
+        self._proxy_session.mount('https://', proxy_adapter)
+        
         if self.use_free_proxies and not self.proxies:
             logger.info("No proxies provided in config. Fetching free proxies...")
             self.proxies = self.get_free_proxies(min_proxies=self.free_proxy_min_count)
             logger.info(f"Found {len(self.proxies)} working free proxies")
         
+        # With use_proxies, every new browser session takes the next proxy, starting at a random one
+        if self.use_proxies and self.proxies:
+            start = random.randrange(len(self.proxies))
+            self._proxy_cycle = itertools.cycle(self.proxies[start:] + self.proxies[:start])
+        else:
+            self._proxy_cycle = None
+        
         self.progress = self._load_progress()
+        self._index_completed()
+        self._last_progress_digest = None
+        self._last_progress_save = float('-inf')
+        self._progress_dirty = False
+        self._unsaved_completions = 0
+        
+        # Held while progress is written and uploaded, so writes happen one at a time and in order
+        # without holding the progress lock the workers need
+        self._progress_write_lock = threading.Lock()
+        
+        # Set when a deferred save is due, for the background progress writer started by run()
+        self._progress_save_due = threading.Event()
+        self._progress_writer_running = False
         
         self.daily_requests = 0
         self.current_session_start = datetime.now()
         
+        # Create the debug directories once instead of checking for them on every screenshot
+        for debug_dir in ("captcha_debug", "dropdown_debug", "captcha_extracts"):
+            os.makedirs(debug_dir, exist_ok=True)
+        
+        # Throttle requests to the site, shared by all workers
+        self.rate_limiter = RateLimiter.from_config(
+            self.rate_limits,
+            self.base_url,
+            (self.delay_between_requests[0] * 1000, self.delay_between_requests[1] * 1000)
+        )
+        
+        # Paces the PDF downloads over HTTP, shared by all workers and download threads
+        self.pdf_rate_limiter = AdaptiveRateLimiter(PDF_REQUESTS_PER_SECOND)
+        
+        # Set by stop() to end the run after the combinations in progress
+        self._stop_event = threading.Event()
+        
+        # Browsers started by the workers, so quit_drivers() can close them from another thread
+        self._drivers = set()
+        self._drivers_lock = threading.Lock()
+        
+        # Guards progress and counters shared between worker threads
+        self._progress_lock = threading.RLock()
+        self._in_flight = set()
+        self._progress_merged = threading.Event()
+        
+        # Selection approach and option XPath template index that last worked, per dropdown id.
+        # Shared by the workers, so only used with the lock held
+        self._dropdown_click_strategy = {}
+        self._dropdown_click_strategy_lock = threading.Lock()
+        
+        # Dropdown options read from the site, keyed by dropdown id and the parent selections,
+        # least recently used first. Shared by the workers, so only used with the lock held
+        self._dropdown_options_cache = OrderedDict()
+        self._dropdown_options_lock = threading.Lock()
+        
+        # Background workers for decoding the captcha while the form is being filled in
+        self._ocr_pool = concurrent.futures.ThreadPoolExecutor(max_workers=max(1, self.max_workers))
+        
+        # Per-thread state: HTTP session, reusable download tab and latest district screenshot
+        self._local = threading.local()
+        
+    @property
+    def _http(self):
+        """HTTP session of the current thread, reusing keep-alive connections for PDF downloads."""
+        http = getattr(self._local, 'http', None)
+        if http is None:
+            http = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=8,
+                pool_maxsize=16,
+                max_retries=Retry(total=3, backoff_factor=0.5)
+            )
+            http.mount('http://', adapter)
+            http.mount('https://', adapter)
+            self._local.http = http
+            self._local.http_cookie_session_id = None
+        return http
+    
+    def _sync_http_cookies(self, driver, refresh=False):
+        """
+        Copy the browser cookies into the thread's HTTP session.
+        
+        They are copied once per driver session, or again with refresh=True, e.g. after a search
+        in which the site may have replaced its session cookies.
+        """
+        http = self._http
+        if self._local.http_cookie_session_id == driver.session_id and not refresh:
+            return
+        
+        for cookie in driver.get_cookies():
+            http.cookies.set(
+                cookie['name'], cookie['value'],
+                domain=cookie.get('domain', ''), path=cookie.get('path', '/'), secure=cookie.get('secure', False)
+            )
+        if self._local.http_cookie_session_id != driver.session_id:
+            http.headers['User-Agent'] = driver.execute_script("return navigator.userAgent;")
+            self._local.http_cookie_session_id = driver.session_id
+        logger.info("Loaded browser cookies into HTTP session")
+        
     def _load_progress(self):
         """Load progress from file if exists."""
         if self.use_cloud_storage:
@@ -373,8 +1069,8 @@ class PropertyScraper:
                 logger.warning("Falling back to local progress file")
         
         if os.path.exists(self.local_progress_file):
-            with open(self.local_progress_file, 'r') as f:
-                return json.load(f)
+            with open(self.local_progress_file, 'rb') as f:
+                return loads_progress(f.read())
                 
         return {
             'last_run': None,
@@ -388,13 +1084,73 @@ class PropertyScraper:
             }
         }
     
+    def _index_completed(self):
+        """Keep completed tasks in a set and count completed document numbers per village for O(1) lookups."""
+        self.progress['completed'] = set(self.progress.get('completed', []))
+        self._completed_prefixes = Counter(
+            task.rsplit('_', 1)[0] for task in self.progress['completed']
+        )
+    
+    def _mark_completed(self, combination_key):
+        """Record a combination as completed."""
+        with self._progress_lock:
+            if combination_key not in self.progress['completed']:
+                self.progress['completed'].add(combination_key)
+                self._completed_prefixes[combination_key.rsplit('_', 1)[0]] += 1
+                self._unsaved_completions += 1
+    
+    def _merge_completed(self, tasks):
+        """
+        Add the completed tasks saved by other instances with one set union.
+        
+        Unlike _mark_completed, they are not counted as unsaved local completions, so a large
+        merge does not trigger extra saves.
+        """
+        with self._progress_lock:
+            new_tasks = set(tasks) - self.progress['completed']
+            self.progress['completed'] |= new_tasks
+            self._completed_prefixes.update(task.rsplit('_', 1)[0] for task in new_tasks)
+    
+    def _serialize_progress(self):
+        """Return a JSON-serializable copy of the progress with completed tasks as a sorted list."""
+        progress = dict(self.progress)
+        progress['completed'] = sorted(self.progress['completed'])
+        return progress
+    
+    def _fetch_s3_progress(self):
+        """
+        Download the raw progress object from S3.
+        
+        Concurrent callers share a single GetObject request: whoever arrives while a download
+        is in flight waits for its result instead of starting another one.
+        """
+        with self._s3_fetch_lock:
+            pending = self._s3_fetch
+            if pending is None:
+                pending = self._s3_fetch = concurrent.futures.Future()
+                owner = True
+            else:
+                owner = False
+        
+        if owner:
+            try:
+                logger.info(f"Loading progress from S3 bucket: {self.s3_bucket}, key: {self.s3_progress_key}")
+                response = self.s3_client.get_object(Bucket=self.s3_bucket, Key=self.s3_progress_key)
+                data = response['Body'].read()
+                self._s3_etag = response.get('ETag')
+                pending.set_result(data)
+            except Exception as e:
+                pending.set_exception(e)
+            finally:
+                with self._s3_fetch_lock:
+                    self._s3_fetch = None
+        
+        return pending.result()
+    
     def _load_progress_from_s3(self):
         """Load progress from S3 bucket."""
         try:
-            logger.info(f"Loading progress from S3 bucket: {self.s3_bucket}, key: {self.s3_progress_key}")
-            response = self.s3_client.get_object(Bucket=self.s3_bucket, Key=self.s3_progress_key)
-            progress_data = response['Body'].read().decode('utf-8')
-            return json.loads(progress_data)
+            return loads_progress(self._fetch_s3_progress())
         except self.s3_client.exceptions.NoSuchKey:
             logger.warning(f"Progress file not found in S3 bucket: {self.s3_bucket}, key: {self.s3_progress_key}")
             return {
@@ -412,43 +1168,140 @@ class PropertyScraper:
             logger.error(f"Error loading progress from S3: {str(e)}")
             raise
     
-    def _save_progress(self):
-        """Save current progress to file."""
-        with open(self.local_progress_file, 'w') as f:
-            json.dump(self.progress, f, indent=4)
+    def _save_progress(self, force=False):
+        """
+        Save current progress to file.
+        
+        Unless force is set, the write is deferred until progress_save_interval seconds have
+        passed since the previous save or progress_save_every combinations were completed.
+        While the background progress writer runs, a due save is handed to it instead of being
+        written, and uploaded, by the calling worker. Only the snapshot of the progress is taken
+        under the progress lock; the file write and upload happen outside it. The write is skipped
+        when nothing changed since the last save. The file is replaced atomically so a crash
+        mid-write cannot corrupt it.
+        """
+        with self._progress_lock:
+            if self._defer_progress_save(force):
+                return
+        
+        with self._progress_write_lock:
+            with self._progress_lock:
+                blob = dumps_progress(self._serialize_progress())
+                self._unsaved_completions = 0
+                self._progress_dirty = False
+            try:
+                self._write_progress(blob)
+            except Exception:
+                with self._progress_lock:
+                    self._progress_dirty = True
+                raise
+    
+    def _defer_progress_save(self, force):
+        """Return True if a save is deferred or handed to the background writer. Call with the progress lock held."""
+        if (not force
+                and self._unsaved_completions < self.progress_save_every
+                and time.monotonic() - self._last_progress_save < self.progress_save_interval):
+            self._progress_dirty = True
+            return True
+        if not force and self._progress_writer_running:
+            self._progress_dirty = True
+            self._progress_save_due.set()
+            return True
+        return False
+    
+    def _write_progress(self, blob):
+        """Write serialized progress to the local file and cloud storage. Call with the progress write lock held."""
+        digest = hashlib.blake2b(blob, digest_size=16).digest()
+        if digest == self._last_progress_digest:
+            return
+        
+        tmp_path = f"{self.local_progress_file}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(blob)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.local_progress_file)
+        
+        self._last_progress_digest = digest
+        self._last_progress_save = time.monotonic()
             
         if self.use_cloud_storage:
             try:
                 if self.cloud_storage_type == 's3':
-                    self._save_progress_to_s3()
+                    self._save_progress_to_s3(blob)
                 elif self.cloud_storage_type == 'github':
-                    self._save_progress_to_github()
+                    self._save_progress_to_github(blob)
             except Exception as e:
                 logger.error(f"Error saving progress to cloud storage: {str(e)}")
                 logger.warning("Progress was only saved locally")
     
-    def _save_progress_to_s3(self):
-        """Save progress to S3 bucket with locking mechanism to prevent race conditions."""
+    def _flush_progress(self):
+        """Write any progress change that was deferred by _save_progress."""
+        if self._progress_dirty:
+            self._save_progress(force=True)
+    
+    def _save_progress_to_s3(self, blob):
+        """
+        Save serialized progress to S3 bucket with locking mechanism to prevent race conditions.
+        
+        While the object is unchanged since this instance last read or wrote it, progress is
+        written with a conditional PUT and no read. When another instance changed it, the latest
+        object is read and merged, and the PUT is retried against the ETag of that read, up to
+        MAX_S3_PUT_ATTEMPTS times. Only when conditional writes are not possible (the S3 client
+        does not support IfMatch, or the object could not be read) is progress written
+        unconditionally after merging.
+        """
+        from botocore.exceptions import ClientError, ParamValidationError
+        
         try:
-            try:
-                latest_progress = self._load_progress_from_s3()
+            body = blob
+            for _ in range(self.MAX_S3_PUT_ATTEMPTS):
+                if self._s3_etag and self._s3_conditional_put:
+                    try:
+                        response = self.s3_client.put_object(
+                            Bucket=self.s3_bucket,
+                            Key=self.s3_progress_key,
+                            Body=body,
+                            ContentType='application/json',
+                            IfMatch=self._s3_etag
+                        )
+                        self._s3_etag = response.get('ETag')
+                        logger.info(f"Progress saved to S3 bucket: {self.s3_bucket}, key: {self.s3_progress_key}")
+                        return
+                    except ParamValidationError:
+                        logger.info("S3 client does not support conditional writes; merging before every save")
+                        self._s3_conditional_put = False
+                    except ClientError as e:
+                        if e.response.get('Error', {}).get('Code') != 'PreconditionFailed':
+                            raise
+                        logger.info("Progress in S3 was changed by another instance. Merging...")
                 
-                for task in self.progress['completed']:
-                    if task not in latest_progress['completed']:
-                        latest_progress['completed'].append(task)
+                # The read sets the ETag the next conditional write is made against
+                self._s3_etag = None
+                try:
+                    latest_progress = self._load_progress_from_s3()
+                    
+                    # Take in the other instances' tasks so the write keeps them
+                    self._merge_completed(latest_progress['completed'])
+                    with self._progress_lock:
+                        latest_progress['completed'] = sorted(self.progress['completed'])
+                    
+                    body = dumps_progress(latest_progress)
+                except Exception as e:
+                    logger.warning(f"Could not load latest progress from S3 for merging: {str(e)}")
                 
-                merged_progress = latest_progress
-            except Exception as e:
-                logger.warning(f"Could not load latest progress from S3 for merging: {str(e)}")
-                merged_progress = self.progress
-            
-            self.s3_client.put_object(
-                Bucket=self.s3_bucket,
-                Key=self.s3_progress_key,
-                Body=json.dumps(merged_progress, indent=4),
-                ContentType='application/json'
-            )
-            logger.info(f"Progress saved to S3 bucket: {self.s3_bucket}, key: {self.s3_progress_key}")
+                if not (self._s3_etag and self._s3_conditional_put):
+                    response = self.s3_client.put_object(
+                        Bucket=self.s3_bucket,
+                        Key=self.s3_progress_key,
+                        Body=body,
+                        ContentType='application/json'
+                    )
+                    self._s3_etag = response.get('ETag')
+                    logger.info(f"Progress saved to S3 bucket: {self.s3_bucket}, key: {self.s3_progress_key}")
+                    return
+            
+            raise Exception(f"Progress in S3 kept changing, not saved after {self.MAX_S3_PUT_ATTEMPTS} attempts")
         except Exception as e:
             logger.error(f"Error saving progress to S3: {str(e)}")
             raise
@@ -479,12 +1332,12 @@ class PropertyScraper:
             logger.error(f"Error loading progress from GitHub: {str(e)}")
             raise
     
-    def _save_progress_to_github(self):
-        """Save progress to GitHub repository."""
+    def _save_progress_to_github(self, blob):
+        """Save serialized progress to GitHub repository."""
         try:
             success, new_sha = self.github_client.update_file(
                 self.github_progress_key,
-                self.progress,
+                blob,
                 self.github_sha
             )
             
@@ -511,87 +1364,52 @@ class PropertyScraper:
         """
         logger.info("Fetching free proxies...")
         
-        working_proxies = []
-        
-        if len(working_proxies) < min_proxies:
-            try:
-                source_proxies = self._get_proxies_from_free_proxy_list()
-                new_working = self._test_proxies(source_proxies, max_workers, timeout, min_proxies - len(working_proxies))
-                working_proxies.extend(new_working)
-                logger.info(f"Found {len(new_working)} working proxies from free-proxy-list.net")
-            except Exception as e:
-                logger.error(f"Error fetching proxies from free-proxy-list.net: {str(e)}")
-        
-        if len(working_proxies) < min_proxies:
-            try:
-                source_proxies = self._get_proxies_from_geonode()
-                new_working = self._test_proxies(source_proxies, max_workers, timeout, min_proxies - len(working_proxies))
-                working_proxies.extend(new_working)
-                logger.info(f"Found {len(new_working)} working proxies from geonode")
-            except Exception as e:
-                logger.error(f"Error fetching proxies from geonode: {str(e)}")
-        
-        if len(working_proxies) < min_proxies:
-            try:
-                source_proxies = self._get_proxies_from_proxyscrape()
-                new_working = self._test_proxies(source_proxies, max_workers, timeout, min_proxies - len(working_proxies))
-                working_proxies.extend(new_working)
-                logger.info(f"Found {len(new_working)} working proxies from proxyscrape")
-            except Exception as e:
-                logger.error(f"Error fetching proxies from proxyscrape: {str(e)}")
+        # Fetch all sources at once, then test the combined list
+        sources = {
+            'free-proxy-list.net': self._get_proxies_from_free_proxy_list,
+            'geonode': self._get_proxies_from_geonode,
+            'proxyscrape': self._get_proxies_from_proxyscrape,
+        }
+        candidates = set()
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(sources)) as executor:
+            future_to_source = {executor.submit(fetch): name for name, fetch in sources.items()}
+            for future in concurrent.futures.as_completed(future_to_source):
+                name = future_to_source[future]
+                try:
+                    source_proxies = future.result()
+                    candidates.update(source_proxies)
+                    logger.info(f"Fetched {len(source_proxies)} proxies from {name}")
+                except Exception as e:
+                    logger.error(f"Error fetching proxies from {name}: {str(e)}")
         
-        return list(set(working_proxies))
+        working_proxies = self._test_proxies(list(candidates), max_workers, timeout, min_proxies)
+        logger.info(f"Found {len(working_proxies)} working proxies out of {len(candidates)} candidates")
+        return working_proxies
     
     def _get_proxies_from_free_proxy_list(self):
         """Scrape free proxies from free-proxy-list.net"""
         try:
+            # Only this proxy source parses HTML, so bs4 is imported on demand
+            from bs4 import BeautifulSoup
+            
             url = 'https://free-proxy-list.net/'
-            response = requests.get(url)
-            soup = BeautifulSoup(response.text, 'html.parser')
+            response = self._proxy_session.get(url)
+            soup = BeautifulSoup(response.text, 'lxml')
             
             proxies = []
-            proxy_table = soup.find('table', {'id': 'proxylisttable'})
-            
-            if proxy_table is None:
-                logger.warning("Could not find proxy table on free-proxy-list.net")
-                return proxies
-                
-            rows = []
-            try:
-                # Check if proxy_table is a proper BeautifulSoup element (not a NavigableString)
-                from bs4 import NavigableString
-                if proxy_table and not isinstance(proxy_table, NavigableString) and hasattr(proxy_table, 'find_all'):
-                    rows = proxy_table.find_all('tr')
-                else:
-                    logger.warning("Proxy table is not a valid BeautifulSoup element or doesn't have find_all method")
-                    return proxies  # Return empty list if we can't find rows
-            except Exception as e:
-                logger.warning(f"Could not find rows in proxy table: {str(e)}")
-                return proxies
+            # Header rows have no td cells and are skipped below
+            rows = soup.select('table#proxylisttable tr')
             
             if not rows:
-                logger.warning("No rows found in proxy table")
+                logger.warning("No rows found in proxy table on free-proxy-list.net")
                 return proxies
             
-            for row in rows[1:]:
-                # Check if row is a valid BeautifulSoup element
-                if isinstance(row, NavigableString) or not hasattr(row, 'find_all'):
-                    continue
-                    
+            for row in rows:
                 cells = row.find_all('td')
                 if len(cells) >= 7:  # Ensure we have enough cells
-                    # Get cell text safely
-                    def get_cell_text(cell):
-                        if isinstance(cell, NavigableString):
-                            return str(cell)
-                        elif isinstance(cell, Tag) and hasattr(cell, 'text'):
-                            return cell.text
-                        else:
-                            return ""
-                    
-                    ip = get_cell_text(cells[0])
-                    port = get_cell_text(cells[1])
-                    https = get_cell_text(cells[6])
+                    ip = cells[0].get_text()
+                    port = cells[1].get_text()
+                    https = cells[6].get_text()
                     
                     if ip and port:  # Make sure we have valid IP and port
                         if https == 'yes':
@@ -609,7 +1427,7 @@ class PropertyScraper:
     def _get_proxies_from_geonode(self):
         """Get free proxies from geonode API"""
         url = 'https://proxylist.geonode.com/api/proxy-list?limit=100&page=1&sort_by=lastChecked&sort_type=desc'
-        response = requests.get(url)
+        response = self._proxy_session.get(url)
         data = response.json()
         
         proxies = []
@@ -627,7 +1445,7 @@ class PropertyScraper:
     def _get_proxies_from_proxyscrape(self):
         """Get free proxies from proxyscrape"""
         url = 'https://api.proxyscrape.com/v2/?request=getproxies&protocol=http&timeout=10000&country=all&ssl=all&anonymity=all'
-        response = requests.get(url)
+        response = self._proxy_session.get(url)
         
         proxies = []
         for line in response.text.split('\n'):
@@ -654,7 +1472,8 @@ class PropertyScraper:
         working_proxies = []
         test_url = 'https://pay2igr.igrmaharashtra.gov.in/eDisplay/Propertydetails/index'
         
-        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
+        try:
             future_to_proxy = {executor.submit(self._is_proxy_working, proxy, test_url, timeout): proxy for proxy in proxies}
             
             for future in concurrent.futures.as_completed(future_to_proxy):
@@ -665,24 +1484,29 @@ class PropertyScraper:
                         logger.info(f"Found working proxy: {proxy}")
                         
                         if max_working and len(working_proxies) >= max_working:
-                            for f in future_to_proxy:
-                                f.cancel()
                             break
                 except Exception as e:
                     logger.debug(f"Error testing proxy {proxy}: {str(e)}")
+        finally:
+            # Drop the queued tests and don't wait for the ones in flight once enough proxies were found
+            executor.shutdown(wait=False, cancel_futures=True)
         
         return working_proxies
     
     def _is_proxy_working(self, proxy, test_url, timeout=5):
-        """Test if a proxy is working"""
+        """Test if a proxy is working, using a HEAD request so the page body is not transferred"""
         try:
             proxies = {
                 'http': proxy,
                 'https': proxy
             }
-            response = requests.get(test_url, proxies=proxies, timeout=timeout)
-            return response.status_code == 200
-        except:
+            response = self._proxy_session.head(test_url, proxies=proxies, timeout=timeout, allow_redirects=False)
+            if response.status_code in (405, 501):
+                # HEAD not supported, only read the status line of a GET
+                with self._proxy_session.get(test_url, proxies=proxies, timeout=timeout, stream=True) as response:
+                    return response.status_code == 200
+            return 200 <= response.status_code < 400
+        except Exception:
             return False
     
     def _setup_driver(self):
@@ -691,10 +1515,10 @@ class PropertyScraper:
             logger.info("Setting up Chrome WebDriver...")
             
             import undetected_chromedriver as uc
-            from selenium.webdriver.chrome.service import Service
             
             uc_options = uc.ChromeOptions()
-            # uc_options.add_argument("--headless=new")  # Run in new headless mode
+            if self.headless:
+                uc_options.add_argument("--headless=new")  # Run in new headless mode
             uc_options.add_argument("--disable-notifications")
             uc_options.add_argument("--disable-popup-blocking")
             uc_options.add_argument("--disable-extensions")
@@ -708,22 +1532,43 @@ class PropertyScraper:
             uc_options.add_argument("--disable-default-apps")
             uc_options.add_argument("--disable-gpu")
             uc_options.add_argument("--disable-browser-side-navigation")
+            uc_options.add_argument("--disable-background-networking")
+            uc_options.add_argument("--disable-features=Translate,MediaRouter")
             
             # Additional settings for better headless performance
             # uc_options.add_argument("--start-maximized")  # Removed maximization
             uc_options.add_argument("--force-device-scale-factor=1")
             uc_options.add_argument("--high-dpi-support=1")
             
-            if self.user_agents:
-                user_agent = random.choice(self.user_agents)
+            # Return from page loads at DOMContentLoaded instead of waiting for every image and script
+            uc_options.page_load_strategy = 'eager'
+            
+            # Save files the site sends as downloads straight to the download directory
+            uc_options.add_experimental_option("prefs", {
+                "download.default_directory": self.download_dir,
+                "download.prompt_for_download": False,
+            })
+            
+            if self._user_agent_cycle:
+                user_agent = next(self._user_agent_cycle)
                 uc_options.add_argument(f"--user-agent={user_agent}")
                 logger.info(f"Using user agent: {user_agent}")
             
+            # The PDF downloads of this worker go through the same proxy as its browser
+            if self._proxy_cycle:
+                proxy = next(self._proxy_cycle)
+                uc_options.add_argument(f"--proxy-server={proxy}")
+                self._http.proxies = {'http': proxy, 'https': proxy}
+                logger.info(f"Using proxy: {proxy}")
+            
             logger.info("Creating Chrome driver using undetected_chromedriver with enhanced settings")
             driver = uc.Chrome(options=uc_options)
             
             driver.set_page_load_timeout(30)
             
+            # Leave room for the longest _wait_for_selector timeout
+            driver.set_script_timeout(SCRIPT_TIMEOUT)
+            
             # Explicitly set window size after driver creation
             driver.set_window_size(1380, 900)
             
@@ -735,8 +1580,27 @@ class PropertyScraper:
             });
             """)
             
-            # Set implicit wait
-            driver.implicitly_wait(10)
+            # No implicit wait: every lookup that has to wait uses an explicit wait, and an implicit
+            # wait would make probes for missing elements block and mix unpredictably with those
+            driver.implicitly_wait(0)
+            
+            # Headless Chrome ignores the download preferences, so also allow downloads through DevTools
+            try:
+                driver.execute_cdp_cmd('Browser.setDownloadBehavior', {'behavior': 'allow', 'downloadPath': self.download_dir})
+            except Exception as e:
+                logger.warning(f"Could not set download directory: {str(e)}")
+            
+            # Skip fonts and trackers on every page load
+            if self.blocked_urls:
+                try:
+                    driver.execute_cdp_cmd('Network.enable', {})
+                    driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': self.blocked_urls})
+                    logger.info(f"Blocking {len(self.blocked_urls)} URL patterns")
+                except Exception as e:
+                    logger.warning(f"Could not block URLs: {str(e)}")
+            
+            with self._drivers_lock:
+                self._drivers.add(driver)
             
             logger.info("Chrome WebDriver set up successfully")
             return driver
@@ -776,19 +1640,14 @@ class PropertyScraper:
                 logger.error(f"Screenshot not found: {screenshot_path}")
                 return None
             
-            # Create save directory if it doesn't exist
             save_dir = "captcha_extracts"
-            if not os.path.exists(save_dir):
-                os.makedirs(save_dir)
-                logger.info(f"Created directory: {save_dir}")
             
             # Open the image
             image = Image.open(screenshot_path)
             logger.info(f"Image opened successfully: {image.format}, {image.size}, {image.mode}")
             
             # Crop the captcha area using the updated coordinates
-            captcha_area = (510, 560, 660, 610)
-            captcha_image = image.crop(captcha_area)
+            captcha_image = image.crop(CAPTCHA_AREA)
             captcha_filename = os.path.join(save_dir, f"captcha_{os.path.basename(screenshot_path)}")
             captcha_image.save(captcha_filename)
             logger.info(f"Saved captcha image to: {captcha_filename}")
@@ -799,8 +1658,8 @@ class PropertyScraper:
             gray.save(gray_filename)
             
             # Perform OCR with the best configuration
-            custom_config = r'--psm 6 -c tessedit_char_whitelist=0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz'
-            text = pytesseract.image_to_string(gray, config=custom_config).strip()
+            custom_config = r'--psm 7 -c tessedit_char_whitelist=0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz'
+            text = ocr_image(gray, config=custom_config).strip()
             
             if text:
                 logger.info(f"Successfully extracted captcha text: '{text}'")
@@ -813,26 +1672,133 @@ class PropertyScraper:
             logger.error(f"Error extracting captcha: {str(e)}")
             return None
     
-    def _handle_captcha(self, driver):
-        """Handle captcha solving using the improved screenshot method. Returns True if successful, False otherwise."""
-        try:
-            logger.info("Looking for captcha...")
-            
-            # Find the captcha image
-            captcha_img = WebDriverWait(driver, 20).until(
-                EC.presence_of_element_located((By.XPATH, "//img[contains(@src, 'captcha') or contains(@id, 'captcha') or contains(@class, 'captcha-image')]"))
-            )
+    def _prefetch_captcha(self, driver):
+        """
+        Start decoding the captcha in the background so OCR overlaps with the dropdown selections.
+        
+        The captcha element is captured on the calling thread since the WebDriver is not thread-safe;
+        only the OCR runs on the worker. The capture stays in memory.
+        
+        Args:
+            driver: Selenium WebDriver instance
+            
+        Returns:
+            tuple: (captcha_src, future) to pass to _handle_captcha, or None if prefetching failed
+        """
+        if not PYTESSERACT_AVAILABLE:
+            return None
+        
+        try:
+            captcha_img = self._wait_for_captcha_image(driver, timeout=10)
+            captcha_src = captcha_img.get_attribute("src")
+            
+            # Capture the element rather than cropping the page, which breaks once the page is scrolled
+            captcha_png = captcha_img.screenshot_as_png
+            
+            logger.info("Decoding captcha in the background")
+            return captcha_src, self._ocr_pool.submit(extract_captcha_from_png, captcha_png, int(time.time()))
+        except Exception as e:
+            logger.warning(f"Could not prefetch captcha: {str(e)}")
+            return None
+    
+    def _wait_for_selector(self, driver, css, timeout=10):
+        """
+        Return the first element matching a CSS selector as soon as it is added to the page.
+        
+        A MutationObserver in the page reports the element instead of polling for it. If the page
+        navigates while waiting, which ends the script, this falls back to a polling wait.
+        
+        Raises:
+            TimeoutException: If no element matches within timeout seconds
+        """
+        try:
+            element = driver.execute_async_script(_WAIT_FOR_SELECTOR_JS, css, timeout)
+        except TimeoutException:
+            raise
+        except WebDriverException:
+            return WebDriverWait(driver, timeout, poll_frequency=WAIT_POLL_FREQUENCY).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, css))
+            )
+        if element is None:
+            raise TimeoutException(f"No element matching {css} after {timeout}s")
+        return element
+    
+    def _wait_for_captcha_image(self, driver, timeout=20):
+        """
+        Return the captcha image element once it has finished loading.
+        
+        Pages load eagerly, so the image may still be downloading when the rest of the page is usable.
+        """
+        return WebDriverWait(driver, timeout, poll_frequency=WAIT_POLL_FREQUENCY).until(
+            lambda d: d.execute_script(_LOADED_IMAGE_JS, CAPTCHA_IMAGE_CSS)
+        )
+    
+    def _read_captcha_image(self, driver, captcha_img):
+        """
+        Return the captcha image as base64 PNG without downloading it again.
+        
+        The image is drawn onto a canvas in the page; if the canvas cannot be read, a screenshot
+        of just the captcha element is used instead.
+        """
+        try:
+            data = driver.execute_script("""
+                var img = arguments[0];
+                var canvas = document.createElement('canvas');
+                canvas.width = img.naturalWidth;
+                canvas.height = img.naturalHeight;
+                canvas.getContext('2d').drawImage(img, 0, 0);
+                return canvas.toDataURL('image/png').split(',')[1];
+            """, captcha_img)
+            if data:
+                return data
+        except WebDriverException as e:
+            logger.debug(f"Could not read captcha image from canvas: {str(e)}")
+        return captcha_img.screenshot_as_base64
+    
+    def _handle_captcha(self, driver, prefetched=None, retry=False):
+        """
+        Handle captcha solving using the improved screenshot method. Returns True if successful, False otherwise.
+        
+        Args:
+            driver: Selenium WebDriver instance
+            prefetched: Optional (captcha_src, future) returned by _prefetch_captcha
+            retry: True after the site rejected a captcha on this page. Screenshots saved earlier
+                still show the rejected captcha, so they are not read again
+        """
+        # Cache key and text of the answer entered, see _record_captcha_outcome
+        self._local.captcha_answer = None
+        try:
+            logger.info("Looking for captcha...")
+            
+            # Find the captcha image
+            captcha_img = self._wait_for_captcha_image(driver)
             
             driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", captcha_img)
-            time.sleep(2)  # Wait for scroll to complete
+            
+            captcha_text = None
+            cache_key = None
+            
+            # Use the background OCR result if the captcha has not been refreshed since
+            if prefetched:
+                prefetch_src, prefetch_future = prefetched
+                if captcha_img.get_attribute("src") == prefetch_src:
+                    try:
+                        captcha_text, cache_key = prefetch_future.result(timeout=30)
+                        if captcha_text:
+                            logger.info(f"Using prefetched captcha text: {captcha_text}")
+                    except Exception as prefetch_error:
+                        logger.warning(f"Prefetched captcha decoding failed: {str(prefetch_error)}")
+                else:
+                    logger.info("Captcha was refreshed since prefetch. Discarding prefetched result")
+                    prefetch_future.cancel()
             
             # Check if we have a district dropdown screenshot from this session
             timestamp = int(time.time())
-            district_screenshot_path = None
+            district_screenshot_path = getattr(self._local, 'district_screenshot', None)
             
-            # Look for the most recent after_district_*.png file
+            # Otherwise look for the most recent after_district_*.png file
             dropdown_debug_dir = "dropdown_debug"
-            if os.path.exists(dropdown_debug_dir):
+            if not district_screenshot_path and not retry and os.path.exists(dropdown_debug_dir):
                 district_screenshots = [f for f in os.listdir(dropdown_debug_dir) if f.startswith("after_district_") and f.endswith(".png")]
                 if district_screenshots:
                     # Sort by timestamp (newest first)
@@ -840,15 +1806,13 @@ class PropertyScraper:
                     district_screenshot_path = os.path.join(dropdown_debug_dir, district_screenshots[0])
                     logger.info(f"Found district screenshot: {district_screenshot_path}")
             
-            captcha_text = None
-            
             # If we have a district screenshot, extract the captcha from it using extract_captcha.py
-            if district_screenshot_path and os.path.exists(district_screenshot_path):
+            if not captcha_text and district_screenshot_path and os.path.exists(district_screenshot_path):
                 logger.info(f"Using existing district screenshot for captcha extraction: {district_screenshot_path}")
                 
                 # Use the integrated extract_captcha function
                 try:
-                    captcha_text = extract_captcha(district_screenshot_path)
+                    captcha_text, cache_key = extract_captcha(district_screenshot_path)
                     
                     if captcha_text:
                         logger.info(f"Successfully extracted captcha text using integrated extract_captcha function: {captcha_text}")
@@ -857,8 +1821,9 @@ class PropertyScraper:
                 except Exception as extract_error:
                     logger.error(f"Error using integrated extract_captcha function: {str(extract_error)}")
                     
-                    # Fallback to internal extraction method
+                    # Fallback to internal extraction method, whose text is not cached
                     captcha_text = self._extract_captcha_from_screenshot(district_screenshot_path)
+                    cache_key = None
                     if captcha_text:
                         logger.info(f"Successfully extracted captcha text using internal method: {captcha_text}")
                     else:
@@ -867,41 +1832,37 @@ class PropertyScraper:
             # If we couldn't extract from district screenshot or don't have one, use SolveCaptcha API
             if not captcha_text and self.captcha_api_key:
                 try:
-                    # Take a screenshot of the entire page
-                    full_screenshot = driver.get_screenshot_as_png()
-                    
-                    # Open the screenshot
-                    image = Image.open(BytesIO(full_screenshot))
-                    
-                    # Save the full screenshot for debugging
-                    os.makedirs("captcha_debug", exist_ok=True)
-                    full_path = f"captcha_debug/full_page_{timestamp}.png"
-                    image.save(full_path)
-                    logger.info(f"Saved full page screenshot to {full_path}")
+                    self._save_debug_screenshot(driver, f"captcha_debug/full_page_{timestamp}.png", "of the captcha page")
                     
-                    # Try to extract captcha from the full screenshot using integrated extract_captcha function
+                    # Read the captcha element itself; it was scrolled into view above, so fixed
+                    # page coordinates no longer land on it
                     try:
-                        captcha_text = extract_captcha(full_path)
+                        captcha_text, cache_key = extract_captcha_from_png(captcha_img.screenshot_as_png, timestamp)
                         if captcha_text:
-                            logger.info(f"Successfully extracted captcha text from full screenshot: {captcha_text}")
+                            logger.info(f"Successfully extracted captcha text from the captcha element: {captcha_text}")
                     except Exception as extract_error:
-                        logger.error(f"Error extracting captcha from full screenshot: {str(extract_error)}")
+                        logger.error(f"Error extracting captcha from the captcha element: {str(extract_error)}")
                     
                     # If extract_captcha.py failed, try SolveCaptcha API
                     if not captcha_text:
-                        # Initialize SolveCaptcha with API key from config
-                        solver = Solvecaptcha(self.captcha_api_key)
-                        
-                        # Convert image to base64
-                        img_byte_arr = BytesIO()
-                        image.save(img_byte_arr, format='PNG')
-                        img_byte_arr.seek(0)
-                        captcha_base64 = base64.b64encode(img_byte_arr.getvalue()).decode('utf-8')
-                        
-                        # Solve the captcha
-                        logger.info("Solving captcha with SolveCaptcha API...")
-                        captcha_text = solver.normal(captcha_base64)
-                        logger.info(f"Captcha solved with SolveCaptcha API: {captcha_text}")
+                        # Send only the captcha image, read from the page the browser already loaded
+                        captcha_base64 = self._read_captcha_image(driver, captcha_img)
+                        
+                        # The site often serves the same image again on retries, so reuse earlier answers
+                        # Like OCR results, the answer is only cached once the site accepts it
+                        cache_key = _captcha_cache_key(base64.b64decode(captcha_base64), prefix=CAPTCHA_API_KEY_PREFIX)
+                        captcha_text = _lookup_captcha_cache(cache_key)
+                        if captcha_text:
+                            logger.info(f"Reusing SolveCaptcha answer for an identical image: {captcha_text}")
+                        else:
+                            # Initialize SolveCaptcha with API key from config
+                            from solvecaptcha import Solvecaptcha
+                            solver = Solvecaptcha(self.captcha_api_key)
+                            
+                            # Solve the captcha
+                            logger.info("Solving captcha with SolveCaptcha API...")
+                            captcha_text = solver.normal(captcha_base64)
+                            logger.info(f"Captcha solved with SolveCaptcha API: {captcha_text}")
                 except Exception as solver_error:
                     logger.error(f"Error using SolveCaptcha API: {str(solver_error)}")
             
@@ -911,19 +1872,15 @@ class PropertyScraper:
                 return False
             
             # Find and fill the captcha input field
-            captcha_input = WebDriverWait(driver, 15).until(
-                EC.presence_of_element_located((By.XPATH, "//input[contains(@id, 'captcha') or contains(@name, 'captcha') or contains(@placeholder, 'captcha') or contains(@placeholder, 'Captcha')]"))
-            )
+            captcha_input = self._wait_for_selector(driver, CAPTCHA_INPUT_CSS, timeout=15)
             
             driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", captcha_input)
-            time.sleep(1)
             
             # Clear the input field
             try:
                 captcha_input.clear()
                 driver.execute_script("arguments[0].value = '';", captcha_input)
                 
-                from selenium.webdriver.common.keys import Keys
                 captcha_input.send_keys(Keys.CONTROL + "a")
                 captcha_input.send_keys(Keys.DELETE)
                 
@@ -934,23 +1891,28 @@ class PropertyScraper:
             # Enter the captcha text
             try:
                 captcha_input.click()
-                time.sleep(1)
                 
-                from selenium.webdriver.common.action_chains import ActionChains
                 actions = ActionChains(driver)
                 actions.move_to_element(captcha_input)
                 actions.click()
                 actions.send_keys(captcha_text)
                 actions.perform()
                 
-                driver.execute_script(f"arguments[0].value = '{captcha_text}';", captcha_input)
+                driver.execute_script("arguments[0].value = arguments[1];", captcha_input, captcha_text)
                 
                 logger.info(f"Entered captcha text: {captcha_text}")
+                self._local.captcha_answer = (cache_key, captcha_text)
             except Exception as input_error:
                 logger.warning(f"Error entering captcha text: {str(input_error)}")
                 return False
             
-            time.sleep(2)
+            # Make sure the value stuck instead of sleeping before the search is submitted
+            try:
+                WebDriverWait(driver, 2, poll_frequency=WAIT_POLL_FREQUENCY).until(
+                    lambda d: captcha_input.get_attribute("value") == captcha_text
+                )
+            except TimeoutException:
+                logger.warning("Captcha input does not hold the entered text")
             
             return True
             
@@ -964,14 +1926,8 @@ class PropertyScraper:
             logger.info(f"Selecting '{option_text}' from dropdown '{dropdown_id}'")
             
             # Take a screenshot before dropdown interaction
-            try:
-                os.makedirs("dropdown_debug", exist_ok=True)
-                timestamp = int(time.time())
-                screenshot_path = f"dropdown_debug/before_{dropdown_id}_{timestamp}.png"
-                driver.save_screenshot(screenshot_path)
-                logger.info(f"Saved screenshot before dropdown interaction: {screenshot_path}")
-            except Exception as ss_error:
-                logger.warning(f"Could not save screenshot: {str(ss_error)}")
+            timestamp = int(time.time())
+            self._save_debug_screenshot(driver, f"dropdown_debug/before_{dropdown_id}_{timestamp}.png", "before dropdown interaction")
             
             # Check if page is still valid before proceeding
             try:
@@ -985,10 +1941,9 @@ class PropertyScraper:
                 if not page_check:
                     logger.warning("Page appears to have changed or refreshed. Reloading...")
                     driver.get(self.base_url)
-                    time.sleep(5)  # Increased wait time after page reload
                     
                     # Wait for the page to be fully loaded
-                    WebDriverWait(driver, 20).until(
+                    WebDriverWait(driver, 20, poll_frequency=WAIT_POLL_FREQUENCY).until(
                         lambda d: d.execute_script("return document.readyState") == "complete"
                     )
                     logger.info("Page reloaded and ready")
@@ -1010,13 +1965,10 @@ class PropertyScraper:
                     logger.warning(f"Error in special year handling: {str(year_error)}")
             
             # Find the dropdown element
-            dropdown = WebDriverWait(driver, 20).until(
-                EC.presence_of_element_located((By.ID, dropdown_id))
-            )
+            dropdown = self._wait_for_selector(driver, f'[id="{dropdown_id}"]', timeout=20)
             
             # Scroll to the dropdown to make it visible
             driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", dropdown)
-            time.sleep(3)  # Wait longer for scroll to complete
             
             # Remove any overlays that might interfere with clicking
             try:
@@ -1033,141 +1985,146 @@ class PropertyScraper:
             # PRIORITIZE JAVASCRIPT APPROACH - Most reliable for dropdown selection
             select_success = False
             
+            # Start with the approach that worked last time for this dropdown, skipping the ones
+            # before it that failed then. If it fails too, the preference is dropped and the retry
+            # goes through all approaches again
+            with self._dropdown_click_strategy_lock:
+                preferred = self._dropdown_click_strategy.get(dropdown_id, 'js')
+            skipped = DROPDOWN_STRATEGIES[:DROPDOWN_STRATEGIES.index(preferred)]
+            winner = None
+            
             # JavaScript approach first - with enhanced event triggering
-            try:
-                logger.info("Trying enhanced JavaScript selection approach first")
-                # Get all options to find the matching one
-                options_data = driver.execute_script(f"""
-                    var select = document.getElementById('{dropdown_id}');
-                    var options = select.options;
-                    var result = [];
-                    for (var i = 0; i < options.length; i++) {{
-                        result.push({{
-                            text: options[i].text,
-                            value: options[i].value,
-                            index: i
-                        }});
-                    }}
-                    return result;
-                """)
+            if 'js' not in skipped:
+                try:
+                    logger.info("Trying enhanced JavaScript selection approach first")
+                    # Get all options to find the matching one
+                    options_data = driver.execute_script("""
+                        var select = document.getElementById(arguments[0]);
+                        var options = select.options;
+                        var result = [];
+                        for (var i = 0; i < options.length; i++) {
+                            result.push({
+                                text: options[i].text,
+                                value: options[i].value,
+                                index: i
+                            });
+                        }
+                        return result;
+                    """, dropdown_id)
                 
-                logger.info(f"Available options for {dropdown_id}: {[opt['text'] for opt in options_data]}")
+                    logger.info(f"Available options for {dropdown_id}: {[opt['text'] for opt in options_data]}")
                 
-                option_index = None
-                option_value = None
-                option_text_matched = None
+                    option_index = None
+                    option_value = None
+                    option_text_matched = None
                 
-                for opt in options_data:
-                    if opt['text'].strip() == option_text or option_text in opt['text'].strip():
-                        option_index = opt['index']
-                        option_value = opt['value']
-                        option_text_matched = opt['text']
-                        logger.info(f"Found matching option: index={option_index}, value={option_value}, text={option_text_matched}")
-                        break
+                    for opt in options_data:
+                        if opt['text'].strip() == option_text or option_text in opt['text'].strip():
+                            option_index = opt['index']
+                            option_value = opt['value']
+                            option_text_matched = opt['text']
+                            logger.info(f"Found matching option: index={option_index}, value={option_value}, text={option_text_matched}")
+                            break
                 
-                if option_index is not None:
-                    # Set the value and trigger multiple events for better compatibility
-                    driver.execute_script(f"""
-                        var select = document.getElementById('{dropdown_id}');
-                        select.selectedIndex = {option_index};
-                        select.value = '{option_value}';
+                    if option_index is not None:
+                        # Set the value and trigger multiple events for better compatibility
+                        driver.execute_script("""
+                            var select = document.getElementById(arguments[0]);
+                            select.selectedIndex = arguments[2];
+                            select.value = arguments[1];
                         
                         
                         
-                        var changeEvent = new Event('change', {{ bubbles: true }});
-                        select.dispatchEvent(changeEvent);
+                            var changeEvent = new Event('change', { bubbles: true });
+                            select.dispatchEvent(changeEvent);
                         
                         
-                        var inputEvent = new Event('input', {{ bubbles: true }});
-                        select.dispatchEvent(inputEvent);
+                            var inputEvent = new Event('input', { bubbles: true });
+                            select.dispatchEvent(inputEvent);
                         
                         
-                        var blurEvent = new Event('blur', {{ bubbles: true }});
-                        select.dispatchEvent(blurEvent);
+                            var blurEvent = new Event('blur', { bubbles: true });
+                            select.dispatchEvent(blurEvent);
                         
                         
-                        if (typeof jQuery !== 'undefined') {{
-                            try {{
-                                jQuery(select).trigger('change');
-                            }} catch(e) {{}}
-                        }}
+                            if (typeof jQuery !== 'undefined') {
+                                try {
+                                    jQuery(select).trigger('change');
+                                } catch(e) {}
+                            }
                         
-                        return select.selectedIndex;
-                    """)
+                            return select.selectedIndex;
+                        """, dropdown_id, option_value, option_index)
                     
-                    # Wait for the selection to take effect
-                    time.sleep(2)
+                        # Wait for the selection to take effect
+                        self._wait_for_ajax_idle(driver)
                     
-                    # Verify the selection was actually made
-                    current_selection = driver.execute_script(f"""
-                        var select = document.getElementById('{dropdown_id}');
-                        return select.options[select.selectedIndex].text;
-                    """)
+                        # Verify the selection was actually made
+                        current_selection = driver.execute_script("""
+                            var select = document.getElementById(arguments[0]);
+                            return select.options[select.selectedIndex].text;
+                        """, dropdown_id)
                     
-                    if current_selection and option_text_matched and (current_selection.strip() == option_text_matched.strip() or
-                                             option_text in current_selection):
-                        select_success = True
-                        logger.info(f"JavaScript selection verified with index: {option_index}, value: {option_value}")
-                        logger.info(f"Current selection: '{current_selection}'")
-                    else:
-                        logger.warning(f"JavaScript selection failed verification. Expected: '{option_text_matched}', Got: '{current_selection}'")
-                        # Try again with a more aggressive approach
-                        driver.execute_script(f"""
-                            var select = document.getElementById('{dropdown_id}');
+                        if current_selection and option_text_matched and (current_selection.strip() == option_text_matched.strip() or
+                                                 option_text in current_selection):
+                            select_success = True
+                            logger.info(f"JavaScript selection verified with index: {option_index}, value: {option_value}")
+                            logger.info(f"Current selection: '{current_selection}'")
+                        else:
+                            logger.warning(f"JavaScript selection failed verification. Expected: '{option_text_matched}', Got: '{current_selection}'")
+                            # Try again with a more aggressive approach
+                            driver.execute_script("""
+                                var select = document.getElementById(arguments[0]);
                             
                             
-                            select.selectedIndex = {option_index};
+                                select.selectedIndex = arguments[1];
                             
                             
-                            var evt = document.createEvent("HTMLEvents");
-                            evt.initEvent("change", true, true);
-                            select.dispatchEvent(evt);
+                                var evt = document.createEvent("HTMLEvents");
+                                evt.initEvent("change", true, true);
+                                select.dispatchEvent(evt);
                             
                             
-                            if (select.options[{option_index}]) {{
-                                select.options[{option_index}].selected = true;
-                                select.options[{option_index}].click();
-                            }}
-                        """)
-                        time.sleep(2)
+                                if (select.options[arguments[1]]) {
+                                    select.options[arguments[1]].selected = true;
+                                    select.options[arguments[1]].click();
+                                }
+                            """, dropdown_id, option_index)
+                            self._wait_for_ajax_idle(driver)
                         
-                        # Verify again
-                        current_selection = driver.execute_script(f"""
-                            var select = document.getElementById('{dropdown_id}');
-                            return select.options[select.selectedIndex].text;
-                        """)
+                            # Verify again
+                            current_selection = driver.execute_script("""
+                                var select = document.getElementById(arguments[0]);
+                                return select.options[select.selectedIndex].text;
+                            """, dropdown_id)
                         
-                        if current_selection and option_text_matched and (current_selection.strip() == option_text_matched.strip() or
-                                                option_text in current_selection):
-                            select_success = True
-                            logger.info(f"JavaScript aggressive selection verified. Current selection: '{current_selection}'")
-                else:
-                    logger.warning(f"Could not find option '{option_text}' in dropdown options via JavaScript")
-            except Exception as js_error:
-                logger.warning(f"JavaScript selection failed: {str(js_error)}")
+                            if current_selection and option_text_matched and (current_selection.strip() == option_text_matched.strip() or
+                                                    option_text in current_selection):
+                                select_success = True
+                                logger.info(f"JavaScript aggressive selection verified. Current selection: '{current_selection}'")
+                    else:
+                        logger.warning(f"Could not find option '{option_text}' in dropdown options via JavaScript")
+                except Exception as js_error:
+                    logger.warning(f"JavaScript selection failed: {str(js_error)}")
+                if select_success:
+                    winner = 'js'
             
             # Take a screenshot after JavaScript attempt
-            try:
-                screenshot_path = f"dropdown_debug/after_js_{dropdown_id}_{timestamp}.png"
-                driver.save_screenshot(screenshot_path)
-                logger.info(f"Saved screenshot after JavaScript attempt: {screenshot_path}")
-            except Exception as ss_error:
-                logger.warning(f"Could not save screenshot: {str(ss_error)}")
+            self._save_debug_screenshot(driver, f"dropdown_debug/after_js_{dropdown_id}_{timestamp}.png", "after JavaScript attempt")
             
             # If JavaScript approach failed, try Select class approach
-            if not select_success:
+            if not select_success and 'select' not in skipped:
                 try:
                     logger.info("Trying Select class approach")
                     select = Select(dropdown)
                     
                     # Get the current options to verify later
-                    options = select.options
-                    option_texts = [opt.text for opt in options]
+                    option_texts = driver.execute_script(_OPTION_TEXTS_JS, dropdown)
                     logger.info(f"Available options: {option_texts}")
                     
                     # Try exact match first
                     select.select_by_visible_text(option_text)
-                    time.sleep(2)
+                    self._wait_for_ajax_idle(driver)
                     
                     # Verify selection
                     selected_option = select.first_selected_option.text
@@ -1182,30 +2139,27 @@ class PropertyScraper:
                     
                     # Try selecting by partial text
                     try:
-                        options = select.options
-                        for option in options:
-                            if option_text in option.text:
-                                select.select_by_visible_text(option.text)
-                                time.sleep(2)
+                        for candidate_text in driver.execute_script(_OPTION_TEXTS_JS, dropdown):
+                            if option_text in candidate_text:
+                                select.select_by_visible_text(candidate_text)
+                                self._wait_for_ajax_idle(driver)
                                 
                                 # Verify selection
                                 selected_option = select.first_selected_option.text
-                                if selected_option == option.text:
+                                if selected_option == candidate_text:
                                     select_success = True
                                     logger.info(f"Select by partial text successful and verified: '{selected_option}'")
                                     break
                                 else:
-                                    logger.warning(f"Select by partial text failed verification. Expected: '{option.text}', Got: '{selected_option}'")
+                                    logger.warning(f"Select by partial text failed verification. Expected: '{candidate_text}', Got: '{selected_option}'")
                     except Exception as partial_error:
                         logger.warning(f"Select by partial text failed: {str(partial_error)}")
             
             # Take a screenshot after Select class attempt
-            try:
-                screenshot_path = f"dropdown_debug/after_select_class_{dropdown_id}_{timestamp}.png"
-                driver.save_screenshot(screenshot_path)
-                logger.info(f"Saved screenshot after Select class attempt: {screenshot_path}")
-            except Exception as ss_error:
-                logger.warning(f"Could not save screenshot: {str(ss_error)}")
+            if select_success and not winner:
+                winner = 'select'
+            
+            self._save_debug_screenshot(driver, f"dropdown_debug/after_select_class_{dropdown_id}_{timestamp}.png", "after Select class attempt")
             
             # If Select class approach failed, try direct click approach
             if not select_success:
@@ -1213,19 +2167,20 @@ class PropertyScraper:
                     logger.info("Trying direct click approach")
                     # Click on the dropdown to open it
                     driver.execute_script("arguments[0].click();", dropdown)
-                    time.sleep(1)
-                    
-                    # Try multiple XPath patterns to find the option
-                    option_xpaths = [
-                        f"//option[text()='{option_text}']",
-                        f"//select[@id='{dropdown_id}']/option[text()='{option_text}']",
-                        f"//select[@id='{dropdown_id}']/option[contains(text(), '{option_text}')]",
-                        f"//select[@id='{dropdown_id}']/option[normalize-space(text())='{option_text}']"
+                    
+                    # Try multiple XPath patterns to find the option, starting with the one that
+                    # found it last time. Indices into OPTION_XPATH_TEMPLATES are kept so the
+                    # winner is stored as the template it came from
+                    with self._dropdown_click_strategy_lock:
+                        preferred_template = self._dropdown_click_strategy.get((dropdown_id, 'xpath'), 0)
+                    template_order = [preferred_template] + [
+                        i for i in range(len(OPTION_XPATH_TEMPLATES)) if i != preferred_template
                     ]
                     
-                    for xpath in option_xpaths:
+                    for template_index in template_order:
+                        xpath = OPTION_XPATH_TEMPLATES[template_index].format(dropdown_id=dropdown_id, option_text=option_text)
                         try:
-                            option = WebDriverWait(driver, 5).until(
+                            option = WebDriverWait(driver, 5, poll_frequency=WAIT_POLL_FREQUENCY).until(
                                 EC.element_to_be_clickable((By.XPATH, xpath))
                             )
                             
@@ -1236,13 +2191,13 @@ class PropertyScraper:
                             try:
                                 # JavaScript click is most reliable
                                 driver.execute_script("arguments[0].click();", option)
-                                time.sleep(2)
+                                self._wait_for_ajax_idle(driver)
                                 
                                 # Verify selection
-                                selected_text = driver.execute_script(f"""
-                                    var select = document.getElementById('{dropdown_id}');
+                                selected_text = driver.execute_script("""
+                                    var select = document.getElementById(arguments[0]);
                                     return select.options[select.selectedIndex].text;
-                                """)
+                                """, dropdown_id)
                                 
                                 if selected_text == option_actual_text:
                                     select_success = True
@@ -1253,12 +2208,12 @@ class PropertyScraper:
                                     logger.warning(f"JavaScript click failed verification. Expected: '{option_actual_text}', Got: '{selected_text}'")
                                     
                                     # Try a more aggressive approach
-                                    driver.execute_script(f"""
-                                        var select = document.getElementById('{dropdown_id}');
+                                    driver.execute_script("""
+                                        var select = document.getElementById(arguments[0]);
                                         var options = select.options;
-                                        for (var i = 0; i < options.length; i++) {{
-                                            if (options[i].text === '{option_actual_text}' ||
-                                                options[i].text.includes('{option_text}')) {{
+                                        for (var i = 0; i < options.length; i++) {
+                                            if (options[i].text === arguments[1] ||
+                                                options[i].text.includes(arguments[2])) {
                                                 options[i].selected = true;
                                                 select.selectedIndex = i;
                                                 
@@ -1267,16 +2222,16 @@ class PropertyScraper:
                                                 evt.initEvent("change", true, true);
                                                 select.dispatchEvent(evt);
                                                 break;
-                                            }}
-                                        }}
-                                    """)
-                                    time.sleep(2)
+                                            }
+                                        }
+                                    """, dropdown_id, option_actual_text, option_text)
+                                    self._wait_for_ajax_idle(driver)
                                     
                                     # Verify again
-                                    selected_text = driver.execute_script(f"""
-                                        var select = document.getElementById('{dropdown_id}');
+                                    selected_text = driver.execute_script("""
+                                        var select = document.getElementById(arguments[0]);
                                         return select.options[select.selectedIndex].text;
-                                    """)
+                                    """, dropdown_id)
                                     
                                     if selected_text == option_actual_text or option_text in selected_text:
                                         select_success = True
@@ -1288,7 +2243,7 @@ class PropertyScraper:
                                 try:
                                     # Standard click
                                     option.click()
-                                    time.sleep(2)
+                                    self._wait_for_ajax_idle(driver)
                                     
                                     # Verify selection
                                     select = Select(dropdown)
@@ -1304,10 +2259,9 @@ class PropertyScraper:
                                     
                                     try:
                                         # Action chains click
-                                        from selenium.webdriver.common.action_chains import ActionChains
                                         actions = ActionChains(driver)
                                         actions.move_to_element(option).click().perform()
-                                        time.sleep(2)
+                                        self._wait_for_ajax_idle(driver)
                                         
                                         # Verify selection
                                         select = Select(dropdown)
@@ -1322,51 +2276,52 @@ class PropertyScraper:
                                         logger.warning(f"Action chains click failed: {str(action_error)}")
                         except Exception as option_find_error:
                             logger.warning(f"Could not find option with xpath {xpath}: {str(option_find_error)}")
+                    
+                    # The loop only stops early once the option was selected
+                    if select_success:
+                        winner = 'click'
+                        with self._dropdown_click_strategy_lock:
+                            self._dropdown_click_strategy[(dropdown_id, 'xpath')] = template_index
                 except Exception as direct_error:
                     logger.warning(f"Direct click approach failed: {str(direct_error)}")
             
             # Take a screenshot after all selection attempts
-            try:
-                screenshot_path = f"dropdown_debug/after_all_attempts_{dropdown_id}_{timestamp}.png"
-                driver.save_screenshot(screenshot_path)
-                logger.info(f"Saved screenshot after all selection attempts: {screenshot_path}")
-            except Exception as ss_error:
-                logger.warning(f"Could not save screenshot: {str(ss_error)}")
+            self._save_debug_screenshot(driver, f"dropdown_debug/after_all_attempts_{dropdown_id}_{timestamp}.png", "after all selection attempts")
             
             # Final fallback: try to select any non-default option if all else fails
             if not select_success:
                 try:
                     logger.info("Trying fallback: select any non-default option")
-                    result = driver.execute_script(f"""
-                        var select = document.getElementById('{dropdown_id}');
-                        if(select.options.length > 1) {{
+                    result = driver.execute_script("""
+                        var select = document.getElementById(arguments[0]);
+                        if(select.options.length > 1) {
                             select.selectedIndex = 1;  // Select the first non-default option
                             
                             // Trigger multiple events
-                            var changeEvent = new Event('change', {{ bubbles: true }});
+                            var changeEvent = new Event('change', { bubbles: true });
                             select.dispatchEvent(changeEvent);
                             
-                            var inputEvent = new Event('input', {{ bubbles: true }});
+                            var inputEvent = new Event('input', { bubbles: true });
                             select.dispatchEvent(inputEvent);
                             
-                            var blurEvent = new Event('blur', {{ bubbles: true }});
+                            var blurEvent = new Event('blur', { bubbles: true });
                             select.dispatchEvent(blurEvent);
                             
                             return select.options[1].text;
-                        }}
+                        }
                         return null;
-                    """)
+                    """, dropdown_id)
                     
                     if result:
                         select_success = True
                         logger.info(f"Fallback selection successful: selected first non-default option '{result}'")
                         
                         # Verify the selection was actually made
-                        time.sleep(2)
-                        current_selection = driver.execute_script(f"""
-                            var select = document.getElementById('{dropdown_id}');
+                        self._wait_for_ajax_idle(driver)
+                        current_selection = driver.execute_script("""
+                            var select = document.getElementById(arguments[0]);
                             return select.options[select.selectedIndex].text;
-                        """)
+                        """, dropdown_id)
                         
                         if current_selection == result:
                             logger.info(f"Fallback selection verified: '{current_selection}'")
@@ -1375,22 +2330,22 @@ class PropertyScraper:
                 except Exception as fallback_error:
                     logger.warning(f"Fallback selection failed: {str(fallback_error)}")
             
-            # Wait longer for the selection to take effect and for any dependent dropdowns to be populated
-            time.sleep(5)
+            # Wait for the selection's change handlers to finish populating any dependent dropdowns
+            self._wait_for_ajax_idle(driver)
             
             # Final verification - check if the dropdown has a selected value that's not the default
             try:
-                final_selection = driver.execute_script(f"""
-                    var select = document.getElementById('{dropdown_id}');
-                    if (select.selectedIndex > 0) {{
-                        return {{
+                final_selection = driver.execute_script("""
+                    var select = document.getElementById(arguments[0]);
+                    if (select.selectedIndex > 0) {
+                        return {
                             success: true,
                             text: select.options[select.selectedIndex].text,
                             index: select.selectedIndex
-                        }};
-                    }}
-                    return {{ success: false }};
-                """)
+                        };
+                    }
+                    return { success: false };
+                """, dropdown_id)
                 
                 if final_selection and final_selection.get('success'):
                     select_success = True
@@ -1401,6 +2356,12 @@ class PropertyScraper:
             except Exception as verify_error:
                 logger.warning(f"Final verification error: {str(verify_error)}")
             
+            with self._dropdown_click_strategy_lock:
+                if select_success and winner:
+                    self._dropdown_click_strategy[dropdown_id] = winner
+                else:
+                    self._dropdown_click_strategy.pop(dropdown_id, None)
+            
             if select_success:
                 logger.info(f"Successfully selected '{option_text}' from dropdown '{dropdown_id}'")
                 return True
@@ -1416,7 +2377,7 @@ class PropertyScraper:
                     # Refresh the page before retrying
                     try:
                         driver.get(driver.current_url)
-                        time.sleep(3)
+                        self._wait_for_ajax_idle(driver)
                     except Exception as refresh_error:
                         logger.warning(f"Error refreshing page: {str(refresh_error)}")
                     
@@ -1433,30 +2394,25 @@ class PropertyScraper:
                 try:
                     logger.info("Attempting last-resort approach for year dropdown")
                     # Try to directly set the value using executeScript with no verification
-                    driver.execute_script(f"""
+                    driver.execute_script("""
                         var yearSelect = document.getElementById('year');
-                        if (yearSelect) {{
+                        if (yearSelect) {
                             // Find the option with the text
-                            for (var i = 0; i < yearSelect.options.length; i++) {{
-                                if (yearSelect.options[i].text === '{option_text}' ||
-                                    yearSelect.options[i].text.includes('{option_text}')) {{
+                            for (var i = 0; i < yearSelect.options.length; i++) {
+                                if (yearSelect.options[i].text === arguments[0] ||
+                                    yearSelect.options[i].text.includes(arguments[0])) {
                                     yearSelect.selectedIndex = i;
-                                    yearSelect.dispatchEvent(new Event('change', {{ bubbles: true }}));
+                                    yearSelect.dispatchEvent(new Event('change', { bubbles: true }));
                                     break;
-                                }}
-                            }}
-                        }}
-                    """)
-                    time.sleep(3)
+                                }
+                            }
+                        }
+                    """, option_text)
+                    self._wait_for_ajax_idle(driver)
                     logger.info("Last-resort year selection attempt completed")
                     
                     # Take a screenshot after last resort attempt
-                    try:
-                        screenshot_path = f"dropdown_debug/last_resort_{dropdown_id}_{int(time.time())}.png"
-                        driver.save_screenshot(screenshot_path)
-                        logger.info(f"Saved screenshot after last resort attempt: {screenshot_path}")
-                    except Exception:
-                        pass
+                    self._save_debug_screenshot(driver, f"dropdown_debug/last_resort_{dropdown_id}_{int(time.time())}.png", "after last resort attempt")
                     
                     # Return true to allow the process to continue
                     # We'll handle verification at a higher level
@@ -1473,7 +2429,7 @@ class PropertyScraper:
                 # Refresh the page before retrying
                 try:
                     driver.get(driver.current_url)
-                    time.sleep(3)
+                    self._wait_for_ajax_idle(driver)
                 except Exception as refresh_error:
                     logger.warning(f"Error refreshing page: {str(refresh_error)}")
                 
@@ -1492,16 +2448,15 @@ class PropertyScraper:
             # Approach 1: Direct XPath selection of the option
             try:
                 logger.info("Approach 1: Direct XPath selection")
-                year_option = WebDriverWait(driver, 5).until(
+                year_option = WebDriverWait(driver, 5, poll_frequency=WAIT_POLL_FREQUENCY).until(
                     EC.element_to_be_clickable((By.XPATH, f"//select[@id='year']/option[text()='{year_text}']"))
                 )
                 year_option.click()
-                time.sleep(2)
+                self._wait_for_ajax_idle(driver)
                 logger.info("Approach 1 completed")
                 
                 # Take a screenshot
-                screenshot_path = f"dropdown_debug/year_approach1_{timestamp}.png"
-                driver.save_screenshot(screenshot_path)
+                self._save_debug_screenshot(driver, f"dropdown_debug/year_approach1_{timestamp}.png", "after year approach 1")
                 
                 # Verify selection
                 current_year = driver.execute_script("""
@@ -1518,27 +2473,24 @@ class PropertyScraper:
             # Approach 2: Use Select class with explicit wait
             try:
                 logger.info("Approach 2: Select class with explicit wait")
-                year_dropdown = WebDriverWait(driver, 10).until(
+                year_dropdown = WebDriverWait(driver, 10, poll_frequency=WAIT_POLL_FREQUENCY).until(
                     EC.presence_of_element_located((By.ID, "year"))
                 )
                 
                 # Ensure the dropdown is visible and clickable
                 driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", year_dropdown)
-                time.sleep(2)
                 
                 # Click to activate the dropdown
                 driver.execute_script("arguments[0].click();", year_dropdown)
-                time.sleep(1)
                 
                 # Use Select class
                 select = Select(year_dropdown)
                 select.select_by_visible_text(year_text)
-                time.sleep(2)
+                self._wait_for_ajax_idle(driver)
                 logger.info("Approach 2 completed")
                 
                 # Take a screenshot
-                screenshot_path = f"dropdown_debug/year_approach2_{timestamp}.png"
-                driver.save_screenshot(screenshot_path)
+                self._save_debug_screenshot(driver, f"dropdown_debug/year_approach2_{timestamp}.png", "after year approach 2")
                 
                 # Verify selection
                 current_year = select.first_selected_option.text
@@ -1585,35 +2537,34 @@ class PropertyScraper:
                 
                 if option_index is not None:
                     # Set the selection using JavaScript
-                    driver.execute_script(f"""
+                    driver.execute_script("""
                         var select = document.getElementById('year');
-                        select.selectedIndex = {option_index};
+                        select.selectedIndex = arguments[0];
                         
                         
-                        var changeEvent = new Event('change', {{ bubbles: true }});
+                        var changeEvent = new Event('change', { bubbles: true });
                         select.dispatchEvent(changeEvent);
                         
-                        var inputEvent = new Event('input', {{ bubbles: true }});
+                        var inputEvent = new Event('input', { bubbles: true });
                         select.dispatchEvent(inputEvent);
                         
-                        var clickEvent = new MouseEvent('click', {{
+                        var clickEvent = new MouseEvent('click', {
                             bubbles: true,
                             cancelable: true,
                             view: window
-                        }});
+                        });
                         select.dispatchEvent(clickEvent);
                         
                         
-                        if (select.options[{option_index}]) {{
-                            select.options[{option_index}].selected = true;
-                        }}
-                    """)
-                    time.sleep(3)
+                        if (select.options[arguments[0]]) {
+                            select.options[arguments[0]].selected = true;
+                        }
+                    """, option_index)
+                    self._wait_for_ajax_idle(driver)
                     logger.info("Approach 3 completed")
                     
                     # Take a screenshot
-                    screenshot_path = f"dropdown_debug/year_approach3_{timestamp}.png"
-                    driver.save_screenshot(screenshot_path)
+                    self._save_debug_screenshot(driver, f"dropdown_debug/year_approach3_{timestamp}.png", "after year approach 3")
                     
                     # Verify selection
                     current_year = driver.execute_script("""
@@ -1632,30 +2583,27 @@ class PropertyScraper:
             # Approach 4: Try using ActionChains
             try:
                 logger.info("Approach 4: ActionChains approach")
-                from selenium.webdriver.common.action_chains import ActionChains
                 
-                year_dropdown = WebDriverWait(driver, 10).until(
+                year_dropdown = WebDriverWait(driver, 10, poll_frequency=WAIT_POLL_FREQUENCY).until(
                     EC.presence_of_element_located((By.ID, "year"))
                 )
                 
                 # Create action chains
                 actions = ActionChains(driver)
                 actions.move_to_element(year_dropdown).click().perform()
-                time.sleep(1)
                 
                 # Find the option
-                year_option = WebDriverWait(driver, 5).until(
+                year_option = WebDriverWait(driver, 5, poll_frequency=WAIT_POLL_FREQUENCY).until(
                     EC.element_to_be_clickable((By.XPATH, f"//select[@id='year']/option[text()='{year_text}']"))
                 )
                 
                 # Click the option
                 actions.move_to_element(year_option).click().perform()
-                time.sleep(2)
+                self._wait_for_ajax_idle(driver)
                 logger.info("Approach 4 completed")
                 
                 # Take a screenshot
-                screenshot_path = f"dropdown_debug/year_approach4_{timestamp}.png"
-                driver.save_screenshot(screenshot_path)
+                self._save_debug_screenshot(driver, f"dropdown_debug/year_approach4_{timestamp}.png", "after year approach 4")
                 
                 # Verify selection
                 select = Select(year_dropdown)
@@ -1672,26 +2620,26 @@ class PropertyScraper:
                 
                 # This approach uses a mutation observer to detect changes to the dropdown
                 # and ensures the selection is maintained
-                result = driver.execute_script(f"""
-                    return (function() {{
+                result = driver.execute_script("""
+                    return (function() {
                         var yearSelect = document.getElementById('year');
-                        if (!yearSelect) {{
+                        if (!yearSelect) {
                             yearSelect = document.querySelector('select[id*="year"]');
-                            if (!yearSelect) {{
+                            if (!yearSelect) {
                                 yearSelect = document.querySelector('select[name*="year"]');
-                            }}
-                        }}
+                            }
+                        }
                         
                         if (!yearSelect) return false;
                         
                         
                         var targetIndex = -1;
-                        for (var i = 0; i < yearSelect.options.length; i++) {{
-                            if (yearSelect.options[i].text === '{year_text}') {{
+                        for (var i = 0; i < yearSelect.options.length; i++) {
+                            if (yearSelect.options[i].text === arguments[0]) {
                                 targetIndex = i;
                                 break;
-                            }}
-                        }}
+                            }
+                        }
                         
                         if (targetIndex === -1) return false;
                         
@@ -1699,41 +2647,40 @@ class PropertyScraper:
                         yearSelect.selectedIndex = targetIndex;
                         
                         
-                        var observer = new MutationObserver(function(mutations) {{
+                        var observer = new MutationObserver(function(mutations) {
                             yearSelect.selectedIndex = targetIndex;
-                        }});
+                        });
                         
                         
-                        observer.observe(yearSelect, {{
+                        observer.observe(yearSelect, {
                             attributes: true,
                             childList: true,
                             subtree: true
-                        }});
+                        });
                         
                         
-                        yearSelect.dispatchEvent(new Event('change', {{ bubbles: true }}));
-                        yearSelect.dispatchEvent(new Event('input', {{ bubbles: true }}));
-                        yearSelect.dispatchEvent(new MouseEvent('click', {{
+                        yearSelect.dispatchEvent(new Event('change', { bubbles: true }));
+                        yearSelect.dispatchEvent(new Event('input', { bubbles: true }));
+                        yearSelect.dispatchEvent(new MouseEvent('click', {
                             bubbles: true,
                             cancelable: true,
                             view: window
-                        }}));
+                        }));
                         
                         
-                        setTimeout(function() {{
+                        setTimeout(function() {
                             observer.disconnect();
-                        }}, 1000);
+                        }, 1000);
                         
                         return yearSelect.options[targetIndex].text;
-                    }})();
-                """)
+                    }).apply(null, arguments);
+                """, year_text)
                 
                 logger.info(f"Approach 5 result: {result}")
                 
                 if result and result == year_text:
                     # Take a screenshot
-                    screenshot_path = f"dropdown_debug/year_approach5_{timestamp}.png"
-                    driver.save_screenshot(screenshot_path)
+                    self._save_debug_screenshot(driver, f"dropdown_debug/year_approach5_{timestamp}.png", "after year approach 5")
                     logger.info(f"Approach 5 successful: {result}")
                     return True
             except Exception as e:
@@ -1744,7 +2691,7 @@ class PropertyScraper:
                 logger.info(f"All approaches failed. Refreshing page and retrying... ({max_retries} retries left)")
                 try:
                     driver.get(driver.current_url)
-                    time.sleep(3)
+                    self._wait_for_ajax_idle(driver)
                     return self._select_year_dropdown(driver, year_text, timestamp, max_retries - 1)
                 except Exception as refresh_error:
                     logger.warning(f"Error refreshing page: {str(refresh_error)}")
@@ -1782,19 +2729,19 @@ class PropertyScraper:
             for dropdown_id in current_selections.keys():
                 try:
                     # Check if the dropdown exists
-                    dropdown_exists = driver.execute_script(f"""
-                        return document.getElementById('{dropdown_id}') !== null;
-                    """)
+                    dropdown_exists = driver.execute_script("""
+                        return document.getElementById(arguments[0]) !== null;
+                    """, dropdown_id)
                     
                     if dropdown_exists:
                         # Get the current selection
-                        selection = driver.execute_script(f"""
-                            var select = document.getElementById('{dropdown_id}');
-                            if (select && select.selectedIndex >= 0) {{
+                        selection = driver.execute_script("""
+                            var select = document.getElementById(arguments[0]);
+                            if (select && select.selectedIndex >= 0) {
                                 return select.options[select.selectedIndex].text;
-                            }}
+                            }
                             return null;
-                        """)
+                        """, dropdown_id)
                         
                         current_selections[dropdown_id] = selection
                         logger.info(f"Current selection for {dropdown_id}: {selection}")
@@ -1953,36 +2900,30 @@ class PropertyScraper:
                 timestamp = int(time.time())
             
             # Take a screenshot before manipulation
-            try:
-                os.makedirs("dropdown_debug", exist_ok=True)
-                screenshot_path = f"dropdown_debug/before_force_{dropdown_id}_{timestamp}.png"
-                driver.save_screenshot(screenshot_path)
-                logger.info(f"Saved screenshot before forced selection: {screenshot_path}")
-            except Exception as ss_error:
-                logger.warning(f"Could not save screenshot: {str(ss_error)}")
+            self._save_debug_screenshot(driver, f"dropdown_debug/before_force_{dropdown_id}_{timestamp}.png", "before forced selection")
             
             # Get all options and find the target option
-            options_data = driver.execute_script(f"""
-            var select = document.getElementById('{dropdown_id}');
-            if (!select) {{
-                select = document.querySelector('select[id*="{dropdown_id}"]');
-                if (!select) {{
-                    select = document.querySelector('select[name*="{dropdown_id}"]');
-                }}
-            }}
+            options_data = driver.execute_script("""
+            var select = document.getElementById(arguments[0]);
+            if (!select) {
+                select = document.querySelector('select[id*="' + arguments[0] + '"]');
+                if (!select) {
+                    select = document.querySelector('select[name*="' + arguments[0] + '"]');
+                }
+            }
             
             if (!select) return null;
             
             var options = [];
-            for (var i = 0; i < select.options.length; i++) {{
-                options.push({{
+            for (var i = 0; i < select.options.length; i++) {
+                options.push({
                     text: select.options[i].text,
                     value: select.options[i].value,
                     index: i
-                }});
-            }}
+                });
+            }
             return options;
-        """)
+        """, dropdown_id)
             
             if not options_data:
                 logger.error(f"Could not find dropdown with ID '{dropdown_id}'")
@@ -2019,21 +2960,21 @@ class PropertyScraper:
                 return False
             
             # Apply multiple techniques to force the selection
-            result = driver.execute_script(f"""
-                return (function() {{
-                    var select = document.getElementById('{dropdown_id}');
-                    if (!select) {{
-                        select = document.querySelector('select[id*="{dropdown_id}"]');
-                        if (!select) {{
-                            select = document.querySelector('select[name*="{dropdown_id}"]');
-                        }}
-                    }}
+            result = driver.execute_script("""
+                return (function() {
+                    var select = document.getElementById(arguments[0]);
+                    if (!select) {
+                        select = document.querySelector('select[id*="' + arguments[0] + '"]');
+                        if (!select) {
+                            select = document.querySelector('select[name*="' + arguments[0] + '"]');
+                        }
+                    }
                     
                     if (!select) return false;
                     
-                    var targetIndex = {target_option['index']};
-                    var targetText = "{target_option['text']}";
-                    var targetValue = "{target_option['value']}";
+                    var targetIndex = arguments[1];
+                    var targetText = arguments[2];
+                    var targetValue = arguments[3];
                     
                     
                     select.selectedIndex = targetIndex;
@@ -2041,50 +2982,45 @@ class PropertyScraper:
                     
                     
                     var events = ['change', 'input', 'blur'];
-                    events.forEach(function(eventType) {{
-                        var event = new Event(eventType, {{ bubbles: true }});
+                    events.forEach(function(eventType) {
+                        var event = new Event(eventType, { bubbles: true });
                         select.dispatchEvent(event);
-                    }});
+                    });
                     
                     
-                    if (typeof jQuery !== 'undefined') {{
-                        try {{
+                    if (typeof jQuery !== 'undefined') {
+                        try {
                             jQuery(select).val(targetValue).trigger('change');
-                        }} catch(e) {{}}
-                    }}
+                        } catch(e) {}
+                    }
                     
                     
-                    var observer = new MutationObserver(function() {{
+                    var observer = new MutationObserver(function() {
                         select.selectedIndex = targetIndex;
-                    }});
+                    });
                     
-                    observer.observe(select, {{
+                    observer.observe(select, {
                         attributes: true,
                         childList: false,
                         subtree: false
-                    }});
+                    });
                     
                     
-                    setTimeout(function() {{
+                    setTimeout(function() {
                         observer.disconnect();
-                    }}, 2000);
+                    }, 2000);
                     
                     
-                    return {{
+                    return {
                         success: select.selectedIndex === targetIndex,
                         text: select.options[select.selectedIndex].text,
                         index: select.selectedIndex
-                    }};
-                }})();
-            """)
+                    };
+                }).apply(null, arguments);
+            """, dropdown_id, target_option['index'], target_option['text'], target_option['value'])
             
             # Take a screenshot after manipulation
-            try:
-                screenshot_path = f"dropdown_debug/after_force_{dropdown_id}_{timestamp}.png"
-                driver.save_screenshot(screenshot_path)
-                logger.info(f"Saved screenshot after forced selection: {screenshot_path}")
-            except Exception as ss_error:
-                logger.warning(f"Could not save screenshot: {str(ss_error)}")
+            self._save_debug_screenshot(driver, f"dropdown_debug/after_force_{dropdown_id}_{timestamp}.png", "after forced selection")
             
             if result and result.get('success'):
                 logger.info(f"Successfully forced selection: '{result.get('text')}' at index {result.get('index')}")
@@ -2097,6 +3033,160 @@ class PropertyScraper:
             logger.error(f"Error forcing dropdown selection: {str(e)}")
             return False
     
+    def _wait_for_dropdown_options(self, driver, dropdown_id, timeout=5):
+        """Wait until a dropdown has been populated with more than the default option."""
+        try:
+            WebDriverWait(driver, timeout, poll_frequency=WAIT_POLL_FREQUENCY).until(
+                lambda d: d.execute_script(
+                    "var select = document.getElementById(arguments[0]); return select && select.options.length > 1;",
+                    dropdown_id
+                )
+            )
+            return True
+        except TimeoutException:
+            logger.warning(f"Timed out waiting for options in dropdown '{dropdown_id}'")
+            return False
+    
+    def _get_select_options(self, driver, dropdown, dropdown_id, *parents):
+        """
+        Return the option texts of a dropdown without the '--Select' placeholder.
+        
+        The options only depend on the selections in the parent dropdowns, so they are read with one
+        script call the first time and then served from the cache for the same parent selections.
+        """
+        key = (dropdown_id,) + parents
+        with self._dropdown_options_lock:
+            options = self._dropdown_options_cache.get(key)
+            if options is not None:
+                self._dropdown_options_cache.move_to_end(key)
+                return options
+        
+        # Read outside the lock, so other workers are not held up by this browser call
+        texts = driver.execute_script(_OPTION_TEXTS_JS, dropdown)
+        options = [text for text in texts if text.strip() and not text.startswith("--Select")]
+        if options:
+            with self._dropdown_options_lock:
+                self._dropdown_options_cache[key] = options
+                if len(self._dropdown_options_cache) > DROPDOWN_OPTIONS_CACHE_SIZE:
+                    self._dropdown_options_cache.popitem(last=False)
+        return options
+    
+    def _get_option_count(self, driver, dropdown_id):
+        """Return the number of options in a dropdown, or 0 if it does not exist."""
+        return driver.execute_script(
+            "var select = document.getElementById(arguments[0]); return select ? select.options.length : 0;",
+            dropdown_id
+        )
+    
+    def _wait_for_dependent_dropdown(self, driver, dropdown_id, prev_option_count, timeout=10):
+        """Wait for a dependent dropdown's option count to change after its parent was selected."""
+        try:
+            WebDriverWait(driver, timeout, poll_frequency=WAIT_POLL_FREQUENCY).until(
+                lambda d: self._get_option_count(d, dropdown_id) != prev_option_count
+            )
+            return True
+        except TimeoutException:
+            logger.warning(f"Timed out waiting for dropdown '{dropdown_id}' to be repopulated")
+            return False
+    
+    def _save_debug_screenshot(self, driver, screenshot_path, description):
+        """Save a screenshot for debugging dropdown and page handling, if debug_screenshots is enabled."""
+        if not self.debug_screenshots:
+            return
+        try:
+            driver.save_screenshot(screenshot_path)
+            logger.info(f"Saved screenshot {description}: {screenshot_path}")
+        except Exception as ss_error:
+            logger.warning(f"Could not save screenshot: {str(ss_error)}")
+    
+    def _wait_for_ajax_idle(self, driver, timeout=10):
+        """Wait until the page has loaded and jQuery has no AJAX requests in flight."""
+        try:
+            WebDriverWait(driver, timeout, poll_frequency=WAIT_POLL_FREQUENCY).until(
+                lambda d: d.execute_script(
+                    "return document.readyState === 'complete' && "
+                    "(typeof jQuery === 'undefined' || jQuery.active === 0);"
+                )
+            )
+            return True
+        except TimeoutException:
+            logger.warning("Timed out waiting for pending AJAX requests to finish")
+            return False
+    
+    def _find_doc_input(self, driver, timeout=5):
+        """Find the document number input with one compound CSS lookup, falling back to the label XPaths."""
+        try:
+            return self._wait_for_selector(driver, DOC_INPUT_CSS, timeout)
+        except TimeoutException:
+            pass
+        
+        inputs = driver.find_elements(By.XPATH, DOC_INPUT_LABEL_XPATH)
+        return inputs[0] if inputs else None
+    
+    def _click_search_button(self, driver):
+        """
+        Click the search button. Returns False if no locator finds it.
+        
+        The locator that found the button is remembered per thread and tried first next time, so a
+        page that only matches a later locator does not wait for the earlier ones on every search.
+        """
+        cached = getattr(self._local, 'search_button_locator', None)
+        locators = SEARCH_BUTTON_LOCATORS
+        if cached:
+            locators = [cached] + [locator for locator in locators if locator != cached]
+        
+        for i, locator in enumerate(locators):
+            try:
+                search_button = WebDriverWait(driver, 10 if i == 0 else 2, poll_frequency=WAIT_POLL_FREQUENCY).until(
+                    EC.element_to_be_clickable(locator)
+                )
+                search_button.click()
+            except Exception as search_error:
+                logger.warning(f"Could not click search button located by {locator[1]}: {str(search_error)}")
+                continue
+            
+            self._local.search_button_locator = locator
+            logger.info("Clicked search button")
+            return True
+        return False
+    
+    def _fill_form_fast(self, driver, year, district, taluka, village, doc_number):
+        """
+        Fill the search form with one script call per dropdown instead of the interactive selection.
+        
+        Dropdowns that already hold the wanted value are left alone. Returns False as soon as an
+        option is missing or a dependent dropdown does not repopulate, so the caller can fall back
+        to _select_dropdown_option.
+        """
+        # Year repopulates the district options without them being cleared first, so the old
+        # options are still there right after the change and have to be waited out
+        cascade = [("year", year, None), ("district", district, "taluka"), ("taluka", taluka, "village")]
+        for dropdown_id, option_text, dependent_id in cascade:
+            next_id = dependent_id or "district"
+            if dependent_id is None:
+                prev_option_count = self._get_option_count(driver, next_id)
+            changed = driver.execute_script(_SELECT_OPTION_JS, dropdown_id, option_text, dependent_id)
+            if changed is None:
+                logger.info(f"Option '{option_text}' not found in dropdown '{dropdown_id}'")
+                return False
+            if not changed:
+                continue
+            if dependent_id is None and not self._wait_for_dependent_dropdown(driver, next_id, prev_option_count, timeout=5):
+                # The new list may have as many options as the old one; wait for its request instead
+                self._wait_for_ajax_idle(driver)
+            if not self._wait_for_dropdown_options(driver, next_id, timeout=10):
+                return False
+        
+        if driver.execute_script(_SELECT_OPTION_JS, "village", village, None) is None:
+            logger.info(f"Option '{village}' not found in dropdown 'village'")
+            return False
+        if not driver.execute_script(_SET_DOC_NUMBER_JS, DOC_INPUT_CSS, str(doc_number)):
+            logger.info("Document number input not found")
+            return False
+        
+        logger.info(f"Filled search form: {year}, {district}, {taluka}, {village}, doc#={doc_number!r}")
+        return True
+    
     def _verify_dropdown_dependency(self, driver, parent_dropdown_id, child_dropdown_id, timeout=10):
         """
         Verify that selecting an option in the parent dropdown has populated the child dropdown.
@@ -2113,18 +3203,8 @@ class PropertyScraper:
         try:
             logger.info(f"Verifying that selecting from '{parent_dropdown_id}' populated '{child_dropdown_id}'")
             
-            # Wait for the child dropdown to be present
-            WebDriverWait(driver, timeout).until(
-                EC.presence_of_element_located((By.ID, child_dropdown_id))
-            )
-            
-            # Check if the child dropdown has options
-            has_options = driver.execute_script(f"""
-                var select = document.getElementById('{child_dropdown_id}');
-                return select && select.options.length > 1;  
-            """)
-            
-            if has_options:
+            # Wait for the child dropdown to be populated
+            if self._wait_for_dropdown_options(driver, child_dropdown_id, timeout):
                 logger.info(f"Verification successful: '{child_dropdown_id}' has been populated")
                 return True
             else:
@@ -2132,34 +3212,27 @@ class PropertyScraper:
                 logger.warning(f"Verification failed: '{child_dropdown_id}' has not been populated")
                 
                 # Try to trigger the change event on the parent dropdown again
-                driver.execute_script(f"""
-                    var select = document.getElementById('{parent_dropdown_id}');
-                    if (select) {{
+                driver.execute_script("""
+                    var select = document.getElementById(arguments[0]);
+                    if (select) {
                         
-                        var changeEvent = new Event('change', {{ bubbles: true }});
+                        var changeEvent = new Event('change', { bubbles: true });
                         select.dispatchEvent(changeEvent);
                         
-                        var inputEvent = new Event('input', {{ bubbles: true }});
+                        var inputEvent = new Event('input', { bubbles: true });
                         select.dispatchEvent(inputEvent);
                         
                         
-                        if (typeof jQuery !== 'undefined') {{
-                            try {{
+                        if (typeof jQuery !== 'undefined') {
+                            try {
                                 jQuery(select).trigger('change');
-                            }} catch(e) {{}}
-                        }}
-                    }}
-                """)
-                
-                # Wait a bit and check again
-                time.sleep(3)
-                
-                has_options_retry = driver.execute_script(f"""
-                    var select = document.getElementById('{child_dropdown_id}');
-                    return select && select.options.length > 1;
-                """)
+                            } catch(e) {}
+                        }
+                    }
+                """, parent_dropdown_id)
                 
-                if has_options_retry:
+                # Wait for the options to arrive and check again
+                if self._wait_for_dropdown_options(driver, child_dropdown_id, 5):
                     logger.info(f"Verification successful after retry: '{child_dropdown_id}' has been populated")
                     return True
                 else:
@@ -2178,41 +3251,38 @@ class PropertyScraper:
             if driver is None:
                 raise Exception(f"No driver provided for '{dropdown_id}'. Browser automation is required.")
             
-            dropdown = WebDriverWait(driver, 15).until(
+            dropdown = WebDriverWait(driver, 15, poll_frequency=WAIT_POLL_FREQUENCY).until(
                 EC.presence_of_element_located((By.ID, dropdown_id))
             )
             
             driver.execute_script("arguments[0].scrollIntoView(true);", dropdown)
-            time.sleep(1)  # Wait for scroll to complete
             
             # Try to click on the dropdown using JavaScript to ensure it's active
             try:
                 driver.execute_script("arguments[0].click();", dropdown)
-                time.sleep(1)
             except Exception as e:
                 logger.warning(f"JavaScript click on dropdown failed: {str(e)}")
             
             # Try different methods to get options
             options = []
             
-            # Method 1: Use Select class
+            # Method 1: Read the option texts of the element in one script call
             try:
-                select = Select(dropdown)
-                options = [option.text for option in select.options if option.text.strip()]
+                options = [text for text in driver.execute_script(_OPTION_TEXTS_JS, dropdown) if text.strip()]
             except Exception as e1:
-                logger.warning(f"Getting options with Select class failed: {str(e1)}")
+                logger.warning(f"Getting options from the dropdown element failed: {str(e1)}")
                 
                 try:
-                    options_js = driver.execute_script(f"""
-                        var options = document.getElementById('{dropdown_id}').options;
+                    options_js = driver.execute_script("""
+                        var options = document.getElementById(arguments[0]).options;
                         var result = [];
-                        for (var i = 0; i < options.length; i++) {{
-                            if (options[i].text.trim()) {{
+                        for (var i = 0; i < options.length; i++) {
+                            if (options[i].text.trim()) {
                                 result.push(options[i].text);
-                            }}
-                        }}
+                            }
+                        }
                         return result;
-                    """)
+                    """, dropdown_id)
                     if options_js and len(options_js) > 0:
                         options = options_js
                 except Exception as e2:
@@ -2236,7 +3306,10 @@ class PropertyScraper:
     
     def _screenshot_to_pdf(self, driver, output_path):
         """
-        Take a screenshot of the current page and convert it to a PDF.
+        Save the current page as a PDF.
+        
+        The page is printed with Chrome's Page.printToPDF, which keeps the text selectable. If the
+        DevTools command is not available, a screenshot is converted to a PDF instead.
         
         Args:
             driver: The Selenium WebDriver instance
@@ -2245,48 +3318,37 @@ class PropertyScraper:
         Returns:
             bool: True if successful, False otherwise
         """
+        try:
+            result = driver.execute_cdp_cmd("Page.printToPDF", {"printBackground": True, "preferCSSPageSize": True})
+            with open(output_path, 'wb') as f:
+                f.write(base64.b64decode(result['data']))
+            logger.info(f"Printed page to PDF: {output_path}")
+            return True
+        except Exception as e:
+            logger.warning(f"Could not print page to PDF, falling back to a screenshot: {str(e)}")
+        
         try:
             logger.info(f"Taking screenshot and converting to PDF: {output_path}")
             
-            # First try to import the required libraries
-            try:
-                from PIL import Image
-                from reportlab.lib.pagesizes import letter
-                from reportlab.pdfgen import canvas
-                import io
-                libraries_available = True
-            except ImportError as e:
-                logger.error(f"Required libraries for PDF conversion not available: {str(e)}")
-                libraries_available = False
-                
-            if not libraries_available:
-                logger.error("Cannot convert screenshot to PDF: required libraries not available")
+            if not PIL_AVAILABLE:
+                logger.error("Cannot convert screenshot to PDF: Pillow is not installed")
                 return False
-                
-            # Take a screenshot of the entire page
-            # First, get the total height of the page
-            total_height = driver.execute_script("return document.body.scrollHeight")
-            total_width = driver.execute_script("return document.body.scrollWidth")
-            
-            # Save current window size
-            original_size = driver.get_window_size()
             
-            # Take the screenshot without changing window size
-            screenshot = driver.get_screenshot_as_png()
+            # Capture the whole page height without resizing the window, or just the viewport
+            # when DevTools commands are not available
+            try:
+                result = driver.execute_cdp_cmd("Page.captureScreenshot", {"captureBeyondViewport": True, "format": "png"})
+                screenshot = base64.b64decode(result['data'])
+            except Exception:
+                screenshot = driver.get_screenshot_as_png()
             
             # Make sure we maintain our desired window size
             self._maintain_window_size(driver)
             
-            # Convert the screenshot to a PDF
+            # Write the screenshot as a one-page PDF the size of the image. Pillow encodes it once,
+            # where drawing it with reportlab decoded and re-encoded the pixels again
             img = Image.open(io.BytesIO(screenshot))
-            
-            # Create a PDF with the same dimensions as the image
-            img_width, img_height = img.size
-            pdf_canvas = canvas.Canvas(output_path, pagesize=(img_width, img_height))
-            
-            # Add the image to the PDF
-            pdf_canvas.drawInlineImage(img, 0, 0, width=img_width, height=img_height)
-            pdf_canvas.save()
+            img.convert('RGB').save(output_path, 'PDF', resolution=72.0)
             
             logger.info(f"Successfully created PDF from screenshot: {output_path}")
             return True
@@ -2295,206 +3357,385 @@ class PropertyScraper:
             logger.error(f"Error converting screenshot to PDF: {str(e)}")
             return False
     
-    def _download_pdfs(self, driver):
-        """Download all PDFs from the search results page by clicking on 'List No. 2' buttons."""
-        try:
-            # If driver is None, raise an exception
-            if driver is None:
-                raise Exception("No driver provided for PDF downloads. Browser automation is required.")
-            
-            logger.info("Looking for 'List No. 2' buttons in the search results table...")
-            
-            # Wait for the table to load
-            WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.XPATH, "//table[contains(@class, 'dataTable') or contains(@id, 'dataTable')]"))
-            )
+    def _read_loaded_pdf(self, driver, pdf_url):
+        """
+        Read a PDF the current tab has already loaded from Chrome's resource cache via CDP.
+        
+        Args:
+            driver: The Selenium WebDriver instance
+            pdf_url: URL of the PDF loaded in the current tab
             
-            # Find all "List No. 2" buttons in the table
-            # The buttons might be in different columns, so we'll look for them by text
-            list_no2_buttons = driver.find_elements(By.XPATH, "//a[contains(text(), 'List No. 2') or contains(text(), 'IndexII')]")
+        Returns:
+            bytes: The PDF content, or None if it is not available
+        """
+        try:
+            driver.execute_cdp_cmd("Page.enable", {})
+            frame_tree = driver.execute_cdp_cmd("Page.getResourceTree", {})
+            frame_id = frame_tree['frameTree']['frame']['id']
+            resource = driver.execute_cdp_cmd("Page.getResourceContent", {"frameId": frame_id, "url": pdf_url})
+        except Exception as e:
+            logger.warning(f"Could not read loaded PDF from the browser: {str(e)}")
+            return None
+        
+        if resource.get('base64Encoded'):
+            content = base64.b64decode(resource.get('content', ''))
+        else:
+            content = resource.get('content', '').encode('latin-1', errors='ignore')
+        
+        if not content.startswith(b'%PDF'):
+            logger.warning(f"Resource loaded from {pdf_url} is not a PDF")
+            return None
+        
+        return content
+    
+    def _open_in_download_tab(self, driver, slot, url):
+        """
+        Start loading a URL in one of this thread's reusable download tabs without waiting for it.
+        
+        Must be called from the window the tabs were opened from. Returns the tab's window handle.
+        """
+        download_tabs = self._local.__dict__.setdefault('download_tabs', {})
+        known_handles = set(driver.window_handles)
+        driver.execute_script("window.open(arguments[0], arguments[1]);", url, f"_dlTab{slot}")
+        if download_tabs.get(slot) in known_handles:
+            return download_tabs[slot]
+        
+        new_handles = [handle for handle in driver.window_handles if handle not in known_handles]
+        if not new_handles:
+            raise Exception("Could not open download tab")
+        
+        download_tabs[slot] = new_handles[0]
+        logger.info(f"Opened reusable download tab {slot}")
+        return download_tabs[slot]
+    
+    def _pdf_path(self, pdf_url, doc_info):
+        """Path in the download directory for a PDF, named after the URL or else the document info."""
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        pdf_name = f"{doc_info}_{timestamp}.pdf"
+        if "pdf" in pdf_url.lower():
+            # Try to extract a filename from the URL
+            url_filename = pdf_url.split("/")[-1]
+            if url_filename and len(url_filename) > 5:  # Reasonable filename length
+                pdf_name = url_filename
+                if not pdf_name.endswith(".pdf"):
+                    pdf_name += ".pdf"
+        return os.path.join(self.download_dir, pdf_name)
+    
+    def _stream_pdf(self, http, pdf_url, doc_info):
+        """
+        Download a PDF without opening a tab. Does not use the driver, so it can run in a download thread.
+        
+        Args:
+            http: HTTP session holding the browser's cookies, see _sync_http_cookies
+            pdf_url: URL of the PDF
+            doc_info: Document info from the results table, used when the URL has no usable filename
             
-            if not list_no2_buttons:
-                logger.warning("No 'List No. 2' buttons found in the search results table")
-                return 0
+        Returns:
+            bool: True if the PDF was saved, False if the response was not a PDF or the request failed
+        """
+        try:
+            self.pdf_rate_limiter.wait()
+            with http.get(pdf_url, stream=True, timeout=30) as response:
+                if response.status_code in (429, 503):
+                    self.pdf_rate_limiter.throttled()
+                elif response.status_code == 200:
+                    self.pdf_rate_limiter.succeeded()
+                content_type = response.headers.get('Content-Type', '').lower()
+                if response.status_code != 200 or not ('pdf' in content_type or 'octet-stream' in content_type):
+                    logger.info(f"{pdf_url} did not return a PDF (status {response.status_code}, {content_type})")
+                    return False
                 
-            logger.info(f"Found {len(list_no2_buttons)} 'List No. 2' buttons")
-            
-            # Store the current window handle
-            main_window = driver.current_window_handle
-            
-            # Track the number of PDFs downloaded
-            pdfs_downloaded = 0
+                pdf_path = self._pdf_path(pdf_url, doc_info)
+                self._write_response(response, pdf_path)
+        except Exception as e:
+            logger.warning(f"Failed to stream PDF from {pdf_url}: {str(e)}")
+            return False
+        
+        logger.info(f"Streamed PDF to: {pdf_path}")
+        return True
+    
+    def _write_response(self, response, pdf_path):
+        """
+        Copy a streamed response body to pdf_path in PDF_COPY_BUFFER_SIZE chunks.
+        
+        Returns:
+            int: Number of bytes written
+        """
+        response.raw.decode_content = True
+        with open(pdf_path, 'wb') as f:
+            shutil.copyfileobj(response.raw, f, PDF_COPY_BUFFER_SIZE)
+            return f.tell()
+    
+    def _wait_for_downloads(self, known_files, timeout=30):
+        """
+        Wait for the browser to finish the downloads started since known_files was listed.
+        
+        Returns:
+            list: Names of the PDFs that were downloaded
+        """
+        def new_files():
+            return [name for name in os.listdir(self.download_dir) if name not in known_files]
+        
+        try:
+            WebDriverWait(None, timeout, poll_frequency=WAIT_POLL_FREQUENCY).until(
+                lambda _: not any(name.endswith('.crdownload') for name in new_files())
+            )
+        except TimeoutException:
+            logger.warning("Timed out waiting for browser downloads to finish")
+        return [name for name in new_files() if name.lower().endswith('.pdf')]
+    
+    def _save_pdf_from_tab(self, driver, doc_info, results_url):
+        """
+        Save the PDF shown in the current tab to the download directory.
+        
+        Args:
+            driver: The Selenium WebDriver instance, switched to the tab holding the PDF
+            doc_info: Document info from the results table, used when the URL has no usable filename
+            results_url: URL of the search results page, sent as the Referer
+        
+        Returns:
+            bool: True if the PDF was saved, False otherwise
+        """
+        # Get the current URL (should be a PDF)
+        pdf_url = driver.current_url
+        pdf_path = self._pdf_path(pdf_url, doc_info)
+        logger.info(f"Downloading PDF: {os.path.basename(pdf_path)} from URL: {pdf_url}")
+        
+        # Take the PDF the tab already loaded straight from Chrome instead of fetching it again
+        loaded_pdf = self._read_loaded_pdf(driver, pdf_url) if "pdf" in pdf_url.lower() else None
+        if loaded_pdf:
+            with open(pdf_path, 'wb') as f:
+                f.write(loaded_pdf)
+            logger.info(f"Saved PDF loaded by the browser: {pdf_path} ({len(loaded_pdf)} bytes)")
+            return True
+        
+        # A PDF URL is fetched directly first; rendering the tab to a PDF is only the fallback
+        if pdf_url.lower().endswith(".pdf") or "pdf" in driver.current_url.lower():
+            try:
+                pdf_content = None
+                saved_bytes = None
+                
+                try:
+                    # Reuse the pooled session with the browser's cookies and User-Agent,
+                    # which is read once per driver session
+                    self._sync_http_cookies(driver)
+                    headers = {'Referer': results_url}
+                    
+                    # Stream the PDF straight to disk instead of buffering it in memory
+                    with self._http.get(pdf_url, headers=headers, stream=True, timeout=30) as response:
+                        content_type = response.headers.get('Content-Type', '').lower()
+                        if response.status_code == 200 and ('pdf' in content_type or 'octet-stream' in content_type):
+                            saved_bytes = self._write_response(response, pdf_path)
+                            logger.info(f"Successfully downloaded PDF content using requests: {saved_bytes} bytes")
+                except Exception as req_e:
+                    logger.warning(f"Failed to download PDF using requests: {str(req_e)}")
+                
+                if saved_bytes is None:
+                    try:
+                        iframe_elements = driver.find_elements(By.TAG_NAME, "iframe")
+                        if iframe_elements:
+                            for iframe in iframe_elements:
+                                iframe_src = iframe.get_attribute("src")
+                                if iframe_src and ("pdf" in iframe_src.lower()):
+                                    # Switch to iframe and try to get content
+                                    driver.switch_to.frame(iframe)
+                                    # Try to get PDF content from iframe source
+                                    iframe_url = driver.current_url
+                                    if iframe_url != pdf_url:
+                                        with self._http.get(iframe_url, headers={'Referer': pdf_url}, stream=True, timeout=30) as response:
+                                            if response.status_code == 200:
+                                                saved_bytes = self._write_response(response, pdf_path)
+                                                logger.info(f"Successfully downloaded PDF from iframe: {saved_bytes} bytes")
+                                    # Switch back to main content
+                                    driver.switch_to.default_content()
+                                    break
+                    except Exception as iframe_e:
+                        logger.warning(f"Failed to get PDF from iframe: {str(iframe_e)}")
+                        # Make sure we're back in the main content
+                        try:
+                            driver.switch_to.default_content()
+                        except:
+                            pass
+                
+                if saved_bytes is None:
+                    try:
+                        js_result = driver.execute_script("""
+                            var pdfData = document.querySelector('embed[type="application/pdf"]');
+                            if (pdfData) {
+                                return pdfData.src;
+                            }
+                            return null;
+                        """)
+                        
+                        if js_result and js_result.startswith(PDF_DATA_URI_PREFIX):
+                            # Slice off the known prefix instead of searching the whole data URI for it
+                            pdf_content = base64.b64decode(js_result[len(PDF_DATA_URI_PREFIX):])
+                            logger.info(f"Successfully extracted PDF content using JavaScript: {len(pdf_content)} bytes")
+                    except Exception as js_e:
+                        logger.warning(f"Failed to get PDF using JavaScript: {str(js_e)}")
+                
+                if pdf_content:
+                    with open(pdf_path, 'wb') as f:
+                        f.write(pdf_content)
+                    saved_bytes = len(pdf_content)
+                
+                if saved_bytes:
+                    logger.info(f"Successfully saved PDF to: {pdf_path}")
+                    return True
+                else:
+                    logger.warning(f"Could not extract PDF content from {pdf_url}, rendering the tab instead")
+            except Exception as e:
+                logger.error(f"Error downloading PDF: {str(e)}")
+        
+        if self._screenshot_to_pdf(driver, pdf_path):
+            logger.info(f"Successfully created PDF from screenshot: {pdf_path}")
+            return True
+        
+        logger.warning(f"Could not save PDF from {pdf_url}")
+        return False
+    
+    def _close_new_tabs(self, driver, known_handles, main_window):
+        """
+        Close every tab that is not in known_handles and switch back to main_window.
+        
+        Also closes tabs a click opened that were never switched to, so failed downloads do not
+        leave tabs behind for the rest of the run.
+        """
+        try:
+            for handle in set(driver.window_handles) - known_handles:
+                driver.switch_to.window(handle)
+                driver.close()
+        except Exception as e:
+            logger.warning(f"Could not close PDF tabs: {str(e)}")
+        finally:
+            try:
+                driver.switch_to.window(main_window)
+            except Exception as e:
+                logger.warning(f"Could not switch back to the results window: {str(e)}")
+    
+    def _download_pdfs(self, driver, list_no2_links=None):
+        """
+        Download all PDFs from the search results page by clicking on 'List No. 2' buttons.
+        
+        Args:
+            driver: The Selenium WebDriver instance
+            list_no2_links: Links already read from the results table, as returned by _LIST_NO2_LINKS_JS;
+                read from the displayed table if not given
+        """
+        try:
+            # If driver is None, raise an exception
+            if driver is None:
+                raise Exception("No driver provided for PDF downloads. Browser automation is required.")
             
-            # Click on each button and download the PDF
-            for i, button in enumerate(list_no2_buttons):
+            logger.info("Looking for 'List No. 2' buttons in the search results table...")
+            
+            # Wait for the table to load
+            self._wait_for_selector(driver, RESULTS_TABLE_CSS)
+            
+            # Read the link and document info of every "List No. 2" button in one round-trip
+            # The buttons might be in different columns, so we'll look for them by text
+            if list_no2_links is None:
+                list_no2_links = driver.execute_script(_LIST_NO2_LINKS_JS, LIST_NO2_XPATH)
+            
+            if not list_no2_links:
+                logger.warning("No 'List No. 2' buttons found in the search results table")
+                return 0
+                
+            logger.info(f"Found {len(list_no2_links)} 'List No. 2' buttons")
+            
+            # Store the current window handle, and the results page URL to send as the Referer
+            # from the PDF tabs
+            main_window = driver.current_window_handle
+            results_url = driver.current_url
+            
+            # Pick up the cookies the search may have set, once for all links
+            self._sync_http_cookies(driver, refresh=True)
+            
+            # Track the number of PDFs downloaded
+            pdfs_downloaded = 0
+            
+            # PDF links are fetched over HTTP with the browser's cookies, several at once. The driver
+            # is not thread-safe, so the download threads only use the HTTP session
+            url_links = [link for link in list_no2_links if link['href'] and link['href'].startswith("http")]
+            pdf_links = [link for link in url_links if "pdf" in link['href'].lower()]
+            http = self._http
+            with concurrent.futures.ThreadPoolExecutor(max_workers=PDF_DOWNLOAD_WORKERS) as executor:
+                streamed = list(executor.map(lambda link: self._stream_pdf(http, link['href'], link['doc']), pdf_links))
+            pdfs_downloaded += sum(streamed)
+            
+            # Other links with a plain URL, and PDF links that did not return a PDF, are loaded in
+            # several reusable tabs at once, so their load times overlap, and then saved one tab at a time
+            failed_pdf_links = [link for link, ok in zip(pdf_links, streamed) if not ok]
+            direct_links = [link for link in url_links if "pdf" not in link['href'].lower()] + failed_pdf_links
+            for batch_start in range(0, len(direct_links), PDF_DOWNLOAD_TABS):
+                batch = direct_links[batch_start:batch_start + PDF_DOWNLOAD_TABS]
+                tabs = []
+                for slot, link in enumerate(batch):
+                    try:
+                        tabs.append((self._open_in_download_tab(driver, slot, link['href']), link))
+                    except Exception as e:
+                        logger.error(f"Error opening PDF link {link['href']}: {str(e)}")
+                
+                for tab, link in tabs:
+                    try:
+                        driver.switch_to.window(tab)
+                        WebDriverWait(driver, 10, poll_frequency=WAIT_POLL_FREQUENCY).until(
+                            lambda d: d.execute_script("return document.readyState") == "complete"
+                        )
+                        if self._save_pdf_from_tab(driver, link['doc'], results_url):
+                            pdfs_downloaded += 1
+                    except Exception as e:
+                        logger.error(f"Error downloading PDF from {link['href']}: {str(e)}")
+                    finally:
+                        # Keep the download tab open for the next batch
+                        driver.switch_to.window(main_window)
+            
+            # Links without a plain URL are clicked so the page opens the PDF in a new tab
+            for i, link in enumerate(list_no2_links):
+                if link['href'] and link['href'].startswith("http"):
+                    continue
+                known_handles = None
                 try:
-                    logger.info(f"Clicking on 'List No. 2' button {i+1}/{len(list_no2_buttons)}...")
+                    logger.info(f"Clicking on 'List No. 2' button {i+1}/{len(list_no2_links)}...")
                     
-                    # Scroll to the button to make it visible
+                    known_handles = set(driver.window_handles)
+                    known_files = set(os.listdir(self.download_dir))
+                    button = driver.find_element(By.XPATH, f"({LIST_NO2_XPATH})[{i+1}]")
                     driver.execute_script("arguments[0].scrollIntoView(true);", button)
-                    time.sleep(0.5)  # Wait for scroll to complete
-                    
-                    # Get the document ID or other identifying information from the row
-                    try:
-                        # Try to get the document number from the row (adjust XPath as needed)
-                        row = button.find_element(By.XPATH, "./ancestor::tr")
-                        doc_cells = row.find_elements(By.XPATH, "./td")
-                        doc_info = ""
-                        if len(doc_cells) > 0:
-                            doc_info = doc_cells[0].text.strip()
-                    except Exception:
-                        doc_info = f"doc_{i+1}"
-                    
-                    # Click the button (this will open a new tab)
                     button.click()
                     
-                    # Wait for the new tab to open
-                    time.sleep(2)
-                    
-                    # Switch to the new tab
-                    new_tabs = [handle for handle in driver.window_handles if handle != main_window]
-                    if not new_tabs:
+                    # Wait for the new tab to open, or for the browser to save the file itself
+                    # when the link is sent as a download
+                    try:
+                        WebDriverWait(driver, 5, poll_frequency=WAIT_POLL_FREQUENCY).until(
+                            lambda d: len(d.window_handles) > len(known_handles) or set(os.listdir(self.download_dir)) - known_files
+                        )
+                    except TimeoutException:
                         logger.warning(f"No new tab opened after clicking button {i+1}")
                         continue
-                        
-                    driver.switch_to.window(new_tabs[0])
                     
-                    # Wait for the PDF to load
-                    time.sleep(3)
-                    
-                    # Get the current URL (should be a PDF)
-                    pdf_url = driver.current_url
-                    
-                    # Generate a meaningful filename
-                    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                    if "pdf" in pdf_url.lower():
-                        # Try to extract a filename from the URL
-                        url_filename = pdf_url.split("/")[-1]
-                        if url_filename and len(url_filename) > 5:  # Reasonable filename length
-                            pdf_name = url_filename
-                            if not pdf_name.endswith(".pdf"):
-                                pdf_name += ".pdf"
-                        else:
-                            pdf_name = f"{doc_info}_{timestamp}.pdf"
-                    else:
-                        pdf_name = f"{doc_info}_{timestamp}.pdf"
+                    if len(driver.window_handles) == len(known_handles):
+                        downloaded = self._wait_for_downloads(known_files)
+                        logger.info(f"Browser downloaded {downloaded} for button {i+1}")
+                        pdfs_downloaded += len(downloaded)
+                        continue
                     
-                    logger.info(f"Downloading PDF: {pdf_name} from URL: {pdf_url}")
+                    new_tabs = [handle for handle in driver.window_handles if handle not in known_handles]
+                    driver.switch_to.window(new_tabs[0])
                     
-                    # Full path to save the PDF
-                    pdf_path = os.path.join(self.download_dir, pdf_name)
+                    # Wait for the PDF to load
+                    WebDriverWait(driver, 10, poll_frequency=WAIT_POLL_FREQUENCY).until(
+                        lambda d: d.execute_script("return document.readyState") == "complete"
+                    )
                     
-                    screenshot_success = self._screenshot_to_pdf(driver, pdf_path)
-                    if screenshot_success:
-                        logger.info(f"Successfully created PDF from screenshot: {pdf_path}")
+                    if self._save_pdf_from_tab(driver, link['doc'], results_url):
                         pdfs_downloaded += 1
-                    else:
-                        logger.warning("Screenshot to PDF conversion failed, trying alternative methods...")
-                        
-                        try:
-                            if pdf_url.lower().endswith(".pdf") or "pdf" in driver.current_url.lower():
-                                pdf_content = None
-                                
-                                try:
-                                    cookies = driver.get_cookies()
-                                    cookie_dict = {cookie['name']: cookie['value'] for cookie in cookies}
-                                    
-                                    # Create a session with the same cookies
-                                    session = requests.Session()
-                                    for name, value in cookie_dict.items():
-                                        session.cookies.set(name, value)
-                                    
-                                    # Add the same headers as the browser
-                                    headers = {
-                                        'User-Agent': driver.execute_script("return navigator.userAgent;"),
-                                        'Referer': main_window
-                                    }
-                                    
-                                    # Download the PDF
-                                    response = session.get(pdf_url, headers=headers, stream=True, timeout=10)
-                                    
-                                    if response.status_code == 200:
-                                        content_type = response.headers.get('Content-Type', '').lower()
-                                        if 'pdf' in content_type or 'octet-stream' in content_type:
-                                            pdf_content = response.content
-                                            logger.info(f"Successfully downloaded PDF content using requests: {len(pdf_content)} bytes")
-                                except Exception as req_e:
-                                    logger.warning(f"Failed to download PDF using requests: {str(req_e)}")
-                                
-                                if pdf_content is None:
-                                    try:
-                                        iframe_elements = driver.find_elements(By.TAG_NAME, "iframe")
-                                        if iframe_elements:
-                                            for iframe in iframe_elements:
-                                                iframe_src = iframe.get_attribute("src")
-                                                if iframe_src and ("pdf" in iframe_src.lower()):
-                                                    # Switch to iframe and try to get content
-                                                    driver.switch_to.frame(iframe)
-                                                    # Try to get PDF content from iframe source
-                                                    iframe_url = driver.current_url
-                                                    if iframe_url != pdf_url:
-                                                        response = requests.get(iframe_url, stream=True)
-                                                        if response.status_code == 200:
-                                                            pdf_content = response.content
-                                                            logger.info(f"Successfully downloaded PDF from iframe: {len(pdf_content)} bytes")
-                                                    # Switch back to main content
-                                                    driver.switch_to.default_content()
-                                                    break
-                                    except Exception as iframe_e:
-                                        logger.warning(f"Failed to get PDF from iframe: {str(iframe_e)}")
-                                        # Make sure we're back in the main content
-                                        try:
-                                            driver.switch_to.default_content()
-                                        except:
-                                            pass
-                                
-                                if pdf_content is None:
-                                    try:
-                                        js_result = driver.execute_script("""
-                                            var pdfData = document.querySelector('embed[type="application/pdf"]');
-                                            if (pdfData) {
-                                                return pdfData.src;
-                                            }
-                                            return null;
-                                        """)
-                                        
-                                        if js_result and js_result.startswith('data:application/pdf;base64,'):
-                                            # Extract base64 data
-                                            base64_data = js_result.replace('data:application/pdf;base64,', '')
-                                            pdf_content = base64.b64decode(base64_data)
-                                            logger.info(f"Successfully extracted PDF content using JavaScript: {len(pdf_content)} bytes")
-                                    except Exception as js_e:
-                                        logger.warning(f"Failed to get PDF using JavaScript: {str(js_e)}")
-                                
-                                if pdf_content:
-                                    with open(pdf_path, 'wb') as f:
-                                        f.write(pdf_content)
-                                    logger.info(f"Successfully saved PDF to: {pdf_path}")
-                                    pdfs_downloaded += 1
-                                else:
-                                    logger.warning(f"Could not extract PDF content from {pdf_url}")
-                            else:
-                                logger.warning(f"URL does not appear to be a PDF: {pdf_url}")
-                        except Exception as e:
-                            logger.error(f"Error downloading PDF: {str(e)}")
-                    
-                    driver.close()
-                    driver.switch_to.window(main_window)
-                    
-                    # Add a small delay between downloads
-                    time.sleep(1)
                     
                 except Exception as e:
                     logger.error(f"Error processing 'List No. 2' button {i+1}: {str(e)}")
-                    
-                    if driver.current_window_handle != main_window:
-                        try:
-                            driver.close()
-                            driver.switch_to.window(main_window)
-                        except:
-                            # If we can't close the tab, try to get back to the main window
-                            if main_window in driver.window_handles:
-                                driver.switch_to.window(main_window)
+                finally:
+                    if known_handles is not None:
+                        self._close_new_tabs(driver, known_handles, main_window)
             
             logger.info(f"Successfully downloaded {pdfs_downloaded} PDFs")
             return pdfs_downloaded
@@ -2503,6 +3744,36 @@ class PropertyScraper:
             logger.error(f"Error downloading PDFs: {str(e)}")
             return 0
     
+    def _is_combination_completed(self, year, district, taluka, village, doc_number):
+        """Check if a combination is completed. A wildcard search is completed once every document number is."""
+        if doc_number == self.WILDCARD_DOC_NUMBER:
+            return self._completed_prefixes[f"{year}_{district}_{taluka}_{village}"] >= len(self.DOC_NUMBERS)
+        return f"{year}_{district}_{taluka}_{village}_{doc_number}" in self.progress['completed']
+    
+    def _reserve_combination(self, year, district, taluka, village, doc_number):
+        """
+        Claim a combination for the calling worker.
+        
+        Returns False if the combination is already completed or another worker is processing it,
+        including a wildcard search of the same village.
+        """
+        prefix = f"{year}_{district}_{taluka}_{village}"
+        combination_key = f"{prefix}_{doc_number}"
+        with self._progress_lock:
+            if self._is_combination_completed(year, district, taluka, village, doc_number):
+                return False
+            if combination_key in self._in_flight or f"{prefix}_{self.WILDCARD_DOC_NUMBER}" in self._in_flight:
+                return False
+            if doc_number == self.WILDCARD_DOC_NUMBER and any(key.rsplit('_', 1)[0] == prefix for key in self._in_flight):
+                return False
+            self._in_flight.add(combination_key)
+            return True
+    
+    def _release_combination(self, combination_key):
+        """Release a combination claimed with _reserve_combination."""
+        with self._progress_lock:
+            self._in_flight.discard(combination_key)
+    
     def _check_daily_limit(self):
         """Check if daily limit has been reached. Returns True if limit reached."""
         if self.daily_requests >= self.daily_limit:
@@ -2510,12 +3781,115 @@ class PropertyScraper:
             return True
         return False
     
-    def _reset_session(self):
-        """Reset session counters and update progress."""
+    def _reset_session(self, driver=None):
+        """
+        Reset session counters and update progress.
+        
+        If a driver is given, its cookies and the site's web storage are cleared and the start page
+        reloaded, so the same warm browser is reused for the new session instead of starting Chrome again.
+        """
         self.daily_requests = 0
         self.current_session_start = datetime.now()
-        self.progress['last_run'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        self._save_progress()
+        self.progress['last_run'] = self.current_session_start.strftime("%Y-%m-%d %H:%M:%S")
+        self._save_progress(force=True)
+        
+        if driver is not None:
+            driver.delete_all_cookies()
+            try:
+                driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+            except WebDriverException as e:
+                logger.warning(f"Could not clear web storage: {str(e)}")
+            self._http.cookies.clear()
+            self._local.http_cookie_session_id = None
+            driver.get(self.base_url)
+    
+    def _driver_is_alive(self, driver):
+        """Check whether the WebDriver session is still usable."""
+        if driver is None or driver.session_id is None:
+            return False
+        try:
+            driver.current_url
+            return True
+        except WebDriverException:
+            return False
+    
+    def _ensure_driver(self, driver):
+        """Return the given driver if its session is alive, otherwise replace it with a new one."""
+        if self._driver_is_alive(driver):
+            return driver
+        
+        logger.warning("Browser session was lost. Starting a new Chrome WebDriver...")
+        self._quit_driver(driver)
+        return self._setup_driver()
+    
+    def _quit_driver(self, driver):
+        """Quit a browser started by _setup_driver, ignoring errors from a session that is already gone."""
+        with self._drivers_lock:
+            self._drivers.discard(driver)
+        try:
+            driver.quit()
+        except Exception:
+            pass
+    
+    def _wait_for_search_result(self, driver, timeout=10):
+        """
+        Wait for the search to show the record details or reject the captcha.
+        
+        Returns:
+            bool: True once the results are shown, False if the captcha was rejected
+            
+        Raises:
+            TimeoutException: If neither happens within the timeout
+        """
+        def outcome(d):
+            try:
+                return d.execute_script(_SEARCH_OUTCOME_JS, RECORD_DETAILS_CSS, _WRONG_CAPTCHA_RE.pattern)
+            except UnexpectedAlertPresentException as e:
+                # Chrome dismisses the alert on its own, only its text is left to check
+                logger.info(f"Search showed an alert: {e.alert_text}")
+                return 'rejected' if _WRONG_CAPTCHA_RE.search(e.alert_text or '') else None
+        
+        result = WebDriverWait(driver, timeout, poll_frequency=WAIT_POLL_FREQUENCY).until(outcome)
+        return result == 'results'
+    
+    def _record_captcha_outcome(self, accepted):
+        """
+        Cache the captcha answer entered by _handle_captcha once the site accepted it,
+        and forget it if the site rejected it, so a wrong answer is not used again.
+        """
+        answer = getattr(self._local, 'captcha_answer', None)
+        self._local.captcha_answer = None
+        if not answer or answer[0] is None:
+            return
+        cache_key, captcha_text = answer
+        if accepted:
+            _store_captcha_cache(cache_key, captcha_text)
+        else:
+            _forget_captcha_cache(cache_key)
+    
+    def _refresh_captcha(self, driver, timeout=5):
+        """Load a new captcha with the page's refresh control, keeping the rest of the form as it is."""
+        self._local.district_screenshot = None
+        try:
+            old_src = self._wait_for_captcha_image(driver, timeout).get_attribute("src")
+            if not driver.execute_script(_CLICK_FIRST_JS, CAPTCHA_REFRESH_CSS):
+                logger.info("No captcha refresh control found, using the captcha the page shows now")
+                return
+            WebDriverWait(driver, timeout, poll_frequency=WAIT_POLL_FREQUENCY).until(
+                lambda d: self._wait_for_captcha_image(d, timeout).get_attribute("src") != old_src
+            )
+        except TimeoutException:
+            logger.info("Captcha image address did not change after refreshing it")
+    
+    def _is_rate_limited(self, driver):
+        """Check whether the current page is the site's rate limit or error response."""
+        try:
+            page_text = driver.execute_script(
+                "return (document.title + ' ' + (document.body ? document.body.innerText.slice(0, 2000) : ''));"
+            )
+        except WebDriverException:
+            return False
+        return bool(_RATE_LIMIT_RE.search(page_text or ''))
     
     def process_combination(self, year, district, taluka, village, doc_number, driver=None):
         """
@@ -2529,18 +3903,21 @@ class PropertyScraper:
             district: The district to select
             taluka: The taluka to select
             village: The village to select
-            doc_number: The document number to enter
+            doc_number: The document number to enter, or WILDCARD_DOC_NUMBER to search
+                the whole village in a single request
             driver: The Selenium WebDriver instance
             
         Returns:
-            bool: True if processing was successful, False otherwise
+            str: RESULT_OK on success, RESULT_RATE_LIMITED or RESULT_SESSION_EXPIRED for failures
+            worth retrying, RESULT_FAILED if an option does not exist and RESULT_DAILY_LIMIT
+            once the daily limit is reached
         """
         if driver is None:
             raise Exception("No driver provided for processing combination. Browser automation is required.")
         
         if self._check_daily_limit():
             logger.info("Daily limit reached. Stopping processing.")
-            return False
+            return self.RESULT_DAILY_LIMIT
         
         # Update current progress
         combination_key = f"{year}_{district}_{taluka}_{village}_{doc_number}"
@@ -2584,11 +3961,16 @@ class PropertyScraper:
                 logger.info(f"Need to select village: {village} (current: {current_selections.get('village')})")
                 needs_selection = True
             
+            prefetched_captcha = None
+            
             # If any selections need to be made, navigate to the main page and make all selections
             if needs_selection:
                 logger.info("Some dropdown selections need to be updated. Navigating to main page...")
                 driver.get(self.base_url)
-                time.sleep(3)
+                self._wait_for_ajax_idle(driver)
+                
+                # Decode the captcha in the background while the dropdowns are being selected
+                prefetched_captcha = self._prefetch_captcha(driver)
                 
                 # First fill in all the form fields with verification
                 # Select year
@@ -2598,8 +3980,8 @@ class PropertyScraper:
                     year_selected = self._force_dropdown_selection(driver, "year", year)
                     if not year_selected:
                         logger.error(f"Failed to select year: {year} after all attempts")
-                        return False
-                time.sleep(2)
+                        return self.RESULT_FAILED
+                self._wait_for_dropdown_options(driver, "district")
                 
                 # Select district and verify it populated the taluka dropdown
                 district_selected = self._select_dropdown_option(driver, "district", district)
@@ -2608,8 +3990,7 @@ class PropertyScraper:
                     district_selected = self._force_dropdown_selection(driver, "district", district)
                     if not district_selected:
                         logger.error(f"Failed to select district: {district} after all attempts")
-                        return False
-                time.sleep(2)
+                        return self.RESULT_FAILED
                 
                 # Verify district selection populated the taluka dropdown
                 if not self._verify_dropdown_dependency(driver, "district", "taluka"):
@@ -2617,13 +3998,12 @@ class PropertyScraper:
                     # Try selecting district again
                     if not self._select_dropdown_option(driver, "district", district):
                         logger.error(f"Failed to select district on retry: {district}")
-                        return False
-                    time.sleep(3)
+                        return self.RESULT_SESSION_EXPIRED
                     
                     # Check again if taluka dropdown is populated
                     if not self._verify_dropdown_dependency(driver, "district", "taluka"):
                         logger.error("District selection failed to populate taluka dropdown after retry")
-                        return False
+                        return self.RESULT_SESSION_EXPIRED
                 
                 # Select taluka and verify it populated the village dropdown
                 taluka_selected = self._select_dropdown_option(driver, "taluka", taluka)
@@ -2632,8 +4012,7 @@ class PropertyScraper:
                     taluka_selected = self._force_dropdown_selection(driver, "taluka", taluka)
                     if not taluka_selected:
                         logger.error(f"Failed to select taluka: {taluka} after all attempts")
-                        return False
-                time.sleep(2)
+                        return self.RESULT_FAILED
                 
                 # Verify taluka selection populated the village dropdown
                 if not self._verify_dropdown_dependency(driver, "taluka", "village"):
@@ -2641,13 +4020,12 @@ class PropertyScraper:
                     # Try selecting taluka again
                     if not self._select_dropdown_option(driver, "taluka", taluka):
                         logger.error(f"Failed to select taluka on retry: {taluka}")
-                        return False
-                    time.sleep(3)
+                        return self.RESULT_SESSION_EXPIRED
                     
                     # Check again if village dropdown is populated
                     if not self._verify_dropdown_dependency(driver, "taluka", "village"):
                         logger.error("Taluka selection failed to populate village dropdown after retry")
-                        return False
+                        return self.RESULT_SESSION_EXPIRED
                 
                 # Select village
                 village_selected = self._select_dropdown_option(driver, "village", village)
@@ -2656,124 +4034,113 @@ class PropertyScraper:
                     village_selected = self._force_dropdown_selection(driver, "village", village)
                     if not village_selected:
                         logger.error(f"Failed to select village: {village} after all attempts")
-                        return False
-                time.sleep(2)
+                        return self.RESULT_FAILED
             else:
                 logger.info("All dropdown selections already match the desired values. Skipping selection steps.")
             
             try:
-                doc_input_selectors = [
-                    "//input[@id='doc_number']",
-                    "//input[contains(@id, 'doc') or contains(@name, 'doc')]",
-                    "//label[contains(text(), 'Doc') or contains(text(), 'Property') or contains(text(), 'Survey')]/following-sibling::input",
-                    "//label[contains(text(), 'Doc') or contains(text(), 'Property') or contains(text(), 'Survey')]/..//input"
-                ]
-                
-                doc_input = None
-                for selector in doc_input_selectors:
-                    try:
-                        doc_input = WebDriverWait(driver, 5).until(
-                            EC.presence_of_element_located((By.XPATH, selector))
-                        )
-                        if doc_input:
-                            break
-                    except:
-                        continue
+                doc_input = self._find_doc_input(driver)
                 
                 if not doc_input:
-                    inputs = driver.find_elements(By.TAG_NAME, "input")
-                    for input_elem in inputs:
-                        placeholder = input_elem.get_attribute("placeholder") or ""
-                        label_text = ""
-                        try:
-                            label_id = input_elem.get_attribute("aria-labelledby") or input_elem.get_attribute("id")
-                            if label_id:
-                                label = driver.find_element(By.CSS_SELECTOR, f"label[for='{label_id}']")
-                                label_text = label.text
-                        except:
-                            pass
-                            
-                        if "doc" in placeholder.lower() or "property" in placeholder.lower() or "survey" in placeholder.lower() or \
-                           "doc" in label_text.lower() or "property" in label_text.lower() or "survey" in label_text.lower():
-                            doc_input = input_elem
-                            break
+                    # Check the placeholder and label of every input in one round-trip
+                    doc_input = driver.execute_script(_DOC_INPUT_BY_LABEL_JS, _DOC_LABEL_RE.pattern)
                 
                 if doc_input:
                     doc_input.clear()
-                    doc_input.send_keys(str(doc_number))
-                    logger.info(f"Entered document number: {doc_number}")
+                    if doc_number == self.WILDCARD_DOC_NUMBER:
+                        logger.info("Leaving document number blank to search all documents in the village")
+                    else:
+                        doc_input.send_keys(str(doc_number))
+                        logger.info(f"Entered document number: {doc_number}")
                 else:
                     logger.error("Could not find document number input field")
-                    return False
+                    return self.RESULT_SESSION_EXPIRED
             except Exception as e:
                 logger.error(f"Error entering document number: {str(e)}")
-                return False
-            
-            # Then handle the captcha
-            if not self._handle_captcha(driver):
-                logger.error("Failed to handle captcha. Retrying...")
-                if not self._handle_captcha(driver):
-                    logger.error("Failed to handle captcha again. Skipping this combination.")
-                    return False
-            
-            # Then click search
-            try:
-                search_button = WebDriverWait(driver, 10).until(
-                    EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'Search')] | //input[@type='submit' and @value='Search']"))
-                )
-                search_button.click()
-                logger.info("Clicked search button")
-            except Exception as search_error:
-                logger.warning(f"Could not find search button by text: {str(search_error)}")
-                try:
-                    search_button = driver.find_element(By.CSS_SELECTOR, ".btn-primary, .search-btn, button.btn-blue")
-                    search_button.click()
-                    logger.info("Clicked search button by CSS class")
-                except Exception as css_error:
-                    logger.error(f"Could not find search button by CSS either: {str(css_error)}")
-                    return False
-            
-            WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.XPATH, "//div[contains(@class, 'record-details') or contains(@id, 'record')]"))
-            )
-            
-            try:
-                logger.info("Selecting 'All' entries per page from dropdown...")
+                return self.RESULT_SESSION_EXPIRED
+            
+            # Then handle the captcha and search. A rejected captcha is replaced with a new one on
+            # the same page, so the filled in form is kept
+            for captcha_attempt in range(self.MAX_CAPTCHA_ATTEMPTS):
+                if captcha_attempt > 0:
+                    logger.warning(f"The site rejected the captcha. Trying a new one ({captcha_attempt + 1}/{self.MAX_CAPTCHA_ATTEMPTS})...")
+                    self._refresh_captcha(driver)
+                    prefetched_captcha = self._prefetch_captcha(driver)
                 
-                entries_dropdown = WebDriverWait(driver, 10).until(
-                    EC.element_to_be_clickable((By.XPATH, "//select[contains(@class, 'entries') or contains(@aria-label, 'entries')]"))
-                )
-                entries_dropdown.click()
+                retry = captcha_attempt > 0
+                if not self._handle_captcha(driver, prefetched_captcha, retry=retry):
+                    logger.error("Failed to handle captcha. Retrying...")
+                    if not self._handle_captcha(driver, retry=retry):
+                        logger.error("Failed to handle captcha again. Skipping this combination.")
+                        return self.RESULT_SESSION_EXPIRED
                 
-                option = WebDriverWait(driver, 10).until(
-                    EC.element_to_be_clickable((By.XPATH, "//option[text()='All']"))
-                )
-                option.click()
+                # Then click search
+                if not self._click_search_button(driver):
+                    logger.error("Could not find the search button")
+                    return self.RESULT_SESSION_EXPIRED
                 
-                time.sleep(2)
-                logger.info("Page refreshed with All entries per page")
-            except Exception as e:
-                logger.warning(f"Could not select entries per page: {str(e)}")
+                accepted = self._wait_for_search_result(driver)
+                self._record_captcha_outcome(accepted)
+                if accepted:
+                    break
+            else:
+                logger.error("The site rejected every captcha. Skipping this combination.")
+                return self.RESULT_SESSION_EXPIRED
             
-            downloaded = self._download_pdfs(driver)
+            # A table paged in the browser already holds every row, so the links can be read from it
+            # without redrawing the table with all entries
+            list_no2_links = None
+            try:
+                list_no2_links = driver.execute_script(_DATATABLE_LINKS_JS, RESULTS_TABLE_CSS, LIST_NO2_XPATH)
+            except WebDriverException as e:
+                logger.debug(f"Could not read the rows of the results table: {str(e)}")
             
-            self.daily_requests += 1
+            if list_no2_links is not None:
+                logger.info(f"Read {len(list_no2_links)} links from all pages of the results table")
+            else:
+                try:
+                    logger.info("Selecting 'All' entries per page from dropdown...")
+                    
+                    entries_dropdown = WebDriverWait(driver, 10, poll_frequency=WAIT_POLL_FREQUENCY).until(
+                        EC.element_to_be_clickable((By.CSS_SELECTOR, ENTRIES_SELECT_CSS))
+                    )
+                    entries_dropdown.click()
+                    
+                    option = WebDriverWait(driver, 10, poll_frequency=WAIT_POLL_FREQUENCY).until(
+                        EC.element_to_be_clickable((By.XPATH, "//option[text()='All']"))
+                    )
+                    option.click()
+                    
+                    self._wait_for_ajax_idle(driver)
+                    logger.info("Page refreshed with All entries per page")
+                except Exception as e:
+                    logger.warning(f"Could not select entries per page: {str(e)}")
             
-            combination_key = f"{year}_{district}_{taluka}_{village}_{doc_number}"
-            self.progress['completed'].append(combination_key)
+            downloaded = self._download_pdfs(driver, list_no2_links)
+            
+            with self._progress_lock:
+                self.daily_requests += 1
+            
+            # A wildcard search covers every document number of the village, so
+            # record each of them as completed
+            if doc_number == self.WILDCARD_DOC_NUMBER:
+                doc_numbers = self.DOC_NUMBERS
+            else:
+                doc_numbers = [doc_number]
+            for n in doc_numbers:
+                self._mark_completed(f"{year}_{district}_{taluka}_{village}_{n}")
             self._save_progress()
             
             logger.info(f"Successfully processed combination: {combination_key}")
             logger.info(f"Daily requests: {self.daily_requests}/{self.daily_limit}")
             
-            delay = random.uniform(self.delay_between_requests[0], self.delay_between_requests[1])
-            logger.info(f"Waiting {delay:.2f} seconds before next request...")
-            time.sleep(delay)
-            
-            return True
+            return self.RESULT_OK
         except Exception as e:
             logger.error(f"Error processing combination: {str(e)}")
-            return False
+            if self._is_rate_limited(driver):
+                logger.warning("The site is rate limiting requests")
+                return self.RESULT_RATE_LIMITED
+            return self.RESULT_SESSION_EXPIRED
     
 
     def _find_available_task(self):
@@ -2781,7 +4148,8 @@ class PropertyScraper:
         Find a task that is not completed.
         
         This method looks for tasks that haven't been completed yet and returns the first one found.
-        It requires a driver to get the actual dropdown options from the website.
+        A task another worker is processing is skipped. Otherwise the dropdown options have to be
+        read from the website with a driver, which the caller does.
         
         Returns:
             tuple: (year, district, taluka, village, doc_number) or None if no task is available
@@ -2789,23 +4157,22 @@ class PropertyScraper:
         logger.info("Looking for available tasks...")
         
         # First, try to continue from where we left off
-        if (self.progress['current']['year'] is not None and
-            self.progress['current']['district'] is not None and
-            self.progress['current']['taluka'] is not None and
-            self.progress['current']['village'] is not None and
-            self.progress['current']['doc_number'] is not None):
-            
-            year = self.progress['current']['year']
-            district = self.progress['current']['district']
-            taluka = self.progress['current']['taluka']
-            village = self.progress['current']['village']
-            doc_number = self.progress['current']['doc_number']
-            
-            combination_key = f"{year}_{district}_{taluka}_{village}_{doc_number}"
-            
-            if combination_key not in self.progress['completed']:
-                logger.info(f"Continuing with previous task: {combination_key}")
-                return (year, district, taluka, village, doc_number)
+        with self._progress_lock:
+            current = dict(self.progress['current'])
+            if all(current[field] is not None for field in ('year', 'district', 'taluka', 'village', 'doc_number')):
+                year = current['year']
+                district = current['district']
+                taluka = current['taluka']
+                village = current['village']
+                doc_number = current['doc_number']
+                
+                combination_key = f"{year}_{district}_{taluka}_{village}_{doc_number}"
+                
+                if combination_key in self._in_flight:
+                    logger.info(f"Previous task {combination_key} is being processed by another worker")
+                elif not self._is_combination_completed(year, district, taluka, village, doc_number):
+                    logger.info(f"Continuing with previous task: {combination_key}")
+                    return (year, district, taluka, village, doc_number)
         
         # If we can't continue from where we left off, we need a driver to get the dropdown options
         # This will be handled in the run method where we have a driver available
@@ -2813,6 +4180,25 @@ class PropertyScraper:
         return None
     
     
+    def _merge_cloud_progress(self):
+        """Merge the completed tasks saved in cloud storage by other instances, then release the workers."""
+        try:
+            if self.cloud_storage_type == 's3':
+                latest_progress = self._load_progress_from_s3()
+            elif self.cloud_storage_type == 'github':
+                latest_progress = self._load_progress_from_github()
+            else:
+                latest_progress = None
+                
+            if latest_progress:
+                # Merge completed tasks
+                self._merge_completed(latest_progress['completed'])
+                logger.info("Successfully loaded and merged latest progress from cloud storage")
+        except Exception as e:
+            logger.warning(f"Could not load latest progress from cloud storage: {str(e)}")
+        finally:
+            self._progress_merged.set()
+    
     def run(self):
         """
         Run the scraper.
@@ -2824,36 +4210,95 @@ class PropertyScraper:
         logger.info("Starting property scraper...")
         logger.info(f"Instance ID: {self.instance_id}")
         
-        # Create debug directories
-        os.makedirs("captcha_debug", exist_ok=True)
-        os.makedirs("dropdown_debug", exist_ok=True)
-        
-        # First, try to load the latest progress from cloud storage
+        # Load the latest progress from cloud storage while the browsers start up
+        self._progress_merged.clear()
         if self.use_cloud_storage:
+            merge_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+            merge_executor.submit(self._merge_cloud_progress)
+            merge_executor.shutdown(wait=False)
+        else:
+            self._progress_merged.set()
+        
+        # Number of combinations to process
+        num_combinations = 10
+        
+        # Write deferred progress changes in the background while the workers run
+        stop_flusher = threading.Event()
+        flusher = threading.Thread(target=self._progress_flusher, args=(stop_flusher,), daemon=True)
+        self._progress_writer_running = True
+        flusher.start()
+        
+        try:
+            if self.max_workers <= 1:
+                self._run_worker(num_combinations)
+            else:
+                # Split the combinations between workers, each driving its own browser
+                logger.info(f"Running {self.max_workers} workers in parallel")
+                per_worker = [
+                    num_combinations // self.max_workers + (1 if i < num_combinations % self.max_workers else 0)
+                    for i in range(self.max_workers)
+                ]
+                with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                    futures = [executor.submit(self._run_worker, count) for count in per_worker if count]
+                    for future in concurrent.futures.as_completed(futures):
+                        future.result()
+        finally:
+            self._progress_writer_running = False
+            stop_flusher.set()
+            self._progress_save_due.set()
+            flusher.join()
+            self._flush_progress()
+            
+        logger.info("Property scraper completed.")
+    
+    def stop(self):
+        """Ask a running run() to finish the combinations in progress and return."""
+        self._stop_event.set()
+    
+    def quit_drivers(self):
+        """
+        Quit every browser the workers still have open.
+        
+        stop() is only checked between combinations, so this is the way out for a worker stuck in a
+        WebDriver call: the call fails once its browser is gone and the worker exits.
+        """
+        with self._drivers_lock:
+            drivers = list(self._drivers)
+        for driver in drivers:
+            self._quit_driver(driver)
+    
+    def _progress_flusher(self, stop_event):
+        """
+        Flush deferred progress when a save is due, or at least every progress_save_interval seconds,
+        until stop_event is set. Saves requested while a write is in progress are coalesced into one.
+        """
+        while True:
+            self._progress_save_due.wait(self.progress_save_interval)
+            self._progress_save_due.clear()
+            if stop_event.is_set():
+                return
             try:
-                if self.cloud_storage_type == 's3':
-                    latest_progress = self._load_progress_from_s3()
-                elif self.cloud_storage_type == 'github':
-                    latest_progress = self._load_progress_from_github()
-                else:
-                    latest_progress = None
-                    
-                if latest_progress:
-                    # Merge completed tasks
-                    for task in latest_progress['completed']:
-                        if task not in self.progress['completed']:
-                            self.progress['completed'].append(task)
-                    logger.info("Successfully loaded and merged latest progress from cloud storage")
+                self._flush_progress()
             except Exception as e:
-                logger.warning(f"Could not load latest progress from cloud storage: {str(e)}")
+                logger.error(f"Error flushing progress: {str(e)}")
+    
+    def _run_worker(self, num_combinations):
+        """
+        Process up to num_combinations combinations on a dedicated browser.
         
+        Args:
+            num_combinations: Number of combinations this worker should process
+        """
         # Try to set up the driver
         driver = self._setup_driver()
         
         # If driver setup failed, raise an exception
         if driver is None:
             raise Exception("Browser automation failed. Chrome WebDriver could not be initialized.")
-            
+        
+        # Key of the combination this worker has claimed with _reserve_combination
+        reserved_key = None
+        
         try:
             # Set a longer page load timeout
             driver.set_page_load_timeout(30)
@@ -2865,13 +4310,13 @@ class PropertyScraper:
             # Wait for the page to fully load with explicit wait
             try:
                 logger.info("Waiting for page to fully load...")
-                WebDriverWait(driver, 30).until(
+                WebDriverWait(driver, 30, poll_frequency=WAIT_POLL_FREQUENCY).until(
                     lambda d: d.execute_script("return document.readyState") == "complete"
                 )
                 logger.info("Page fully loaded")
                 
-                # Additional wait for all elements to be rendered
-                time.sleep(5)
+                # Wait for any requests the page fires on load to settle
+                self._wait_for_ajax_idle(driver)
             except Exception as wait_error:
                 logger.warning(f"Error waiting for page to load: {str(wait_error)}")
             
@@ -2879,57 +4324,60 @@ class PropertyScraper:
             self._maintain_window_size(driver)
             
             # Take initial screenshot for debugging
-            try:
-                screenshot_path = f"captcha_debug/initial_page_{int(time.time())}.png"
-                driver.save_screenshot(screenshot_path)
-                logger.info(f"Saved initial page screenshot to {screenshot_path}")
-            except Exception as ss_error:
-                logger.warning(f"Could not save initial screenshot: {str(ss_error)}")
-            
-            # Number of combinations to process
-            num_combinations = 10
+            self._save_debug_screenshot(driver, f"captcha_debug/initial_page_{int(time.time())}.png", "of the initial page")
+            
+            # Don't pick tasks before progress from other instances has been merged
+            self._progress_merged.wait()
+            
             processed_count = 0
             attempts = 0
             max_attempts = 20  # Maximum number of attempts to find available tasks
             
             while processed_count < num_combinations and attempts < max_attempts:
-                if self._check_daily_limit():
-                    logger.info("Daily limit reached. Exiting.")
-                    driver.quit()
+                # Release a task claimed by an iteration that gave up on it before processing it
+                if reserved_key is not None:
+                    self._release_combination(reserved_key)
+                    reserved_key = None
+                
+                if self._stop_event.is_set():
+                    logger.info("Stop requested. Exiting.")
                     return
                 
-                # Navigate to the main page for each new combination
-                driver.get(self.base_url)
+                if self._check_daily_limit():
+                    raise DailyLimitReached()
+                
+                # Reuse the browser across combinations, only replacing it if the session died
+                driver = self._ensure_driver(driver)
                 
-                # Find an available task that's not completed
+                # Find an available task that's not completed, and claim it before spending a
+                # request and the form filling on it, so other workers do not pick it as well
                 available_task = self._find_available_task()
+                if available_task is not None:
+                    if self._reserve_combination(*available_task):
+                        reserved_key = "_".join(str(part) for part in available_task)
+                    else:
+                        available_task = None
+                
+                # Space out requests to the site
+                self.rate_limiter.wait()
+                
+                # Navigate to the main page for each new combination
+                driver.get(self.base_url)
                 
                 if available_task is None:
                     # If no task is available, get dropdown options from the website
                     logger.info("No available tasks found. Getting dropdown options from website...")
                     
                     # Take a screenshot before starting dropdown interactions
-                    try:
-                        screenshot_path = f"dropdown_debug/before_dropdowns_{int(time.time())}.png"
-                        driver.save_screenshot(screenshot_path)
-                        logger.info(f"Saved screenshot before dropdown interactions: {screenshot_path}")
-                    except Exception as ss_error:
-                        logger.warning(f"Could not save screenshot: {str(ss_error)}")
+                    self._save_debug_screenshot(driver, f"dropdown_debug/before_dropdowns_{int(time.time())}.png", "before dropdown interactions")
                     
                     # First, we need to select a year
                     try:
                         # Find the year dropdown
-                        year_dropdown_selectors = [
-                            "//select[@id='year']",
-                            "//select[contains(@id, 'year') or contains(@name, 'year')]",
-                            "//label[contains(text(), 'Year')]/following-sibling::select",
-                            "//label[contains(text(), 'Year')]/..//select"
-                        ]
-                        
                         year_dropdown = None
-                        for selector in year_dropdown_selectors:
+                        for selector in DISCOVERY_DROPDOWN_XPATHS['year']:
                             try:
-                                year_dropdown = WebDriverWait(driver, 15).until(  # Increased timeout
+                                year_dropdown = WebDriverWait(driver, 15, poll_frequency=WAIT_POLL_FREQUENCY).until(  # Increased timeout
                                     EC.presence_of_element_located((By.XPATH, selector))
                                 )
                                 if year_dropdown:
@@ -2943,8 +4391,7 @@ class PropertyScraper:
                             continue
                         
                         # Get the year options
-                        select = Select(year_dropdown)
-                        years = [option.text for option in select.options if option.text.strip() and not option.text.startswith("--Select")]
+                        years = self._get_select_options(driver, year_dropdown, "year")
                         
                         if not years:
                             logger.error("No year options found")
@@ -2955,40 +4402,30 @@ class PropertyScraper:
                         year = random.choice(years)
                         logger.info(f"Selected Year: {year}")
                         
+                        # Remember how many options the district dropdown has before selecting
+                        district_option_count = self._get_option_count(driver, "district")
+                        
                         # Click on the year dropdown and select the option
                         year_dropdown.click()
-                        time.sleep(1)
                         
                         # Find and click on the option
-                        year_option = WebDriverWait(driver, 5).until(
+                        year_option = WebDriverWait(driver, 5, poll_frequency=WAIT_POLL_FREQUENCY).until(
                             EC.element_to_be_clickable((By.XPATH, f"//option[text()='{year}']"))
                         )
                         year_option.click()
                         
-                        # Wait for the selection to take effect
-                        time.sleep(2)
+                        # Wait for the district dropdown to be repopulated
+                        self._wait_for_dependent_dropdown(driver, "district", district_option_count)
                         
                         # Take a screenshot after year selection
-                        try:
-                            screenshot_path = f"dropdown_debug/after_year_{int(time.time())}.png"
-                            driver.save_screenshot(screenshot_path)
-                            logger.info(f"Saved screenshot after year selection: {screenshot_path}")
-                        except Exception as ss_error:
-                            logger.warning(f"Could not save screenshot: {str(ss_error)}")
+                        self._save_debug_screenshot(driver, f"dropdown_debug/after_year_{int(time.time())}.png", "after year selection")
                         
                         # Now that we've selected a year, the district dropdown should be populated
                         # Find the district dropdown
-                        district_dropdown_selectors = [
-                            "//select[@id='district']",
-                            "//select[contains(@id, 'district') or contains(@name, 'district')]",
-                            "//label[contains(text(), 'District')]/following-sibling::select",
-                            "//label[contains(text(), 'District')]/..//select"
-                        ]
-                        
                         district_dropdown = None
-                        for selector in district_dropdown_selectors:
+                        for selector in DISCOVERY_DROPDOWN_XPATHS['district']:
                             try:
-                                district_dropdown = WebDriverWait(driver, 15).until(  # Increased timeout
+                                district_dropdown = WebDriverWait(driver, 15, poll_frequency=WAIT_POLL_FREQUENCY).until(  # Increased timeout
                                     EC.presence_of_element_located((By.XPATH, selector))
                                 )
                                 if district_dropdown:
@@ -3002,8 +4439,7 @@ class PropertyScraper:
                             continue
                         
                         # Get the district options
-                        select = Select(district_dropdown)
-                        districts = [option.text for option in select.options if option.text.strip() and not option.text.startswith("--Select")]
+                        districts = self._get_select_options(driver, district_dropdown, "district", year)
                         
                         if not districts:
                             logger.error("No district options found")
@@ -3018,40 +4454,41 @@ class PropertyScraper:
                             district = random.choice(districts)
                         logger.info(f"Selected District: {district}")
                         
+                        # Remember how many options the taluka dropdown has before selecting
+                        taluka_option_count = self._get_option_count(driver, "taluka")
+                        
                         # Click on the district dropdown and select the option
                         district_dropdown.click()
-                        time.sleep(1)
                         
                         # Find and click on the option
-                        district_option = WebDriverWait(driver, 5).until(
+                        district_option = WebDriverWait(driver, 5, poll_frequency=WAIT_POLL_FREQUENCY).until(
                             EC.element_to_be_clickable((By.XPATH, f"//option[text()='{district}']"))
                         )
                         district_option.click()
                         
-                        # Wait for the selection to take effect
-                        time.sleep(2)
+                        # Wait for the taluka dropdown to be repopulated
+                        self._wait_for_dependent_dropdown(driver, "taluka", taluka_option_count)
                         
                         # Take a screenshot after district selection
                         try:
+                            # The captcha is read from this screenshot, so it has to be loaded first
+                            try:
+                                self._wait_for_captcha_image(driver, timeout=5)
+                            except TimeoutException:
+                                logger.warning("Captcha image has not loaded before the district screenshot")
                             screenshot_path = f"dropdown_debug/after_district_{int(time.time())}.png"
                             driver.save_screenshot(screenshot_path)
+                            self._local.district_screenshot = screenshot_path
                             logger.info(f"Saved screenshot after district selection: {screenshot_path}")
                         except Exception as ss_error:
                             logger.warning(f"Could not save screenshot: {str(ss_error)}")
                         
                         # Now that we've selected a district, the taluka dropdown should be populated
                         # Find the taluka dropdown
-                        taluka_dropdown_selectors = [
-                            "//select[@id='taluka']",
-                            "//select[contains(@id, 'taluka') or contains(@name, 'taluka')]",
-                            "//label[contains(text(), 'Taluka')]/following-sibling::select",
-                            "//label[contains(text(), 'Taluka')]/..//select"
-                        ]
-                        
                         taluka_dropdown = None
-                        for selector in taluka_dropdown_selectors:
+                        for selector in DISCOVERY_DROPDOWN_XPATHS['taluka']:
                             try:
-                                taluka_dropdown = WebDriverWait(driver, 15).until(  # Increased timeout
+                                taluka_dropdown = WebDriverWait(driver, 15, poll_frequency=WAIT_POLL_FREQUENCY).until(  # Increased timeout
                                     EC.presence_of_element_located((By.XPATH, selector))
                                 )
                                 if taluka_dropdown:
@@ -3065,8 +4502,7 @@ class PropertyScraper:
                             continue
                         
                         # Get the taluka options
-                        select = Select(taluka_dropdown)
-                        talukas = [option.text for option in select.options if option.text.strip() and not option.text.startswith("--Select")]
+                        talukas = self._get_select_options(driver, taluka_dropdown, "taluka", year, district)
                         
                         if not talukas:
                             logger.error("No taluka options found")
@@ -3077,40 +4513,30 @@ class PropertyScraper:
                         taluka = random.choice(talukas)
                         logger.info(f"Selected Taluka: {taluka}")
                         
+                        # Remember how many options the village dropdown has before selecting
+                        village_option_count = self._get_option_count(driver, "village")
+                        
                         # Click on the taluka dropdown and select the option
                         taluka_dropdown.click()
-                        time.sleep(1)
                         
                         # Find and click on the option
-                        taluka_option = WebDriverWait(driver, 5).until(
+                        taluka_option = WebDriverWait(driver, 5, poll_frequency=WAIT_POLL_FREQUENCY).until(
                             EC.element_to_be_clickable((By.XPATH, f"//option[text()='{taluka}']"))
                         )
                         taluka_option.click()
                         
-                        # Wait for the selection to take effect
-                        time.sleep(2)
+                        # Wait for the village dropdown to be repopulated
+                        self._wait_for_dependent_dropdown(driver, "village", village_option_count)
                         
                         # Take a screenshot after taluka selection
-                        try:
-                            screenshot_path = f"dropdown_debug/after_taluka_{int(time.time())}.png"
-                            driver.save_screenshot(screenshot_path)
-                            logger.info(f"Saved screenshot after taluka selection: {screenshot_path}")
-                        except Exception as ss_error:
-                            logger.warning(f"Could not save screenshot: {str(ss_error)}")
+                        self._save_debug_screenshot(driver, f"dropdown_debug/after_taluka_{int(time.time())}.png", "after taluka selection")
                         
                         # Now that we've selected a taluka, the village dropdown should be populated
                         # Find the village dropdown
-                        village_dropdown_selectors = [
-                            "//select[@id='village']",
-                            "//select[contains(@id, 'village') or contains(@name, 'village')]",
-                            "//label[contains(text(), 'Village')]/following-sibling::select",
-                            "//label[contains(text(), 'Village')]/..//select"
-                        ]
-                        
                         village_dropdown = None
-                        for selector in village_dropdown_selectors:
+                        for selector in DISCOVERY_DROPDOWN_XPATHS['village']:
                             try:
-                                village_dropdown = WebDriverWait(driver, 15).until(  # Increased timeout
+                                village_dropdown = WebDriverWait(driver, 15, poll_frequency=WAIT_POLL_FREQUENCY).until(  # Increased timeout
                                     EC.presence_of_element_located((By.XPATH, selector))
                                 )
                                 if village_dropdown:
@@ -3124,8 +4550,7 @@ class PropertyScraper:
                             continue
                         
                         # Get the village options
-                        select = Select(village_dropdown)
-                        villages = [option.text for option in select.options if option.text.strip() and not option.text.startswith("--Select")]
+                        villages = self._get_select_options(driver, village_dropdown, "village", year, district, taluka)
                         
                         if not villages:
                             logger.error("No village options found")
@@ -3138,37 +4563,39 @@ class PropertyScraper:
                         
                         # Click on the village dropdown and select the option
                         village_dropdown.click()
-                        time.sleep(1)
                         
                         # Find and click on the option
-                        village_option = WebDriverWait(driver, 5).until(
+                        village_option = WebDriverWait(driver, 5, poll_frequency=WAIT_POLL_FREQUENCY).until(
                             EC.element_to_be_clickable((By.XPATH, f"//option[text()='{village}']"))
                         )
                         village_option.click()
                         
-                        # Wait for the selection to take effect
-                        time.sleep(2)
-                        
                         # Take a screenshot after village selection
-                        try:
-                            screenshot_path = f"dropdown_debug/after_village_{int(time.time())}.png"
-                            driver.save_screenshot(screenshot_path)
-                            logger.info(f"Saved screenshot after village selection: {screenshot_path}")
-                        except Exception as ss_error:
-                            logger.warning(f"Could not save screenshot: {str(ss_error)}")
-                        
-                        # Generate a random document number (0-9)
-                        doc_number = random.randint(0, 9)
+                        self._save_debug_screenshot(driver, f"dropdown_debug/after_village_{int(time.time())}.png", "after village selection")
                         
-                        # Check if this combination has already been processed or is being worked on
-                        combination_key = f"{year}_{district}_{taluka}_{village}_{doc_number}"
-                        if combination_key in self.progress['completed']:
-                            logger.info(f"Skipping combination {combination_key} as it's already completed.")
+                        # Find the document numbers still pending for this village
+                        pending_doc_numbers = [
+                            n for n in self.DOC_NUMBERS
+                            if not self._is_combination_completed(year, district, taluka, village, n)
+                        ]
+                        if not pending_doc_numbers:
+                            logger.info(f"Skipping village {year}_{district}_{taluka}_{village} as it's already completed.")
                             attempts += 1
                             continue
+                        
+                        # Search the whole village in one request when nothing in it is done yet,
+                        # otherwise fill in one of the remaining document numbers
+                        if len(pending_doc_numbers) == len(self.DOC_NUMBERS):
+                            doc_number = self.WILDCARD_DOC_NUMBER
+                        else:
+                            doc_number = random.choice(pending_doc_numbers)
+                        combination_key = f"{year}_{district}_{taluka}_{village}_{doc_number}"
                             
                     except Exception as e:
                         logger.error(f"Error selecting dropdown options: {str(e)}")
+                        # The cached options may be out of date, read them again next time
+                        with self._dropdown_options_lock:
+                            self._dropdown_options_cache.clear()
                         attempts += 1
                         continue
                 else:
@@ -3177,180 +4604,191 @@ class PropertyScraper:
                     combination_key = f"{year}_{district}_{taluka}_{village}_{doc_number}"
                     logger.info(f"Found available task: {combination_key}")
                     
-                    # Check if the current selections match the desired selections
-                    current_selections = self._get_current_dropdown_selections(driver)
-                    logger.info(f"Current dropdown selections: {current_selections}")
+                    # Fill the whole form with scripted selections, falling back to the
+                    # interactive selection when the page does not respond to them
+                    if not self._fill_form_fast(driver, year, district, taluka, village, doc_number):
+                        # Check if the current selections match the desired selections
+                        current_selections = self._get_current_dropdown_selections(driver)
+                        logger.info(f"Current dropdown selections: {current_selections}")
                     
-                    # Only fill in form fields that don't match the desired selections
-                    needs_selection = False
+                        # Only fill in form fields that don't match the desired selections
+                        needs_selection = False
                     
-                    # Check year
-                    if current_selections.get('year') != year:
-                        logger.info(f"Need to select year: {year} (current: {current_selections.get('year')})")
-                        needs_selection = True
+                        # Check year
+                        if current_selections.get('year') != year:
+                            logger.info(f"Need to select year: {year} (current: {current_selections.get('year')})")
+                            needs_selection = True
                     
-                    # Check district
-                    if current_selections.get('district') != district:
-                        logger.info(f"Need to select district: {district} (current: {current_selections.get('district')})")
-                        needs_selection = True
+                        # Check district
+                        if current_selections.get('district') != district:
+                            logger.info(f"Need to select district: {district} (current: {current_selections.get('district')})")
+                            needs_selection = True
                     
-                    # Check taluka
-                    if current_selections.get('taluka') != taluka:
-                        logger.info(f"Need to select taluka: {taluka} (current: {current_selections.get('taluka')})")
-                        needs_selection = True
+                        # Check taluka
+                        if current_selections.get('taluka') != taluka:
+                            logger.info(f"Need to select taluka: {taluka} (current: {current_selections.get('taluka')})")
+                            needs_selection = True
                     
-                    # Check village
-                    if current_selections.get('village') != village:
-                        logger.info(f"Need to select village: {village} (current: {current_selections.get('village')})")
-                        needs_selection = True
+                        # Check village
+                        if current_selections.get('village') != village:
+                            logger.info(f"Need to select village: {village} (current: {current_selections.get('village')})")
+                            needs_selection = True
                     
-                    # If any selections need to be made, make them
-                    if needs_selection:
-                        logger.info("Some dropdown selections need to be updated")
+                        # If any selections need to be made, make them
+                        if needs_selection:
+                            logger.info("Some dropdown selections need to be updated")
                         
-                        # Select year if needed
-                        if current_selections.get('year') != year:
-                            year_selected = self._select_dropdown_option(driver, "year", year)
-                            if not year_selected:
-                                logger.warning(f"Standard selection failed for year: {year}. Trying forced selection...")
-                                year_selected = self._force_dropdown_selection(driver, "year", year)
+                            # Select year if needed
+                            if current_selections.get('year') != year:
+                                year_selected = self._select_dropdown_option(driver, "year", year)
                                 if not year_selected:
-                                    logger.error(f"Failed to select year: {year} after all attempts")
-                                    attempts += 1
-                                    continue
-                            time.sleep(2)
+                                    logger.warning(f"Standard selection failed for year: {year}. Trying forced selection...")
+                                    year_selected = self._force_dropdown_selection(driver, "year", year)
+                                    if not year_selected:
+                                        logger.error(f"Failed to select year: {year} after all attempts")
+                                        attempts += 1
+                                        continue
+                                self._wait_for_dropdown_options(driver, "district")
                         
-                        # Select district and verify it populated the taluka dropdown
-                        if current_selections.get('district') != district:
-                            district_selected = self._select_dropdown_option(driver, "district", district)
-                            if not district_selected:
-                                logger.warning(f"Standard selection failed for district: {district}. Trying forced selection...")
-                                district_selected = self._force_dropdown_selection(driver, "district", district)
+                            # Select district and verify it populated the taluka dropdown
+                            if current_selections.get('district') != district:
+                                district_selected = self._select_dropdown_option(driver, "district", district)
                                 if not district_selected:
-                                    logger.error(f"Failed to select district: {district} after all attempts")
-                                    attempts += 1
-                                    continue
-                            time.sleep(2)
+                                    logger.warning(f"Standard selection failed for district: {district}. Trying forced selection...")
+                                    district_selected = self._force_dropdown_selection(driver, "district", district)
+                                    if not district_selected:
+                                        logger.error(f"Failed to select district: {district} after all attempts")
+                                        attempts += 1
+                                        continue
                             
-                            # Verify district selection populated the taluka dropdown
-                            if not self._verify_dropdown_dependency(driver, "district", "taluka"):
-                                logger.warning("District selection did not populate taluka dropdown. Retrying...")
-                                # Try selecting district again
-                                if not self._select_dropdown_option(driver, "district", district):
-                                    logger.error(f"Failed to select district on retry: {district}")
-                                    attempts += 1
-                                    continue
-                                time.sleep(3)
-                                
-                                # Check again if taluka dropdown is populated
+                                # Verify district selection populated the taluka dropdown
                                 if not self._verify_dropdown_dependency(driver, "district", "taluka"):
-                                    logger.error("District selection failed to populate taluka dropdown after retry")
-                                    attempts += 1
-                                    continue
+                                    logger.warning("District selection did not populate taluka dropdown. Retrying...")
+                                    # Try selecting district again
+                                    if not self._select_dropdown_option(driver, "district", district):
+                                        logger.error(f"Failed to select district on retry: {district}")
+                                        attempts += 1
+                                        continue
+                                
+                                    # Check again if taluka dropdown is populated
+                                    if not self._verify_dropdown_dependency(driver, "district", "taluka"):
+                                        logger.error("District selection failed to populate taluka dropdown after retry")
+                                        attempts += 1
+                                        continue
                         
-                        # Select taluka and verify it populated the village dropdown
-                        if current_selections.get('taluka') != taluka:
-                            taluka_selected = self._select_dropdown_option(driver, "taluka", taluka)
-                            if not taluka_selected:
-                                logger.warning(f"Standard selection failed for taluka: {taluka}. Trying forced selection...")
-                                taluka_selected = self._force_dropdown_selection(driver, "taluka", taluka)
+                            # Select taluka and verify it populated the village dropdown
+                            if current_selections.get('taluka') != taluka:
+                                taluka_selected = self._select_dropdown_option(driver, "taluka", taluka)
                                 if not taluka_selected:
-                                    logger.error(f"Failed to select taluka: {taluka} after all attempts")
-                                    attempts += 1
-                                    continue
-                            time.sleep(2)
+                                    logger.warning(f"Standard selection failed for taluka: {taluka}. Trying forced selection...")
+                                    taluka_selected = self._force_dropdown_selection(driver, "taluka", taluka)
+                                    if not taluka_selected:
+                                        logger.error(f"Failed to select taluka: {taluka} after all attempts")
+                                        attempts += 1
+                                        continue
                             
-                            # Verify taluka selection populated the village dropdown
-                            if not self._verify_dropdown_dependency(driver, "taluka", "village"):
-                                logger.warning("Taluka selection did not populate village dropdown. Retrying...")
-                                # Try selecting taluka again
-                                if not self._select_dropdown_option(driver, "taluka", taluka):
-                                    logger.error(f"Failed to select taluka on retry: {taluka}")
-                                    attempts += 1
-                                    continue
-                                time.sleep(3)
-                                
-                                # Check again if village dropdown is populated
+                                # Verify taluka selection populated the village dropdown
                                 if not self._verify_dropdown_dependency(driver, "taluka", "village"):
-                                    logger.error("Taluka selection failed to populate village dropdown after retry")
-                                    attempts += 1
-                                    continue
+                                    logger.warning("Taluka selection did not populate village dropdown. Retrying...")
+                                    # Try selecting taluka again
+                                    if not self._select_dropdown_option(driver, "taluka", taluka):
+                                        logger.error(f"Failed to select taluka on retry: {taluka}")
+                                        attempts += 1
+                                        continue
+                                
+                                    # Check again if village dropdown is populated
+                                    if not self._verify_dropdown_dependency(driver, "taluka", "village"):
+                                        logger.error("Taluka selection failed to populate village dropdown after retry")
+                                        attempts += 1
+                                        continue
                         
-                        # Select village
-                        if current_selections.get('village') != village:
-                            village_selected = self._select_dropdown_option(driver, "village", village)
-                            if not village_selected:
-                                logger.warning(f"Standard selection failed for village: {village}. Trying forced selection...")
-                                village_selected = self._force_dropdown_selection(driver, "village", village)
+                            # Select village
+                            if current_selections.get('village') != village:
+                                village_selected = self._select_dropdown_option(driver, "village", village)
                                 if not village_selected:
-                                    logger.error(f"Failed to select village: {village} after all attempts")
-                                    attempts += 1
-                                    continue
-                            time.sleep(2)
-                    else:
-                        logger.info("All dropdown selections already match the desired values. Skipping selection steps.")
+                                    logger.warning(f"Standard selection failed for village: {village}. Trying forced selection...")
+                                    village_selected = self._force_dropdown_selection(driver, "village", village)
+                                    if not village_selected:
+                                        logger.error(f"Failed to select village: {village} after all attempts")
+                                        attempts += 1
+                                        continue
+                        else:
+                            logger.info("All dropdown selections already match the desired values. Skipping selection steps.")
                     
-                    # Enter document number in the field
-                    try:
-                        doc_input_selectors = [
-                            "//input[@id='doc_number']",
-                            "//input[contains(@id, 'doc') or contains(@name, 'doc')]",
-                            "//label[contains(text(), 'Doc') or contains(text(), 'Property') or contains(text(), 'Survey')]/following-sibling::input",
-                            "//label[contains(text(), 'Doc') or contains(text(), 'Property') or contains(text(), 'Survey')]/..//input"
-                        ]
+                        # Enter document number in the field
+                        try:
+                            doc_input = self._find_doc_input(driver)
                         
-                        doc_input = None
-                        for selector in doc_input_selectors:
-                            try:
-                                doc_input = WebDriverWait(driver, 5).until(
-                                    EC.presence_of_element_located((By.XPATH, selector))
-                                )
-                                if doc_input:
-                                    break
-                            except:
+                            if doc_input:
+                                doc_input.clear()
+                                if doc_number != self.WILDCARD_DOC_NUMBER:
+                                    doc_input.send_keys(str(doc_number))
+                                logger.info(f"Entered document number: {doc_number}")
+                            else:
+                                logger.error("Could not find document number input field")
+                                attempts += 1
                                 continue
-                        
-                        if doc_input:
-                            doc_input.clear()
-                            doc_input.send_keys(str(doc_number))
-                            logger.info(f"Entered document number: {doc_number}")
-                        else:
-                            logger.error("Could not find document number input field")
+                        except Exception as e:
+                            logger.error(f"Error entering document number: {str(e)}")
                             attempts += 1
                             continue
-                    except Exception as e:
-                        logger.error(f"Error entering document number: {str(e)}")
+                
+                # Skip combinations that are done or already being processed by another worker.
+                # A task continued from progress was already claimed above
+                if reserved_key is None:
+                    if not self._reserve_combination(year, district, taluka, village, doc_number):
+                        logger.debug("Skipping combination %s as it's completed or in progress.", combination_key)
                         attempts += 1
                         continue
+                    reserved_key = combination_key
                 
-                # Update current progress
-                self.progress['current'] = {
-                    'year': year,
-                    'district': district,
-                    'taluka': taluka,
-                    'village': village,
-                    'doc_number': doc_number
-                }
-                
-                self._save_progress()
-                
-                logger.info(f"Processing combination: {combination_key}")
-                success = self.process_combination(year, district, taluka, village, doc_number, driver)
-                
-                if not success:
-                    # If we hit the daily limit, exit
-                    if self._check_daily_limit():
-                        logger.info("Daily limit reached. Exiting.")
-                        driver.quit()
-                        return
+                try:
+                    # process_combination records the current task itself and logs it at INFO
+                    logger.debug("Processing combination: %s", combination_key)
+                    result = self.process_combination(year, district, taluka, village, doc_number, driver)
+                    
+                    # Back off on the same browser when rate limited and only start
+                    # a new session (once) when the current one is broken
+                    rate_limit_retries = 0
+                    session_reset = False
+                    while not self._check_daily_limit() and (
+                            (result == self.RESULT_RATE_LIMITED and rate_limit_retries < self.MAX_RATE_LIMIT_RETRIES)
+                            or (result == self.RESULT_SESSION_EXPIRED and not session_reset)):
+                        if result == self.RESULT_RATE_LIMITED:
+                            rate_limit_retries += 1
+                            # Jitter the exponential back-off so workers limited at the same time
+                            # do not all retry at the same moment
+                            backoff = min(60, 2 ** rate_limit_retries)
+                            backoff = backoff / 2 + random.uniform(0, backoff / 2)
+                            logger.info(f"Rate limited. Retrying in {backoff:.1f}s...")
+                            time.sleep(backoff)
+                            try:
+                                driver.get(self.base_url)
+                            except WebDriverException as e:
+                                # Handled like an expired session: one retry on a new session
+                                logger.warning(f"Could not reload the start page after rate limiting: {str(e)}")
+                                result = self.RESULT_SESSION_EXPIRED
+                                continue
+                        else:
+                            session_reset = True
+                            logger.info("Retrying with a new session...")
+                            driver = self._ensure_driver(driver)
+                            self.rate_limiter.wait()
+                            self._reset_session(driver)
+                        result = self.process_combination(year, district, taluka, village, doc_number, driver)
                     
-                    # Otherwise, retry with a new session
-                    logger.info("Retrying with a new session...")
-                    self._reset_session()
-                    success = self.process_combination(year, district, taluka, village, doc_number, driver)
+                    # If we hit the daily limit, exit
+                    if result == self.RESULT_DAILY_LIMIT or (result != self.RESULT_OK and self._check_daily_limit()):
+                        raise DailyLimitReached()
                     
-                    if not success:
+                    if result == self.RESULT_FAILED:
+                        logger.error(f"Combination {combination_key} cannot be processed. Skipping.")
+                    elif result != self.RESULT_OK:
                         logger.error(f"Failed to process combination {combination_key} after retry. Skipping.")
+                    success = result == self.RESULT_OK
+                finally:
+                    self._release_combination(combination_key)
+                    reserved_key = None
                 
                 if success:
                     processed_count += 1
@@ -3360,44 +4798,32 @@ class PropertyScraper:
             if processed_count < num_combinations:
                 logger.warning(f"Could only process {processed_count} combinations after {attempts} attempts")
         
+        except DailyLimitReached:
+            # The browser is closed once, in the finally below
+            logger.info("Daily limit reached. Exiting.")
         except Exception as e:
             logger.error(f"Error in main run loop: {str(e)}")
             raise Exception(f"Browser automation failed: {str(e)}")
         finally:
-            try:
-                driver.quit()
-            except Exception:
-                pass
+            if reserved_key is not None:
+                self._release_combination(reserved_key)
+            self._quit_driver(driver)
             
-        logger.info("Property scraper completed.")
+            self._flush_progress()
 
 if __name__ == "__main__":
     # Create directories if they don't exist
     os.makedirs('logs', exist_ok=True)
     os.makedirs('downloads', exist_ok=True)
     
-    # Configure logging with UTF-8 encoding
-    import io
-    import sys
     import argparse
     
     # Parse command-line arguments
     parser = argparse.ArgumentParser(description='Property Scraper')
     args = parser.parse_args()
     
-    # Create a UTF-8 encoded stream for console output
-    utf8_stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
-    
-    # Configure logging
-    log_file = os.path.join('logs', f'scraper_{datetime.now().strftime("%Y%m%d_%H%M%S")}.log')
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(log_file, encoding='utf-8'),
-            logging.StreamHandler(utf8_stdout)
-        ]
-    )
+    # Logging is already set up at import: records go through log_queue to the background
+    # log_listener, so the workers never write to the log file themselves
     
     # Run the scraper
     scraper = PropertyScraper()
@@ -0,0 +1,78 @@
+import time
+import random
+import threading
+import logging
+
+logger = logging.getLogger('property_scraper')
+
+class RateLimiter:
+    def __init__(self, min_delay_ms, max_delay_ms):
+        """Initialize the rate limiter with the minimum and maximum delay between calls in milliseconds."""
+        self.min_delay = min_delay_ms / 1000.0
+        self.max_delay = max_delay_ms / 1000.0
+        self._last_call = float('-inf')
+        self._lock = threading.Lock()
+    
+    @classmethod
+    def from_config(cls, rate_limits, url, default_delay_ms):
+        """
+        Create a rate limiter for a site from the 'rate_limits' config entries.
+        
+        Args:
+            rate_limits: List of {"name", "mindelay", "maxdelay"} entries, delays in milliseconds
+            url: URL of the site being scraped; the entry whose name appears in it is used
+            default_delay_ms: (min, max) delay used when no entry matches
+            
+        Returns:
+            RateLimiter instance
+        """
+        for entry in rate_limits:
+            if entry.get('name') and entry['name'] in url:
+                logger.info(f"Using rate limit for {entry['name']}: {entry.get('mindelay')}-{entry.get('maxdelay')} ms")
+                return cls(entry.get('mindelay', default_delay_ms[0]), entry.get('maxdelay', default_delay_ms[1]))
+        return cls(*default_delay_ms)
+    
+    def wait(self):
+        """Sleep until a random delay between the minimum and maximum has passed since the last call."""
+        with self._lock:
+            delay = random.uniform(self.min_delay, self.max_delay)
+            remaining = delay - (time.monotonic() - self._last_call)
+            if remaining > 0:
+                logger.info(f"Waiting {remaining:.2f} seconds before next request...")
+                time.sleep(remaining)
+            self._last_call = time.monotonic()
+
+
+class AdaptiveRateLimiter:
+    def __init__(self, rate, min_rate=0.5):
+        """Initialize the rate limiter with the maximum and minimum number of calls per second."""
+        self.max_rate = rate
+        self.min_rate = min_rate
+        self.rate = rate
+        self._next_call = float('-inf')
+        self._lock = threading.Lock()
+    
+    def wait(self):
+        """
+        Sleep until the next call is allowed at the current rate.
+        
+        Callers reserve their slot under the lock and sleep outside it, so concurrent callers are
+        spaced out instead of waiting for each other's sleeps.
+        """
+        with self._lock:
+            now = time.monotonic()
+            delay = self._next_call - now
+            self._next_call = max(now, self._next_call) + 1.0 / self.rate
+        if delay > 0:
+            time.sleep(delay)
+    
+    def throttled(self):
+        """Halve the rate after the server pushed back, e.g. with a 429 or 503 response."""
+        with self._lock:
+            self.rate = max(self.min_rate, self.rate / 2)
+            logger.warning(f"Server is throttling, slowing down to {self.rate:.2f} requests per second")
+    
+    def succeeded(self):
+        """Raise the rate by 10% after a successful call, up to the maximum."""
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate * 1.1)
@@ -1,12 +1,12 @@
 import os
 import sys
-import time
 import json
 import random
 import logging
 import argparse
-import subprocess
-from datetime import datetime, timedelta
+import signal
+import threading
+from datetime import datetime
 import schedule
 
 # Configure logging
@@ -20,12 +20,19 @@ logging.basicConfig(
 )
 logger = logging.getLogger('scheduler')
 
+# Seconds a scraper that was asked to stop gets to finish the combinations in progress
+STOP_GRACE_SECONDS = 120
+
 class ScraperScheduler:
     def __init__(self, config_path='scheduler_config.json'):
         """Initialize the scheduler with configuration."""
         self.config_path = config_path
         self.load_config()
         
+        # Scraper config from config.json, parsed again only when the file changes
+        self._main_config = None
+        self._main_config_mtime = None
+        
         # Create directories if they don't exist
         os.makedirs('logs', exist_ok=True)
         os.makedirs('downloads', exist_ok=True)
@@ -46,8 +53,7 @@ class ScraperScheduler:
                     {"time": "00:00", "proxy_index": 1, "user_agent_index": 4}
                 ],
                 "random_delay_minutes": [0, 30],  # Random delay between 0-30 minutes
-                "max_runtime_minutes": 60,  # Maximum runtime for each session
-                "python_executable": "python"
+                "max_runtime_minutes": 60  # Maximum runtime for each session
             }
             self.save_config()
     
@@ -56,14 +62,21 @@ class ScraperScheduler:
         with open(self.config_path, 'w') as f:
             json.dump(self.config, f, indent=4)
     
+    def _load_main_config(self):
+        """Return the scraper config from config.json, reusing the parsed copy while the file is unchanged."""
+        mtime = os.stat('config.json').st_mtime
+        if mtime != self._main_config_mtime:
+            with open('config.json', 'r') as f:
+                self._main_config = json.load(f)
+            self._main_config_mtime = mtime
+        return self._main_config
+    
     def run_scraper(self, proxy_index, user_agent_index):
         """Run the scraper with specific proxy and user agent."""
         try:
-            # Load the main config
-            with open('config.json', 'r') as f:
-                main_config = json.load(f)
+            main_config = self._load_main_config()
             
-            # Create a temporary config with selected proxy and user agent
+            # Copy the config, narrowed to the selected proxy and user agent
             temp_config = main_config.copy()
             
             if proxy_index is not None and main_config.get('proxies') and len(main_config['proxies']) > proxy_index:
@@ -72,59 +85,54 @@ class ScraperScheduler:
             if user_agent_index is not None and main_config.get('user_agents') and len(main_config['user_agents']) > user_agent_index:
                 temp_config['user_agents'] = [main_config['user_agents'][user_agent_index]]
             
-            # Write temporary config
-            temp_config_path = 'temp_config.json'
-            with open(temp_config_path, 'w') as f:
-                json.dump(temp_config, f, indent=4)
+            # Run the scraper in this process, so a scheduled run does not pay for starting
+            # another interpreter and importing Selenium again. Importing the module opens its
+            # own scraper_*.log and starts its log listener, so that waits for the first run
+            from property_scraper import PropertyScraper
             
-            # Run the scraper with the temporary config
             logger.info(f"Starting scraper with proxy index {proxy_index} and user agent index {user_agent_index}")
+            scraper = PropertyScraper(config=temp_config)
+            errors = []
             
-            # Set environment variable to use the temporary config
-            env = os.environ.copy()
-            env['SCRAPER_CONFIG'] = temp_config_path
-            
-            # Start the scraper process
-            process = subprocess.Popen(
-                [self.config['python_executable'], 'property_scraper.py'],
-                env=env,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
-            )
+            def run():
+                try:
+                    scraper.run()
+                except Exception as e:
+                    errors.append(e)
             
-            # Set a timeout for the process
-            start_time = datetime.now()
-            max_runtime = timedelta(minutes=self.config['max_runtime_minutes'])
+            thread = threading.Thread(target=run, name='scraper', daemon=True)
+            thread.start()
+            thread.join(timeout=self.config['max_runtime_minutes'] * 60)
             
-            while process.poll() is None:
-                # Check if we've exceeded the maximum runtime
-                if datetime.now() - start_time > max_runtime:
-                    logger.warning(f"Scraper exceeded maximum runtime of {self.config['max_runtime_minutes']} minutes. Terminating.")
-                    process.terminate()
-                    break
-                
-                # Sleep for a bit to avoid high CPU usage
-                time.sleep(5)
+            if thread.is_alive():
+                logger.warning(f"Scraper exceeded maximum runtime of {self.config['max_runtime_minutes']} minutes. Stopping.")
+                scraper.stop()
+                thread.join(timeout=STOP_GRACE_SECONDS)
             
-            # Get the output
-            stdout, stderr = process.communicate()
+            if thread.is_alive():
+                # A worker is stuck in a WebDriver call; closing its browser makes the call fail
+                logger.warning(f"Scraper did not stop within {STOP_GRACE_SECONDS} seconds. Closing its browsers.")
+                scraper.quit_drivers()
+                thread.join(timeout=STOP_GRACE_SECONDS)
+                if thread.is_alive():
+                    logger.error("Scraper thread is still running. Leaving it behind and moving on.")
+                    return
             
-            if process.returncode != 0:
-                logger.error(f"Scraper exited with code {process.returncode}")
-                logger.error(f"Stderr: {stderr}")
+            if errors:
+                logger.error(f"Scraper failed: {str(errors[0])}")
             else:
                 logger.info("Scraper completed successfully")
-            
-            # Clean up
-            if os.path.exists(temp_config_path):
-                os.remove(temp_config_path)
                 
         except Exception as e:
             logger.error(f"Error running scraper: {str(e)}")
     
     def schedule_job(self, schedule_config):
-        """Schedule a job with the given configuration."""
+        """
+        Run a scheduled job with the given configuration.
+        
+        With a random delay configured, the run is scheduled as a one-off job that many minutes
+        from now, so the scheduler is not blocked and other jobs still start on time.
+        """
         proxy_index = schedule_config.get('proxy_index')
         user_agent_index = schedule_config.get('user_agent_index')
         
@@ -132,8 +140,15 @@ class ScraperScheduler:
         if self.config.get('random_delay_minutes'):
             min_delay, max_delay = self.config['random_delay_minutes']
             delay_minutes = random.randint(min_delay, max_delay)
-            logger.info(f"Adding random delay of {delay_minutes} minutes")
-            time.sleep(delay_minutes * 60)
+            if delay_minutes > 0:
+                logger.info(f"Adding random delay of {delay_minutes} minutes")
+                
+                def delayed_run():
+                    self.run_scraper(proxy_index, user_agent_index)
+                    return schedule.CancelJob
+                
+                schedule.every(delay_minutes).minutes.do(delayed_run)
+                return
         
         # Run the scraper
         self.run_scraper(proxy_index, user_agent_index)
@@ -157,15 +172,25 @@ class ScraperScheduler:
         self.run_scraper(proxy_index, user_agent_index)
     
     def run_scheduler(self):
-        """Run the scheduler continuously."""
+        """Run the scheduler continuously, sleeping until the next job is due."""
         self.setup_schedules()
         
         logger.info("Scheduler started. Press Ctrl+C to exit.")
         
+        # SIGTERM ends the wait right away instead of after the next job
+        stop = threading.Event()
+        signal.signal(signal.SIGTERM, lambda signum, frame: stop.set())
+        
         try:
-            while True:
+            while not stop.is_set():
+                idle_seconds = schedule.idle_seconds()
+                if idle_seconds is None:
+                    # No jobs scheduled
+                    idle_seconds = 3600
+                if idle_seconds > 0 and stop.wait(idle_seconds):
+                    break
                 schedule.run_pending()
-                time.sleep(60)  # Check every minute
+            logger.info("Scheduler stopped.")
         except KeyboardInterrupt:
             logger.info("Scheduler stopped by user.")
 